@@ -34,6 +34,7 @@ from camply.providers import (
     RecreationDotGov,
 )
 from camply.search import CAMPSITE_SEARCH_PROVIDER, BaseCampingSearch
+from camply.search.search_daemon import SearchDaemon
 from camply.utils import configure_camply, log_camply, make_list, yaml_utils
 from camply.utils.general_utils import days_of_the_week_mapping, handle_search_windows
 from camply.utils.logging_utils import log_sorted_response
@@ -482,10 +483,28 @@ offline_search_path_argument = click.option(
     default=None,
     type=click.Path(dir_okay=False),
     help="Enables offline search. This is the name of the file to be saved/loaded. "
-    "Campsites can be saved as a serialized pickle file or "
-    "a JSON file, depending on the file extension. When not specified, "
+    "Campsites can be saved as a serialized pickle file, a JSON file, "
+    "an append-only JSON Lines file or a SQLite database, depending on the "
+    "file extension. When not specified, "
     "the filename will default to `camply_campsites.json`",
 )
+workers_argument = click.option(
+    "--workers",
+    default=None,
+    type=click.INT,
+    help="Number of concurrent requests to make while searching for availability. "
+    f"Defaults to {SearchConfig.DEFAULT_WORKERS} (searching serially), cannot be "
+    f"more than {SearchConfig.MAXIMUM_WORKERS}.",
+)
+requests_per_hour_argument = click.option(
+    "--requests-per-hour",
+    default=None,
+    type=click.FLOAT,
+    help="Used with continuous searching. The most availability requests to make per "
+    "hour. Campgrounds whose availability keeps changing are searched more often and "
+    "the rest are backed off, within this budget. Defaults to the "
+    "`POLLING_REQUESTS_PER_HOUR` environment variable, unlimited when it isn't set.",
+)
 day_of_the_week_argument = click.option(
     "--day",
     multiple=True,
@@ -620,6 +639,8 @@ def _get_provider_kwargs_from_cli(
     equipment: Tuple[Union[str, int]],
     equipment_id: Tuple[Union[str, int]],
     day: Optional[Tuple[str]],
+    workers: Optional[int] = None,
+    requests_per_hour: Optional[float] = None,
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
     Get Provider kwargs from CLI
@@ -667,6 +688,7 @@ def _get_provider_kwargs_from_cli(
         "equipment": equipment,
         "equipment_id": equipment_id,
         "days_of_the_week": days_of_the_week,
+        "workers": workers,
     }
     search_kwargs = {
         "log": True,
@@ -677,6 +699,7 @@ def _get_provider_kwargs_from_cli(
         "notification_provider": notifications,
         "search_forever": search_forever,
         "search_once": search_once,
+        "requests_per_hour": requests_per_hour,
     }
     return provider_kwargs, search_kwargs
 
@@ -701,6 +724,8 @@ def _get_provider_kwargs_from_cli(
 @notify_first_try_argument
 @equipment_argument
 @equipment_id_argument
+@workers_argument
+@requests_per_hour_argument
 @provider_argument
 @debug_option
 @click.pass_obj
@@ -727,6 +752,8 @@ def campsites(
     equipment: Tuple[Union[str, int]],
     equipment_id: Tuple[Union[str, int]],
     day: Optional[Tuple[str]],
+    workers: Optional[int],
+    requests_per_hour: Optional[float],
 ) -> None:
     """
     Find Available Campsites with Custom Search Criteria
@@ -769,12 +796,62 @@ def campsites(
             equipment_id=equipment_id,
             day=day,
             yaml_config=yaml_config,
+            workers=workers,
+            requests_per_hour=requests_per_hour,
         )
     provider_class: Type[BaseCampingSearch] = CAMPSITE_SEARCH_PROVIDER[provider]
     camping_finder: BaseCampingSearch = provider_class(**provider_kwargs)
     camping_finder.get_matching_campsites(**search_kwargs)
 
 
+@camply_command_line.command(cls=RichCommand)
+@click.argument(
+    "directory",
+    type=click.Path(exists=True, file_okay=False, resolve_path=True),
+)
+@click.option(
+    "--workers",
+    default=None,
+    type=click.INT,
+    help="Number of due searches to poll concurrently. "
+    f"Defaults to {SearchConfig.DEFAULT_WORKERS}, cannot be "
+    f"more than {SearchConfig.MAXIMUM_WORKERS}.",
+)
+@click.option(
+    "--requests-per-hour",
+    default=None,
+    type=click.FLOAT,
+    help="The most availability requests all searches together may make per hour. "
+    "Defaults to the `POLLING_REQUESTS_PER_HOUR` environment variable, unlimited "
+    "when it isn't set.",
+)
+@debug_option
+@click.pass_obj
+def daemon(
+    context: CamplyContext,
+    debug: bool,
+    directory: str,
+    workers: Optional[int],
+    requests_per_hour: Optional[float],
+) -> None:
+    """
+    Run a Directory of YAML Searches in a Single Process
+
+    Every `.yaml` / `.yml` search configuration in DIRECTORY is loaded and run
+    on one scheduler. Searches of the same provider share their sessions,
+    rate limits and metadata caches, while each search keeps its own
+    notifications and never notifies about the same campsite twice. Searches
+    are polled adaptively, sharing a single hourly request budget.
+    """
+    if context.debug is None:
+        context.debug = debug
+        _set_up_debug(debug=context.debug)
+    search_daemon = SearchDaemon.from_directory(
+        directory=directory, workers=workers, requests_per_hour=requests_per_hour
+    )
+    search_daemon.run()
+
+
 @camply_command_line.command(cls=RichCommand)
 @debug_option
 @click.pass_obj
@@ -32,6 +32,15 @@ class APIConfig:
     RETRY_MAX_API_TIMEOUT: int = (
         6000  # Max Timeout in Seconds of Retrying (100 Minutes)
     )
+    RATE_LIMIT_CALLS: float = 5  # Requests per Second, per Host
+    RATE_LIMIT_BURST: int = 5  # Requests Allowed at Once, per Host
+    RATE_LIMIT_BACKOFF: float = 10  # Seconds to Pause a Rate Limited Host
+    RATE_LIMIT_MAX_BACKOFF: float = 300  # Max Seconds to Honor a Retry-After
+    RELEASE_TIMES: Tuple[str, ...] = ()  # Daily "HH:MM" Inventory Releases
+    RELEASE_TIMEZONE: str = "UTC"
+    JSON_DECODER: str = getenv(
+        "CAMPLY_JSON_DECODER", "auto"
+    )  # auto|orjson|msgspec|json
 
 
 class RIDBConfig(APIConfig):
@@ -94,7 +103,17 @@ class RecreationBookingConfig(APIConfig):
 
     CAMPSITE_BOOKING_URL: str = "https://www.recreation.gov/camping/campsites"
 
-    RATE_LIMITING = (1.01, 1.51)
+    RATE_LIMIT_CALLS: float = 3
+    RATE_LIMIT_BURST: int = 3
+    RELEASE_TIMES: Tuple[str, ...] = ("10:00",)
+    RELEASE_TIMEZONE: str = "America/New_York"
+
+    POOL_CONNECTIONS: int = 4  # Number of Hosts to Keep Connection Pools For
+    POOL_SIZE: int = int(getenv("CAMPLY_RECDOTGOV_POOL_SIZE", "16"))  # Per Host
+    BLOCKED_STATUS_CODES: Tuple[int, ...] = (403, 429)
+
+    METADATA_CACHE_VERSION: int = 1  # Bump When Campsite Metadata Changes Shape
+    METADATA_CACHE_TTL: int = 60 * 60 * 24  # 1 Day
 
 
 class UseDirectConfig(APIConfig):
@@ -113,6 +132,21 @@ class UseDirectConfig(APIConfig):
     AVAILABILITY_ENDPOINT = f"{RDR_PREFIX}/{SEARCH_PREFIX}/grid"
     DATE_FORMAT = "%m-%d-%Y"
 
+    RATE_LIMIT_CALLS: float = 1
+    RATE_LIMIT_BURST: int = 1
+
+    POOL_SIZE: int = int(getenv("CAMPLY_USEDIRECT_POOL_SIZE", "4"))  # Per Tenant
+    MAX_GRID_DAYS: int = 31  # Longest Date Range of a Single Grid Request
+
+
+class GoingToCampConfig(APIConfig):
+    """
+    GoingToCamp API Configuration
+    """
+
+    SITE_DETAILS_CACHE_VERSION: int = 1  # Bump When Site Details Change Shape
+    SITE_DETAILS_CACHE_TTL: int = 60 * 60 * 24 * 7  # 1 Week
+
 
 class YellowstoneConfig(DataColumns, APIConfig):
     """
@@ -166,6 +200,10 @@ class YellowstoneConfig(DataColumns, APIConfig):
 
     MINIMUM_POLLING_INTERVAL: int = 45
 
+    POOL_SIZE: int = int(getenv("CAMPLY_YELLOWSTONE_POOL_SIZE", "5"))  # Per Host
+    PROPERTY_INFO_CACHE_VERSION: int = 1  # Bump When Property Info Changes Shape
+    PROPERTY_INFO_CACHE_TTL: int = 60 * 60 * 24  # 1 Day
+
     WEBUI_ALIAS_ENDPOINT: str = "yellowstonenationalparklodges.com"
     WEBUI_BASE_ENDPOINT: str = "secure.yellowstonenationalparklodges.com"
     WEBUI_BOOKING_PATH: str = "booking/lodging-select"
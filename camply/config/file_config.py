@@ -84,3 +84,6 @@ class FileConfig:
     PROVIDERS_DIRECTORY = CAMPLY_DIRECTORY.joinpath("providers")
     RESERVE_CALIFORNIA_PROVIDER = PROVIDERS_DIRECTORY.joinpath("reserve_california")
     USEDIRECT_PROVIDER = PROVIDERS_DIRECTORY.joinpath("usedirect")
+    RECREATION_DOT_GOV_PROVIDER = PROVIDERS_DIRECTORY.joinpath("recreation_dot_gov")
+    GOING_TO_CAMP_PROVIDER = PROVIDERS_DIRECTORY.joinpath("going_to_camp")
+    XANTERRA_PROVIDER = PROVIDERS_DIRECTORY.joinpath("xanterra")
@@ -4,7 +4,8 @@ Project Configuration for Yellowstone Variables
 
 from collections import OrderedDict
 from enum import Enum
-from typing import Dict
+from os import getenv
+from typing import Dict, Optional, Tuple
 
 
 class SearchConfig:
@@ -14,9 +15,30 @@ class SearchConfig:
 
     POLLING_INTERVAL_MINIMUM: int = 5  # 5 MINUTES
     RECOMMENDED_POLLING_INTERVAL: int = 10  # 10 MINUTES
+    POLLING_REQUESTS_PER_HOUR: Optional[float] = (
+        float(getenv("POLLING_REQUESTS_PER_HOUR"))
+        if getenv("POLLING_REQUESTS_PER_HOUR")
+        else None
+    )  # UNLIMITED BY DEFAULT
+    POLLING_CHANGE_DECAY: float = 0.3  # WEIGHT OF THE LATEST POLL IN A CHANGE RATE
+    POLLING_HOT_SPEEDUP: float = 0.5  # ALWAYS CHANGING SEARCHES POLL 2X AS OFTEN
+    POLLING_BACKOFF_RATE: float = 1.25  # PER POLL WITHOUT ANY CHANGES
+    POLLING_BACKOFF_MAXIMUM: float = 4.0  # DEAD SEARCHES POLL UP TO 4X LESS OFTEN
+    POLLING_PROXIMITY_FACTORS: Tuple[Tuple[int, float], ...] = (
+        (3, 0.5),  # STAYS WITHIN 3 DAYS POLL 2X AS OFTEN
+        (14, 0.75),
+        (120, 1.0),
+    )
+    POLLING_DISTANT_STAY_FACTOR: float = 1.5
+    POLLING_RELEASE_DELAY: int = 30  # SECONDS AFTER A RELEASE TO POLL
     ERROR_MESSAGE: str = "No search days configured. Exiting"
     MINIMUM_CAMPSITES_FIRST_NOTIFY: int = 5
     MAXIMUM_NOTIFICATION_BATCH_SIZE: int = 20
+    DEFAULT_WORKERS: int = 1  # SERIAL SEARCHING
+    MAXIMUM_WORKERS: int = 16
+    OFFLINE_COMPACTION_RATIO: float = 0.25  # SHARE OF STALE LINES BEFORE COMPACTING
+    OFFLINE_SQLITE_TIMEOUT: float = 30.0  # SECONDS TO WAIT ON ANOTHER SEARCH'S WRITE
+    OFFLINE_SQLITE_BATCH_SIZE: int = 500  # KEYS PER LOOKUP QUERY
 
 
 class EquipmentOptions(str, Enum):
@@ -2,7 +2,10 @@
 camply Data Storage Objects
 """
 
+from .availability_batch import AvailabilityBatch, AvailabilitySnapshot
+from .availability_filter import AvailabilityFilter
 from .base_container import CamplyModel
+from .campsite_record import CampsiteRecord
 from .data_containers import (
     AvailableCampsite,
     AvailableResource,
@@ -12,7 +15,11 @@ from .data_containers import (
 )
 
 __all__ = [
+    "AvailabilityBatch",
+    "AvailabilityFilter",
+    "AvailabilitySnapshot",
     "CamplyModel",
+    "CampsiteRecord",
     "AvailableCampsite",
     "AvailableResource",
     "CampgroundFacility",
@@ -5,6 +5,7 @@ These are JSON Responses from APIs
 """
 
 import datetime
+from functools import lru_cache
 from typing import Any, Dict, Iterator, List, Optional, Union
 
 from pydantic import validator
@@ -186,6 +187,26 @@ class AwareDatetime(datetime.datetime):
             raise ValueError("You Must Provide a Parsable Datetime String or Object")
 
 
+@lru_cache(maxsize=4096)
+def parse_unaware_datetime(value: str) -> datetime.datetime:
+    """
+    Parse an Availability Timestamp, Memoized
+
+    Every campsite of a month's payload shares the same timestamps.
+
+    Parameters
+    ----------
+    value: str
+
+    Returns
+    -------
+    datetime.datetime
+    """
+    if value.__class__ is not str:
+        raise TypeError("Availability timestamps must be strings")
+    return UnawareDatetime.validate(value)
+
+
 class _CampsiteAvailabilityCampsiteResponse(CamplyModel):
     """
     https://ridb.recreation.gov/api/v1/campsites/<CAMPSITE ID>
@@ -199,6 +220,19 @@ class _CampsiteAvailabilityCampsiteResponse(CamplyModel):
     type_of_use: Optional[str]
     site: str = RecreationBookingConfig.CAMPSITE_LOCATION_SITE_DEFAULT
 
+    @classmethod
+    def _construct_payload(
+        cls, payload: Dict[str, Any], **values: Any
+    ) -> "_CampsiteAvailabilityCampsiteResponse":
+        """
+        Build the Campsite With Memoized Timestamp Parsing
+        """
+        values["availabilities"] = {
+            parse_unaware_datetime(timestamp): status.strip()
+            for timestamp, status in payload.get("availabilities", {}).items()
+        }
+        return super()._construct_payload(payload=payload, **values)
+
 
 class CampsiteAvailabilityResponse(CamplyModel):
     """
@@ -207,6 +241,27 @@ class CampsiteAvailabilityResponse(CamplyModel):
 
     campsites: Dict[int, _CampsiteAvailabilityCampsiteResponse]
 
+    @classmethod
+    def _construct_payload(
+        cls, payload: Dict[str, Any], **values: Any
+    ) -> "CampsiteAvailabilityResponse":
+        """
+        Build Each Campsite Without Validation
+        """
+        campsites = {}
+        for campsite_id, campsite in payload["campsites"].items():
+            if campsite_id.__class__ is str and campsite_id.isdecimal():
+                campsite_id = int(campsite_id)
+            elif campsite_id.__class__ is not int:
+                raise TypeError("Campsite IDs must be integers")
+            campsites[
+                campsite_id
+            ] = _CampsiteAvailabilityCampsiteResponse._construct_payload(
+                payload=campsite
+            )
+        values["campsites"] = campsites
+        return super()._construct_payload(payload=payload, **values)
+
 
 class _TourMonthlyAvailabilityTourResponse(CamplyModel):
     """
@@ -0,0 +1,328 @@
+"""
+Columnar Campsite Availability Storage
+"""
+
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from pandas import DataFrame
+
+from camply.containers.campsite_record import construct_campsite
+from camply.containers.data_containers import AvailableCampsite
+
+
+class AvailabilityBatch:
+    """
+    Column Oriented Batch of Campsite Availabilities
+
+    Providers append availabilities to the batch as plain values, one list per
+    `AvailableCampsite` field, instead of creating a pydantic model per night.
+    The batch becomes a DataFrame for filtering and consolidation and only the
+    rows that survive are turned into `AvailableCampsite` objects. Values are
+    stored the way `AvailableCampsite.dict()` would hold them, except that
+    nested models may also be model instances shared between nights, and
+    identifiers are coerced the same way pydantic coerces `Union[int, str]`.
+    """
+
+    __columns__: Tuple[str, ...] = tuple(AvailableCampsite.__fields__)
+    __identifiers__: Tuple[str, ...] = (
+        "campsite_id",
+        "recreation_area_id",
+        "facility_id",
+    )
+
+    def __init__(self) -> None:
+        """
+        Empty Batch Initialization
+        """
+        self._columns: Dict[str, List[Any]] = {
+            column: [] for column in self.__columns__
+        }
+
+    def __len__(self) -> int:
+        """
+        Number of Availabilities in the Batch
+
+        Returns
+        -------
+        int
+        """
+        return len(self._columns[self.__columns__[0]])
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+
+        Returns
+        -------
+        str
+        """
+        return f"<{self.__class__.__name__}: {len(self)} availabilities>"
+
+    @staticmethod
+    def _coerce_identifier(value: Any) -> Union[int, str, None]:
+        """
+        Coerce an Identifier Like a `Union[int, str]` Pydantic Field
+
+        Parameters
+        ----------
+        value: Any
+
+        Returns
+        -------
+        Union[int, str, None]
+        """
+        if value is None or isinstance(value, int):
+            return value
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return str(value)
+
+    def append(self, **fields: Any) -> None:
+        """
+        Add a Single Availability to the Batch
+
+        Parameters
+        ----------
+        **fields: Any
+            `AvailableCampsite` field values, missing fields are stored as None
+        """
+        unknown_fields = fields.keys() - self._columns.keys()
+        if unknown_fields:
+            raise TypeError(
+                f"Unknown AvailableCampsite fields: {', '.join(sorted(unknown_fields))}"
+            )
+        for identifier in self.__identifiers__:
+            fields[identifier] = self._coerce_identifier(fields.get(identifier))
+        for column, values in self._columns.items():
+            values.append(fields.get(column))
+
+    def extend(self, other: "AvailabilityBatch") -> None:
+        """
+        Add Every Availability of Another Batch to this Batch
+
+        Parameters
+        ----------
+        other: AvailabilityBatch
+        """
+        for column, values in self._columns.items():
+            values.extend(other._columns[column])
+
+    def select(self, mask: Sequence[bool]) -> "AvailabilityBatch":
+        """
+        Get a New Batch with Only the Masked Availabilities
+
+        Parameters
+        ----------
+        mask: Sequence[bool]
+            One boolean per availability
+
+        Returns
+        -------
+        AvailabilityBatch
+        """
+        selected = self.__class__()
+        for column, values in self._columns.items():
+            selected._columns[column] = [
+                value for value, keep in zip(values, mask) if keep
+            ]
+        return selected
+
+    def get_column(self, column: str) -> List[Any]:
+        """
+        Get the Values of a Single Field
+
+        Parameters
+        ----------
+        column: str
+
+        Returns
+        -------
+        List[Any]
+        """
+        return self._columns[column]
+
+    @classmethod
+    def concat(cls, batches: Iterable["AvailabilityBatch"]) -> "AvailabilityBatch":
+        """
+        Combine Batches, in Order, into a Single Batch
+
+        Parameters
+        ----------
+        batches: Iterable[AvailabilityBatch]
+
+        Returns
+        -------
+        AvailabilityBatch
+        """
+        combined = cls()
+        for batch in batches:
+            combined.extend(batch)
+        return combined
+
+    @classmethod
+    def from_fields(cls, rows: Iterable[Dict[str, Any]]) -> "AvailabilityBatch":
+        """
+        Create a Batch by Consuming a Stream of Availabilities
+
+        Parameters
+        ----------
+        rows: Iterable[Dict[str, Any]]
+            `AvailableCampsite` field values of each availability, typically
+            a provider's parsing generator
+
+        Returns
+        -------
+        AvailabilityBatch
+        """
+        batch = cls()
+        for fields in rows:
+            batch.append(**fields)
+        return batch
+
+    @classmethod
+    def from_campsites(
+        cls, campsites: Iterable[AvailableCampsite]
+    ) -> "AvailabilityBatch":
+        """
+        Create a Batch from Existing AvailableCampsite Objects
+
+        Parameters
+        ----------
+        campsites: Iterable[AvailableCampsite]
+
+        Returns
+        -------
+        AvailabilityBatch
+        """
+        batch = cls()
+        for campsite in campsites:
+            for column, value in campsite.dict().items():
+                batch._columns[column].append(value)
+        return batch
+
+    def to_df(self) -> DataFrame:
+        """
+        Convert the Batch to a DataFrame
+
+        Returns
+        -------
+        DataFrame
+            One column per `AvailableCampsite` field, like
+            `BaseCampingSearch.campsites_to_df`
+        """
+        return DataFrame(data=self._columns, columns=self.__columns__)
+
+    def to_campsites(self) -> List[AvailableCampsite]:
+        """
+        Convert Every Availability in the Batch to an AvailableCampsite
+
+        Batches only hold provider parsed values, so they aren't validated
+        again.
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
+        return [
+            construct_campsite(fields=dict(zip(self.__columns__, row)))
+            for row in zip(*self._columns.values())
+        ]
+
+
+class AvailabilitySnapshot:
+    """
+    Processed Availability of a Single Payload
+
+    A snapshot keeps the payload it was processed from next to the resulting
+    batch, so the next payload of the same facility and month can be processed
+    incrementally: an identical payload reuses the whole snapshot, and a
+    changed one only reprocesses the parts, typically campsites, whose raw
+    availability changed.
+    """
+
+    def __init__(
+        self,
+        payload: Any,
+        batch: AvailabilityBatch,
+        parts: Optional[Dict[Hashable, Tuple[Any, AvailabilityBatch]]] = None,
+    ) -> None:
+        """
+        Snapshot Initialization
+
+        Parameters
+        ----------
+        payload: Any
+            Parsed API response the snapshot was processed from
+        batch: AvailabilityBatch
+            Every availability of the payload
+        parts: Optional[Dict[Hashable, Tuple[Any, AvailabilityBatch]]]
+            Raw payload and availabilities of each independently processed part
+        """
+        self.payload = payload
+        self.batch = batch
+        self.parts: Dict[Hashable, Tuple[Any, AvailabilityBatch]] = (
+            parts if parts is not None else {}
+        )
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+
+        Returns
+        -------
+        str
+        """
+        return (
+            f"<{self.__class__.__name__}: {len(self.batch)} availabilities, "
+            f"{len(self.parts)} parts>"
+        )
+
+    def is_current(self, payload: Any) -> bool:
+        """
+        Whether a Payload is the Exact Payload of this Snapshot
+
+        Providers hand out the same parsed object for an unchanged payload, so
+        this is an identity check rather than a comparison.
+
+        Parameters
+        ----------
+        payload: Any
+
+        Returns
+        -------
+        bool
+        """
+        return payload is self.payload
+
+    @classmethod
+    def from_parts(
+        cls, payload: Any, parts: Dict[Hashable, Tuple[Any, AvailabilityBatch]]
+    ) -> "AvailabilitySnapshot":
+        """
+        Create a Snapshot by Combining its Processed Parts, in Order
+
+        Parameters
+        ----------
+        payload: Any
+        parts: Dict[Hashable, Tuple[Any, AvailabilityBatch]]
+
+        Returns
+        -------
+        AvailabilitySnapshot
+        """
+        return cls(
+            payload=payload,
+            batch=AvailabilityBatch.concat(batch for _, batch in parts.values()),
+            parts=parts,
+        )
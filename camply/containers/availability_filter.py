@@ -0,0 +1,160 @@
+"""
+Search Constraints Providers Apply While Parsing
+"""
+
+from datetime import date, datetime, timedelta
+from typing import (
+    FrozenSet,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+NightValue = TypeVar("NightValue")
+Night = Union[date, datetime]
+
+
+def _to_date(night: Night) -> date:
+    """
+    Get the Date of a Night
+
+    Parameters
+    ----------
+    night: Union[date, datetime]
+
+    Returns
+    -------
+    date
+    """
+    return night.date() if isinstance(night, datetime) else night
+
+
+class AvailabilityFilter:
+    """
+    Search Days and Minimum Stay of a Search, Handed to Provider Parsers
+
+    Providers stream the nights of a payload through `filter_nights` before
+    creating anything for them. Nights that aren't searched are skipped and,
+    when searching for multi-night stays, so are runs of consecutive nights
+    too short to make a stay. Runs reaching the first or last night of the
+    payload are kept since they can continue into the neighbouring payload.
+    Searches still check both constraints on what providers return.
+    """
+
+    def __init__(self, search_days: Iterable[Night], nights: int = 1) -> None:
+        """
+        Availability Filter Initialization
+
+        Parameters
+        ----------
+        search_days: Iterable[Union[date, datetime]]
+            Nights being searched
+        nights: int
+            Minimum number of consecutive nights per stay
+        """
+        self.search_days: FrozenSet[date] = frozenset(
+            _to_date(day) for day in search_days
+        )
+        self.nights: int = max(nights, 1)
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+
+        Returns
+        -------
+        str
+        """
+        return (
+            f"<{self.__class__.__name__}: {len(self.search_days)} search days, "
+            f"{self.nights} night{'s' if self.nights > 1 else ''}>"
+        )
+
+    def includes(self, night: Night) -> bool:
+        """
+        Whether a Night is Searched
+
+        Parameters
+        ----------
+        night: Union[date, datetime]
+
+        Returns
+        -------
+        bool
+        """
+        return _to_date(night) in self.search_days
+
+    def filter_nights(
+        self,
+        nights: Iterable[Tuple[Night, NightValue]],
+        first_night: Optional[Night] = None,
+        last_night: Optional[Night] = None,
+    ) -> Generator[Tuple[Night, NightValue], None, None]:
+        """
+        Stream the Available Nights of a Single Campsite That Can Make a Stay
+
+        Single night searches yield nights as they come. Multi-night searches
+        sort the campsite's nights and hold on to one run of consecutive
+        nights at a time.
+
+        Parameters
+        ----------
+        nights: Iterable[Tuple[Union[date, datetime], NightValue]]
+            Available nights of a campsite and any value to pass along
+        first_night: Optional[Union[date, datetime]]
+            First night the payload covers
+        last_night: Optional[Union[date, datetime]]
+            Last night the payload covers
+
+        Yields
+        ------
+        Tuple[Union[date, datetime], NightValue]
+        """
+        if self.nights == 1:
+            for night, value in nights:
+                if _to_date(night) in self.search_days:
+                    yield night, value
+            return
+        edges = frozenset(
+            _to_date(edge) for edge in (first_night, last_night) if edge is not None
+        )
+        run: List[Tuple[Night, NightValue]] = []
+        previous_date: Optional[date] = None
+        for night, value in sorted(nights, key=lambda item: _to_date(item[0])):
+            night_date = _to_date(night)
+            if night_date not in self.search_days:
+                continue
+            if previous_date is not None and night_date - previous_date != timedelta(
+                days=1
+            ):
+                yield from self._get_stay_run(run=run, edges=edges)
+                run = []
+            run.append((night, value))
+            previous_date = night_date
+        yield from self._get_stay_run(run=run, edges=edges)
+
+    def _get_stay_run(
+        self, run: List[Tuple[Night, NightValue]], edges: FrozenSet[date]
+    ) -> List[Tuple[Night, NightValue]]:
+        """
+        Keep a Run of Consecutive Nights Only if it Can Make a Stay
+
+        Parameters
+        ----------
+        run: List[Tuple[Union[date, datetime], NightValue]]
+        edges: FrozenSet[date]
+            First and last nights of the payload
+
+        Returns
+        -------
+        List[Tuple[Union[date, datetime], NightValue]]
+        """
+        if len(run) >= self.nights:
+            return run
+        elif run and (_to_date(run[0][0]) in edges or _to_date(run[-1][0]) in edges):
+            return run
+        return []
@@ -2,41 +2,317 @@
 Base Pydantic Object for Containers
 """
 
-from typing import Any, Set
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Optional, Set, Tuple, Type
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
+from pydantic.fields import SHAPE_DICT, SHAPE_LIST, SHAPE_SINGLETON, ModelField
+
+_ATOMIC_TYPES = frozenset(
+    {str, int, float, bool, type(None), date, datetime, timedelta}
+)
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Convert a Field Value Into a Hashable Equivalent
+
+    Parameters
+    ----------
+    value: Any
+
+    Returns
+    -------
+    Any
+    """
+    if value.__class__ in _ATOMIC_TYPES:
+        return value
+    elif isinstance(value, BaseModel):
+        return tuple(_freeze(item) for item in value.__dict__.values())
+    elif isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    elif isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    elif isinstance(value, set):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+_MISSING = object()
+
+
+# How each field is read from a decoded JSON payload
+_ANY_FIELD, _VALUE_FIELD, _LIST_FIELD, _DICT_FIELD, _VALIDATED_FIELD = range(5)
+
+
+@lru_cache(maxsize=None)
+def _get_payload_plan(
+    model: Type[BaseModel],
+) -> Tuple[Tuple[str, str, int, Any, ModelField], ...]:
+    """
+    Work Out Once How Each Field of a Model is Read From a Payload
+
+    Parameters
+    ----------
+    model: Type[BaseModel]
+
+    Returns
+    -------
+    Tuple[Tuple[str, str, int, Any, ModelField], ...]
+        The name, alias, kind, type and field of every field
+
+    Raises
+    ------
+    ValueError
+        The model has validators, which can't be skipped
+    """
+    if model.__pre_root_validators__ or model.__post_root_validators__:
+        raise ValueError(f"{model.__name__} has root validators")
+    elif model.__validators__:
+        raise ValueError(f"{model.__name__} has field validators")
+    plan = []
+    for name, field in model.__fields__.items():
+        field_type = field.type_
+        if field.shape == SHAPE_SINGLETON and field_type is Any:
+            kind = _ANY_FIELD
+        elif field.shape == SHAPE_SINGLETON and field_type in (str, int, float, bool):
+            kind = _VALUE_FIELD
+        elif field.shape == SHAPE_LIST and field_type in (int, float, bool):
+            kind = _LIST_FIELD
+        elif (
+            field.shape == SHAPE_DICT
+            and field_type is Any
+            and field.key_field.type_ is str
+        ):
+            kind = _DICT_FIELD
+        else:
+            kind = _VALIDATED_FIELD
+        plan.append((name, field.alias, kind, field_type, field))
+    return tuple(plan)
+
+
+def _read_payload_value(value: Any, kind: int, field_type: Any) -> Any:
+    """
+    Read a Payload Value That Needs no Validation
+
+    Parameters
+    ----------
+    value: Any
+        A value decoded from JSON, not None
+    kind: int
+        How the field is read, from `_get_payload_plan`
+    field_type: Any
+
+    Returns
+    -------
+    Any
+
+    Raises
+    ------
+    TypeError
+        The value needs validation
+    """
+    if kind == _VALUE_FIELD:
+        if value.__class__ is field_type:
+            return value.strip() if field_type is str else value
+        elif field_type is float and value.__class__ is int:
+            return float(value)
+    elif kind == _ANY_FIELD:
+        return value
+    elif kind == _LIST_FIELD:
+        if value.__class__ is list and all(
+            item.__class__ is field_type for item in value
+        ):
+            return value
+    elif kind == _DICT_FIELD and value.__class__ is dict:
+        return value
+    raise TypeError("The payload value needs validation")
+
+
+@lru_cache(maxsize=None)
+def _get_payload_aliases(model: Type[BaseModel]) -> Dict[str, str]:
+    """
+    Map the Payload Keys of a Model's Fields to Their Names
+
+    Parameters
+    ----------
+    model: Type[BaseModel]
+
+    Returns
+    -------
+    Dict[str, str]
+    """
+    return {field.alias: name for name, field in model.__fields__.items()}
 
 
 class CamplyModel(BaseModel):
     """
     Hashable Pydantic Model
+
+    Models are hashed and compared by an identity key, the values of their
+    hashable fields, which is computed once and cached until a field is
+    assigned to. Mutating a field in place (i.e. appending to a list) doesn't
+    reset the cached key.
     """
 
     __unhashable__: Set[str] = set()
+    _identity_key: Optional[Tuple[Any, ...]] = PrivateAttr(default=None)
+    _identity_hash: Optional[int] = PrivateAttr(default=None)
 
-    def __hash__(self):
+    def get_identity_key(self) -> Tuple[Any, ...]:
         """
-        Hash Method for Pydantic BaseModels
+        Get the Values of the Hashable Fields, Cached
+
+        Returns
+        -------
+        Tuple[Any, ...]
         """
-        return hash(self.__class__) + hash(
-            tuple(
-                value
+        identity_key = getattr(self, "_identity_key", None)
+        if identity_key is None:
+            identity_key = tuple(
+                value if value.__class__ in _ATOMIC_TYPES else _freeze(value)
                 for key, value in self.__dict__.items()
                 if key not in self.__unhashable__
             )
-        )
+            object.__setattr__(self, "_identity_key", identity_key)
+        return identity_key
+
+    def __hash__(self):
+        """
+        Hash Method for Pydantic BaseModels
+        """
+        identity_hash = getattr(self, "_identity_hash", None)
+        if identity_hash is None:
+            identity_hash = hash(self.__class__) + hash(self.get_identity_key())
+            object.__setattr__(self, "_identity_hash", identity_hash)
+        return identity_hash
 
     def __eq__(self, other: Any) -> bool:
         """
         Exclude Unhashable Fields When Evaluating Equality
         """
-        if isinstance(other, CamplyModel):
+        if other.__class__ is self.__class__:
+            return self is other or self.get_identity_key() == other.get_identity_key()
+        elif isinstance(other, CamplyModel):
             return self.dict(exclude=self.__unhashable__) == other.dict(
                 exclude=other.__unhashable__
             )
         else:
             return self.dict(exclude=self.__unhashable__) == other
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Reset the Cached Identity When a Field is Assigned To
+        """
+        super().__setattr__(name, value)
+        if name not in self.__private_attributes__:
+            self._reset_identity()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Leave the Cached Identity Out of Pickles
+
+        String hashes differ between processes, so a cached hash can't be
+        carried over.
+        """
+        state = super().__getstate__()
+        state["__private_attribute_values__"] = {}
+        return state
+
+    def copy(self, **kwargs: Any) -> "CamplyModel":
+        """
+        Copy the Model, the Copy Computes its Own Identity
+        """
+        model = super().copy(**kwargs)
+        model._reset_identity()
+        return model
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "CamplyModel":
+        """
+        Build the Model From a Decoded JSON Payload, Skipping Validation
+
+        Payloads made of plain values that already have their field's type
+        are trusted as is, anything else is validated like `cls(**payload)`.
+
+        Parameters
+        ----------
+        payload: Dict[str, Any]
+
+        Returns
+        -------
+        CamplyModel
+
+        Raises
+        ------
+        ValidationError
+            The payload doesn't validate
+        """
+        try:
+            return cls._construct_payload(payload=payload)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return cls(**payload)
+
+    @classmethod
+    def _construct_payload(
+        cls, payload: Dict[str, Any], **values: Any
+    ) -> "CamplyModel":
+        """
+        Build the Model From a Payload of Plain Values, Without Validation
+
+        Subclasses with nested fields build them and pass them as `values`.
+        Every other field must be missing, None when optional, `Any`, or hold
+        exactly its type: a string, number or boolean, a list of those or a
+        dictionary of anything keyed by strings.
+
+        Parameters
+        ----------
+        payload: Dict[str, Any]
+        **values: Any
+            Field values already built from the payload
+
+        Returns
+        -------
+        CamplyModel
+
+        Raises
+        ------
+        ValueError
+            A field value would need validation
+        """
+        field_values = {}
+        for name, alias, kind, field_type, field in _get_payload_plan(cls):
+            if name in values:
+                field_values[name] = values[name]
+                continue
+            value = payload.get(alias, _MISSING)
+            if value is _MISSING:
+                if field.required:
+                    raise KeyError(alias)
+                value = field.get_default()
+            elif value is None:
+                if not field.allow_none:
+                    raise ValueError(f"{cls.__name__}.{name} can't be None")
+            else:
+                value = _read_payload_value(value, kind, field_type)
+            field_values[name] = value
+        model = cls.__new__(cls)
+        object.__setattr__(model, "__dict__", field_values)
+        aliases = _get_payload_aliases(cls)
+        object.__setattr__(
+            model, "__fields_set__", {aliases[key] for key in payload if key in aliases}
+        )
+        model._init_private_attributes()
+        return model
+
+    def _reset_identity(self) -> None:
+        """
+        Forget the Cached Identity Key and Hash
+        """
+        object.__setattr__(self, "_identity_key", None)
+        object.__setattr__(self, "_identity_hash", None)
+
     class Config:
         """
         Camply Wide Configuration
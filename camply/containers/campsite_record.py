@@ -0,0 +1,111 @@
+"""
+Lightweight Nightly Availability Records
+"""
+
+from typing import Any, Dict, Tuple
+
+from camply.containers.base_container import RecDotGovAttribute, RecDotGovEquipment
+from camply.containers.data_containers import AvailableCampsite, CampsiteLocation
+
+
+def construct_campsite(fields: Dict[str, Any]) -> AvailableCampsite:
+    """
+    Build an AvailableCampsite From Trusted Values, Without Validation
+
+    The values must already have the types `AvailableCampsite` validates
+    them to, i.e. values parsed by a provider or `AvailableCampsite.dict()`
+    output. Nested models may still be plain dictionaries, model instances
+    are kept as they are so campsites can share them, and strings are
+    stripped like validation would.
+
+    Parameters
+    ----------
+    fields: Dict[str, Any]
+        `AvailableCampsite` field values, missing fields are set to None
+
+    Returns
+    -------
+    AvailableCampsite
+    """
+    values = {}
+    for field in AvailableCampsite.__fields__:
+        value = fields.get(field)
+        if value.__class__ is str:
+            value = value.strip()
+        values[field] = value
+    location = values["location"]
+    if isinstance(location, dict):
+        values["location"] = CampsiteLocation.construct(**location)
+    for field, model in (
+        ("permitted_equipment", RecDotGovEquipment),
+        ("campsite_attributes", RecDotGovAttribute),
+    ):
+        items = values[field]
+        if items is not None and any(isinstance(item, dict) for item in items):
+            values[field] = [
+                model.construct(**item) if isinstance(item, dict) else item
+                for item in items
+            ]
+    return AvailableCampsite.construct(**values)
+
+
+class CampsiteRecord:
+    """
+    Slotted, Unvalidated Counterpart of AvailableCampsite
+
+    Providers that look at every night of every campsite create these while
+    parsing, which takes a fraction of the time and memory of a validated
+    pydantic model, and only turn the nights a search keeps into
+    `AvailableCampsite` objects with `to_campsite`.
+    """
+
+    __slots__: Tuple[str, ...] = tuple(AvailableCampsite.__fields__)
+
+    def __init__(self, **fields: Any) -> None:
+        """
+        Campsite Record Initialization
+
+        Parameters
+        ----------
+        **fields: Any
+            `AvailableCampsite` field values, missing fields are set to None
+        """
+        for field in self.__slots__:
+            object.__setattr__(self, field, fields.pop(field, None))
+        if fields:
+            raise TypeError(
+                f"Unknown AvailableCampsite fields: {', '.join(sorted(fields))}"
+            )
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+
+        Returns
+        -------
+        str
+        """
+        return (
+            f"<{self.__class__.__name__}: {self.campsite_id} "
+            f"{self.booking_date} ({self.availability_status})>"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get Every Field Value
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def to_campsite(self) -> AvailableCampsite:
+        """
+        Convert the Record to an AvailableCampsite, Without Validation
+
+        Returns
+        -------
+        AvailableCampsite
+        """
+        return construct_campsite(fields=self.to_dict())
@@ -56,6 +56,8 @@ class YamlSearchFile(CamplyModel):
     equipment: ArrayOrSingleEquipment = None
     offline_search: bool = False
     offline_search_path: Optional[str] = None
+    workers: int = SearchConfig.DEFAULT_WORKERS
+    requests_per_hour: Optional[float] = None
 
     @validator("provider", pre=True)
     def validate_provider(cls, value):
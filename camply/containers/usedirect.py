@@ -3,6 +3,7 @@ UseDirect API Responses
 """
 
 import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from camply.containers import CamplyModel
@@ -39,6 +40,50 @@ class UseDirectUnitType(CamplyModel):
     AvailableCount: Optional[int]
 
 
+_SLICE_DATE_LENGTH: int = len("YYYY-MM-DD")
+_SLICE_DATETIME_LENGTH: int = len("YYYY-MM-DDTHH:MM:SS")
+
+
+@lru_cache(maxsize=4096)
+def _parse_slice_date(value: str) -> datetime.date:
+    """
+    Parse a "YYYY-MM-DD" Slice Date, Memoized
+
+    Parameters
+    ----------
+    value: str
+
+    Returns
+    -------
+    datetime.date
+    """
+    if value.__class__ is not str or len(value) != _SLICE_DATE_LENGTH:
+        raise ValueError(f"Unexpected slice date: {value}")
+    return datetime.date.fromisoformat(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_slice_datetime(value: str) -> datetime.datetime:
+    """
+    Parse a "YYYY-MM-DDTHH:MM:SS" Slice Timestamp, Memoized
+
+    Parameters
+    ----------
+    value: str
+
+    Returns
+    -------
+    datetime.datetime
+    """
+    if (
+        value.__class__ is not str
+        or len(value) != _SLICE_DATETIME_LENGTH
+        or value[10] != "T"
+    ):
+        raise ValueError(f"Unexpected slice timestamp: {value}")
+    return datetime.datetime.fromisoformat(value)
+
+
 class UseDirectAvailabilitySlice(CamplyModel):
     """
     Slice of Availability per Date
@@ -53,6 +98,16 @@ class UseDirectAvailabilitySlice(CamplyModel):
     MinStay: Optional[int]
     IsReservationDraw: Optional[bool]
 
+    @classmethod
+    def _construct_payload(
+        cls, payload: Dict[str, Any], **values: Any
+    ) -> "UseDirectAvailabilitySlice":
+        """
+        Build the Slice With Memoized Date Parsing
+        """
+        values["Date"] = _parse_slice_date(payload["Date"])
+        return super()._construct_payload(payload=payload, **values)
+
 
 class UseDirectAvailabilityUnit(CamplyModel):
     """
@@ -83,6 +138,24 @@ class UseDirectAvailabilityUnit(CamplyModel):
     EndTime: Any
     FacilityId: Optional[int]
 
+    @classmethod
+    def _construct_payload(
+        cls, payload: Dict[str, Any], **values: Any
+    ) -> "UseDirectAvailabilityUnit":
+        """
+        Build Each Slice Without Validation
+        """
+        slices = payload.get("Slices", {})
+        if slices is not None:
+            slices = {
+                _parse_slice_datetime(
+                    timestamp
+                ): UseDirectAvailabilitySlice._construct_payload(payload=item)
+                for timestamp, item in slices.items()
+            }
+        values["Slices"] = slices
+        return super()._construct_payload(payload=payload, **values)
+
 
 class UseDirectFacility(CamplyModel):
     """
@@ -234,6 +307,40 @@ class UseDirectAvailabilityResponse(CamplyModel):
     TimeBetweenEval: Optional[str]
     Facility: Optional[UseDirectAvailabilityFacility]
 
+    @classmethod
+    def _construct_payload(
+        cls, payload: Dict[str, Any], **values: Any
+    ) -> "UseDirectAvailabilityResponse":
+        """
+        Build the Units and Slices Without Validation
+
+        The rest of the response is small and validated as usual.
+        """
+        facility = payload.get("Facility")
+        if facility is not None:
+            units = facility.get("Units")
+            if units is not None:
+                units = {
+                    key: UseDirectAvailabilityUnit._construct_payload(payload=unit)
+                    for key, unit in units.items()
+                }
+            validated_facility = UseDirectAvailabilityFacility(
+                **{key: value for key, value in facility.items() if key != "Units"}
+            )
+            facility = UseDirectAvailabilityFacility.construct(
+                _fields_set={*validated_facility.__fields_set__, *facility.keys()}
+                & set(UseDirectAvailabilityFacility.__fields__),
+                **{**validated_facility.__dict__, "Units": units},
+            )
+        response = cls(
+            **{key: value for key, value in payload.items() if key != "Facility"}
+        )
+        return cls.construct(
+            _fields_set={*response.__fields_set__, *payload.keys()}
+            & set(cls.__fields__),
+            **{**response.__dict__, "Facility": facility},
+        )
+
 
 class UseDirectUnitCategory(CamplyModel):
     """
@@ -362,3 +469,21 @@ class UseDirectFacilityMetadata(CamplyModel):
     TimebaseMaxHours: Optional[int]
     TimebaseMinHours: Optional[int]
     TimebaseDuration: Optional[int]
+
+
+class UseDirectGridWindow(CamplyModel):
+    """
+    UseDirect: Date Range of a Single /rdr/rdr/search/grid Request
+
+    Both dates are inclusive.
+    """
+
+    start_date: datetime.date
+    end_date: datetime.date
+
+    @property
+    def days(self) -> int:
+        """
+        Number of Days Covered by the Window
+        """
+        return (self.end_date - self.start_date).days + 1
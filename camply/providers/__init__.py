@@ -4,7 +4,7 @@ providers __init__ file
 
 from typing import Union
 
-from .base_provider import BaseProvider
+from .base_provider import AsyncProvider, BaseProvider
 from .going_to_camp.going_to_camp_provider import GoingToCamp
 from .recreation_dot_gov.recdotgov_camps import RecreationDotGov
 from .recreation_dot_gov.recdotgov_tours import (
@@ -52,6 +52,7 @@ ProviderType = Union[
 ]
 
 __all__ = [
+    "AsyncProvider",
     "BaseProvider",
     "ProviderType",
     "GoingToCamp",
@@ -2,10 +2,24 @@
 BaseProvider Base Class
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    runtime_checkable,
+)
 
 import requests
 import tenacity
@@ -14,9 +28,13 @@ from fake_useragent import UserAgent
 from camply.config import SearchConfig
 from camply.config.api_config import APIConfig
 from camply.containers import CampgroundFacility
+from camply.utils.coalescing import request_coalescer
+from camply.utils.rate_limiting import TOO_MANY_REQUESTS, rate_limiter
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class ProviderError(Exception):
     """
@@ -36,6 +54,7 @@ class BaseProvider(ABC):
     """
 
     RETRY_CONFIG: Type[APIConfig] = APIConfig
+    RATE_LIMIT_CONFIG: Type[APIConfig] = APIConfig
     FIVE_HUNDRED_STATUS_CODES = [
         # Official Server Errors
         500,  # Internal Server Error
@@ -118,6 +137,97 @@ class BaseProvider(ABC):
         List Recreation Areas for the provider
         """
 
+    @classmethod
+    def acquire_rate_limit(cls, url: str) -> float:
+        """
+        Wait Until the Shared Rate Limit Allows a Request to a URL
+
+        Every provider shares one token bucket per host, sized by the
+        provider's `RATE_LIMIT_CONFIG`.
+
+        Parameters
+        ----------
+        url: str
+            URL about to be requested
+
+        Returns
+        -------
+        float
+            Seconds spent waiting
+        """
+        return rate_limiter.acquire(
+            url=url,
+            rate=cls.RATE_LIMIT_CONFIG.RATE_LIMIT_CALLS,
+            burst=cls.RATE_LIMIT_CONFIG.RATE_LIMIT_BURST,
+        )
+
+    @classmethod
+    async def acquire_rate_limit_async(cls, url: str) -> float:
+        """
+        Wait, Without Blocking the Event Loop, Until a Request to a URL is Allowed
+
+        Parameters
+        ----------
+        url: str
+            URL about to be requested
+
+        Returns
+        -------
+        float
+            Seconds spent waiting
+        """
+        return await rate_limiter.acquire_async(
+            url=url,
+            rate=cls.RATE_LIMIT_CONFIG.RATE_LIMIT_CALLS,
+            burst=cls.RATE_LIMIT_CONFIG.RATE_LIMIT_BURST,
+        )
+
+    @classmethod
+    def report_rate_limit(cls, url: str, response: requests.Response) -> None:
+        """
+        Pause Requests to a Host When a Response Says We're Rate Limited
+
+        Parameters
+        ----------
+        url: str
+            URL that was requested
+        response: requests.Response
+        """
+        rate_limiter.feedback_response(
+            url=url,
+            response=response,
+            backoff=cls.RATE_LIMIT_CONFIG.RATE_LIMIT_BACKOFF,
+            maximum_backoff=cls.RATE_LIMIT_CONFIG.RATE_LIMIT_MAX_BACKOFF,
+        )
+
+    @classmethod
+    def coalesce_request(
+        cls,
+        key: Tuple[Hashable, ...],
+        func: Callable[..., T],
+        **kwargs: Any,
+    ) -> T:
+        """
+        Fetch an Availability Payload Once per Polling Tick
+
+        Identical requests, from any search of the same provider, share a
+        single fetch while a polling tick is open. See `RequestCoalescer`.
+
+        Parameters
+        ----------
+        key: Tuple[Hashable, ...]
+            Facility, month or date window and search parameters of the request
+        func: Callable[..., T]
+            Function fetching and parsing the payload
+        **kwargs: Any
+            Arguments passed to `func`
+
+        Returns
+        -------
+        T
+        """
+        return request_coalescer.fetch((cls.__name__, *key), func, **kwargs)
+
     def make_http_request(
         self,
         url: str,
@@ -141,6 +251,7 @@ class BaseProvider(ABC):
             Headers to send with the request
         retry_response_codes: Optional[List[int]]
             List of response codes to raise a ProviderError. on. Defaults to 500 range
+            and 429 (Too Many Requests)
 
         Returns
         -------
@@ -153,11 +264,50 @@ class BaseProvider(ABC):
         HTTPError
             If the response code is not in the retry_response_codes list and the request fails
         """
+        self.acquire_rate_limit(url=url)
+        return self._send_http_request(
+            url=url,
+            method=method,
+            data=data,
+            headers=headers,
+            retry_response_codes=retry_response_codes,
+        )
+
+    def _send_http_request(
+        self,
+        url: str,
+        method: str = "GET",
+        data: Optional[Union[Dict[str, Any], str]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        retry_response_codes: Optional[List[int]] = None,
+    ) -> requests.Response:
+        """
+        Send an HTTP Request, Once the Rate Limit Allows it, and Check the Response
+
+        Parameters
+        ----------
+        url: str
+            URL to make the request to
+        method: str
+            HTTP Method to use. Defaults to GET
+        data: Optional[Union[Dict[str, Any], str]]
+            Data to send with the request
+        headers: Optional[Dict[str, Any]]
+            Headers to send with the request
+        retry_response_codes: Optional[List[int]]
+            List of response codes to raise a ProviderError. on. Defaults to 500 range
+            and 429 (Too Many Requests)
+
+        Returns
+        -------
+        response: requests.Response
+        """
         if retry_response_codes is None:
-            retry_response_codes = self.FIVE_HUNDRED_STATUS_CODES
+            retry_response_codes = [*self.FIVE_HUNDRED_STATUS_CODES, TOO_MANY_REQUESTS]
         response = self.session.request(
             method=method, url=url, data=data, headers=headers
         )
+        self.report_rate_limit(url=url, response=response)
         if response.status_code not in retry_response_codes:
             response.raise_for_status()
         else:
@@ -192,24 +342,123 @@ class BaseProvider(ABC):
         headers: Optional[Dict[str, Any]]
             Headers to send with the request
         retry_response_codes: Optional[List[int]]
-            List of response codes to retry on. Defaults to 500 range
+            List of response codes to retry on. Defaults to 500 range and 429
 
         Returns
         -------
         response: requests.Response
         """
-        retryer = tenacity.Retrying(
-            wait=tenacity.wait_random_exponential(
+        retryer = tenacity.Retrying(**self._get_retry_arguments())
+        response: requests.Response = retryer.__call__(
+            fn=self.make_http_request,
+            url=url,
+            method=method,
+            data=data,
+            headers=headers,
+            retry_response_codes=retry_response_codes,
+        )
+        return response
+
+    def _get_retry_arguments(self) -> Dict[str, Any]:
+        """
+        Get the `tenacity` Arguments of the Provider's Retry Configuration
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        return {
+            "wait": tenacity.wait_random_exponential(
                 multiplier=self.RETRY_CONFIG.RETRY_API_MULTIPLIER,
                 max=self.RETRY_CONFIG.RETRY_MAX_API_ATTEMPTS,
             ),
-            stop=tenacity.stop.stop_after_delay(
+            "stop": tenacity.stop.stop_after_delay(
                 self.RETRY_CONFIG.RETRY_MAX_API_TIMEOUT
             ),
-            retry=tenacity.retry_if_exception_type(ProviderError),
+            "retry": tenacity.retry_if_exception_type(ProviderError),
+        }
+
+    async def make_http_request_async(
+        self,
+        url: str,
+        method: str = "GET",
+        data: Optional[Union[Dict[str, Any], str]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        retry_response_codes: Optional[List[int]] = None,
+    ) -> requests.Response:
+        """
+        Make an HTTP Request from an Event Loop
+
+        Waiting on the rate limit happens on the event loop, only the
+        request itself is handed to a worker thread, so thousands of pending
+        requests don't hold thousands of threads.
+
+        Parameters
+        ----------
+        url: str
+            URL to make the request to
+        method: str
+            HTTP Method to use. Defaults to GET
+        data: Optional[Union[Dict[str, Any], str]]
+            Data to send with the request
+        headers: Optional[Dict[str, Any]]
+            Headers to send with the request
+        retry_response_codes: Optional[List[int]]
+            List of response codes to raise a ProviderError. on. Defaults to 500 range
+            and 429 (Too Many Requests)
+
+        Returns
+        -------
+        response: requests.Response
+
+        Raises
+        ------
+        ProviderError
+            If the response code is in the retry_response_codes list
+        HTTPError
+            If the response code is not in the retry_response_codes list and the request fails
+        """
+        await self.acquire_rate_limit_async(url=url)
+        return await asyncio.to_thread(
+            self._send_http_request,
+            url=url,
+            method=method,
+            data=data,
+            headers=headers,
+            retry_response_codes=retry_response_codes,
         )
-        response: requests.Response = retryer.__call__(
-            fn=self.make_http_request,
+
+    async def make_http_request_retry_async(
+        self,
+        url: str,
+        method: str = "GET",
+        data: Optional[Union[Dict[str, Any], str]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        retry_response_codes: Optional[List[int]] = None,
+    ) -> requests.Response:
+        """
+        Make an HTTP Request with Exponential Backoff from an Event Loop
+
+        Parameters
+        ----------
+        url: str
+            URL to make the request to
+        method: str
+            HTTP Method to use. Defaults to GET
+        data: Optional[Union[Dict[str, Any], str]]
+            Data to send with the request
+        headers: Optional[Dict[str, Any]]
+            Headers to send with the request
+        retry_response_codes: Optional[List[int]]
+            List of response codes to retry on. Defaults to 500 range and 429
+
+        Returns
+        -------
+        response: requests.Response
+        """
+        retryer = tenacity.AsyncRetrying(**self._get_retry_arguments())
+        response: requests.Response = await retryer.__call__(
+            fn=self.make_http_request_async,
             url=url,
             method=method,
             data=data,
@@ -217,3 +466,37 @@ class BaseProvider(ABC):
             retry_response_codes=retry_response_codes,
         )
         return response
+
+
+@runtime_checkable
+class AsyncProvider(Protocol):
+    """
+    Protocol of Providers that Can be Searched from an Event Loop
+
+    Implementations wait on the shared rate limit with `asyncio` and never
+    block the event loop, one event loop can then drive many searches at once.
+    """
+
+    async def make_http_request_async(
+        self,
+        url: str,
+        method: str = "GET",
+        data: Optional[Union[Dict[str, Any], str]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        retry_response_codes: Optional[List[int]] = None,
+    ) -> requests.Response:
+        """
+        Make an HTTP Request from an Event Loop
+        """
+
+    async def make_http_request_retry_async(
+        self,
+        url: str,
+        method: str = "GET",
+        data: Optional[Union[Dict[str, Any], str]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        retry_response_codes: Optional[List[int]] = None,
+    ) -> requests.Response:
+        """
+        Make an HTTP Request with Exponential Backoff from an Event Loop
+        """
@@ -2,21 +2,28 @@
 Going to Camp Web Searching Utilities
 """
 
-import json
+import asyncio
 import logging
+import pathlib
 import sys
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 
+import requests
 from fake_useragent import UserAgent
 from pydantic import ValidationError
 
+from camply.config import FileConfig
+from camply.config.api_config import GoingToCampConfig
 from camply.containers import AvailableResource, CampgroundFacility, RecreationArea
 from camply.containers.base_container import GoingToCampEquipment
 from camply.containers.gtc_api_responses import ResourceLocation
 from camply.providers.base_provider import BaseProvider, ProviderSearchError
 from camply.providers.going_to_camp.rec_areas import RECREATION_AREAS
 from camply.utils import make_list
+from camply.utils.concurrency import map_concurrently
+from camply.utils.disk_cache import DiskCache
+from camply.utils.json_decoding import loads
 from camply.utils.logging_utils import log_sorted_response
 
 logger = logging.getLogger(__name__)
@@ -45,6 +52,41 @@ class GoingToCamp(BaseProvider):
     Going To Camp API provider
     """
 
+    RATE_LIMIT_CONFIG = GoingToCampConfig
+
+    __offline_cache_dir__: Optional[pathlib.Path] = None
+
+    def __init__(self) -> None:
+        """
+        Initialize with Empty Site Details and Attribute Caches
+        """
+        super().__init__()
+        self._attribute_details: Dict[str, Dict[str, Any]] = {}
+        self._site_details: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._unsaved_site_details: Set[str] = set()
+        self._map_trees: Dict[Tuple[str, str, str], List[Union[int, str]]] = {}
+
+    @property
+    def offline_cache_dir(self) -> pathlib.Path:
+        """
+        Offline Cache Directory
+        """
+        if self.__offline_cache_dir__ is None:
+            return FileConfig.GOING_TO_CAMP_PROVIDER
+        else:
+            return self.__offline_cache_dir__
+
+    @property
+    def site_details_cache(self) -> DiskCache:
+        """
+        On-Disk Cache of Site Details, One File per Recreation Area
+        """
+        return DiskCache(
+            directory=self.offline_cache_dir.joinpath("site_details"),
+            version=GoingToCampConfig.SITE_DETAILS_CACHE_VERSION,
+            ttl=timedelta(seconds=GoingToCampConfig.SITE_DETAILS_CACHE_TTL),
+        )
+
     @classmethod
     def find_recreation_areas(
         cls, search_string: Optional[str] = None, **kwargs
@@ -149,6 +191,11 @@ class GoingToCamp(BaseProvider):
         """
         Get the details about a site in a recreation area
 
+        Site details rarely change, so they're cached on disk per recreation
+        area and only requested again once they've expired. Newly fetched
+        details are written to disk by `save_site_details`, once per batch
+        rather than once per site.
+
         Parameters
         ----------
         rec_area_id: int
@@ -160,12 +207,169 @@ class GoingToCamp(BaseProvider):
         details: Dict[str, str]
             The details about the site
         """
-        if not hasattr(self, "_attribute_details"):
-            self._attribute_details = self._api_request(
+        cached_sites = self._get_cached_site_details(rec_area_id=rec_area_id)
+        cached_site = cached_sites.get(str(resource_id))
+        if cached_site is not None and self._site_details_fresh(cached_site):
+            return cached_site["details"]
+        site_details = self._fetch_site_details(
+            rec_area_id=rec_area_id, resource_id=resource_id
+        )
+        cached_sites[str(resource_id)] = self._site_details_entry(site_details)
+        self._unsaved_site_details.add(str(rec_area_id))
+        return site_details
+
+    def warm_site_details(
+        self, rec_area_id: int, resource_ids: Sequence[int], workers: int = 1
+    ) -> None:
+        """
+        Fetch the Details of Every Site Missing from the Site Details Cache
+
+        Sites whose cached details are still fresh aren't requested again, so
+        repeated polls only fetch the details of sites they haven't seen.
+
+        Parameters
+        ----------
+        rec_area_id: int
+            Recreation Area ID of the sites
+        resource_ids: Sequence[int]
+            Sites to warm up
+        workers: int
+            Number of site details to fetch concurrently
+        """
+        cached_sites = self._get_cached_site_details(rec_area_id=rec_area_id)
+        missing_ids = []
+        for resource_id in dict.fromkeys(resource_ids):
+            cached_site = cached_sites.get(str(resource_id))
+            if cached_site is None or not self._site_details_fresh(cached_site):
+                missing_ids.append(resource_id)
+        if len(missing_ids) == 0:
+            self.save_site_details(rec_area_id=rec_area_id)
+            return
+        logger.debug(
+            "Fetching details for %s of %s sites",
+            len(missing_ids),
+            len(resource_ids),
+        )
+        self._get_attribute_details(rec_area_id=rec_area_id)
+        for index, site_details in map_concurrently(
+            func=self._fetch_site_details,
+            arguments=[
+                {"rec_area_id": rec_area_id, "resource_id": resource_id}
+                for resource_id in missing_ids
+            ],
+            workers=workers,
+        ):
+            resource_id = str(missing_ids[index])
+            cached_sites[resource_id] = self._site_details_entry(site_details)
+        self._unsaved_site_details.add(str(rec_area_id))
+        self.save_site_details(rec_area_id=rec_area_id)
+
+    def _get_cached_site_details(self, rec_area_id: int) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the Site Details of a Recreation Area, Loading them From Disk Once
+
+        Parameters
+        ----------
+        rec_area_id: int
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            Cached site details, with their fetch time, keyed by resource ID
+        """
+        key = str(rec_area_id)
+        if key not in self._site_details:
+            entry = self.site_details_cache.get(key=key)
+            self._site_details[key] = {} if entry is None else entry.data
+        return self._site_details[key]
+
+    @classmethod
+    def _site_details_entry(cls, site_details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Wrap Freshly Fetched Site Details with their Fetch Time
+
+        Parameters
+        ----------
+        site_details: Dict[str, Any]
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        return {
+            "fetched_at": datetime.utcnow().isoformat(),
+            "details": site_details,
+        }
+
+    @classmethod
+    def _site_details_fresh(cls, cached_site: Dict[str, Any]) -> bool:
+        """
+        Whether Cached Site Details are Still Within their Time to Live
+
+        Parameters
+        ----------
+        cached_site: Dict[str, Any]
+
+        Returns
+        -------
+        bool
+        """
+        fetched_at = datetime.fromisoformat(cached_site["fetched_at"])
+        age = datetime.utcnow() - fetched_at
+        return age < timedelta(seconds=GoingToCampConfig.SITE_DETAILS_CACHE_TTL)
+
+    def save_site_details(self, rec_area_id: int) -> None:
+        """
+        Write the Site Details of a Recreation Area to Disk, if Any Were Fetched
+
+        Parameters
+        ----------
+        rec_area_id: int
+        """
+        key = str(rec_area_id)
+        if key not in self._unsaved_site_details:
+            return
+        self._unsaved_site_details.discard(key)
+        try:
+            self.site_details_cache.set(key=key, data=self._site_details[key])
+        except OSError as e:
+            logger.warning("Unable to cache site details: %s", e)
+
+    def _get_attribute_details(self, rec_area_id: int) -> Dict[str, Any]:
+        """
+        Get the Attribute Definitions of a Recreation Area
+
+        Parameters
+        ----------
+        rec_area_id: int
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        key = str(rec_area_id)
+        if key not in self._attribute_details:
+            self._attribute_details[key] = self._api_request(
                 rec_area_id, "ATTRIBUTE_DETAILS"
             )
-        attribute_details = self._attribute_details
+        return self._attribute_details[key]
 
+    def _fetch_site_details(
+        self, rec_area_id: int, resource_id: Union[int, str]
+    ) -> Dict[str, Any]:
+        """
+        Request the Details of a Site and Resolve its Attributes
+
+        Parameters
+        ----------
+        rec_area_id: int
+        resource_id: Union[int, str]
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        attribute_details = self._get_attribute_details(rec_area_id=rec_area_id)
         site_details = self._api_request(
             rec_area_id, "SITE_DETAILS", {"resourceId": resource_id}
         )
@@ -326,9 +530,55 @@ class GoingToCamp(BaseProvider):
         endpoint_name: str,
         params: Optional[Dict[str, str]] = None,
     ) -> str:
-        if params is None:
-            params = {}
+        url, headers = self._get_api_request(rec_area_id, endpoint_name)
+        self.acquire_rate_limit(url=url)
+        response = self.session.get(
+            url=url, headers=headers, params=params or {}, timeout=30
+        )
+        return self._load_api_response(url=url, response=response)
+
+    async def _api_request_async(
+        self,
+        rec_area_id: int,
+        endpoint_name: str,
+        params: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """
+        Make a GoingToCamp API Request - From an Event Loop
+
+        Parameters
+        ----------
+        rec_area_id: int
+        endpoint_name: str
+        params: Optional[Dict[str, str]]
+
+        Returns
+        -------
+        Any
+            The JSON response
+        """
+        url, headers = self._get_api_request(rec_area_id, endpoint_name)
+        await self.acquire_rate_limit_async(url=url)
+        response = await asyncio.to_thread(
+            self.session.get, url=url, headers=headers, params=params or {}, timeout=30
+        )
+        return self._load_api_response(url=url, response=response)
+
+    def _get_api_request(
+        self, rec_area_id: int, endpoint_name: str
+    ) -> Tuple[Optional[str], Dict[str, str]]:
+        """
+        Get the URL and Headers of a GoingToCamp API Request
+
+        Parameters
+        ----------
+        rec_area_id: int
+        endpoint_name: str
 
+        Returns
+        -------
+        Tuple[Optional[str], Dict[str, str]]
+        """
         hostname = self._hostname_for(rec_area_id)
         endpoint = ENDPOINTS.get(endpoint_name)
         url = None
@@ -338,13 +588,28 @@ class GoingToCamp(BaseProvider):
             "User-Agent": UserAgent(browsers=["chrome"]).random,
             "Accept-Language": "en-US,en;q=0.9",
         }
-        response = self.session.get(url=url, headers=headers, params=params, timeout=30)
+        return url, headers
+
+    def _load_api_response(self, url: str, response: requests.Response) -> Any:
+        """
+        Load a GoingToCamp API Response, Raise a ConnectionError on Bad Data
+
+        Parameters
+        ----------
+        url: str
+        response: requests.Response
+
+        Returns
+        -------
+        Any
+        """
+        self.report_rate_limit(url=url, response=response)
         if response.ok is False:
             error_message = f"Receiving bad data from GoingToCamp API: status_code: {response.status_code}: {response.text}"
             logger.error(error_message)
             raise ConnectionError(error_message)
 
-        return json.loads(response.content)
+        return loads(response.content)
 
     def _filter_facilities_responses(
         self, rec_area_id: int, facilities=List[Dict[str, Any]]
@@ -446,12 +711,281 @@ class GoingToCamp(BaseProvider):
 
     def _find_matching_resources(self, rec_area_id: int, search_filter: Dict[str, any]):
         results = self._api_request(rec_area_id, "MAPDATA", search_filter)
+        return self._get_map_results(search_filter=search_filter, results=results)
+
+    async def _find_matching_resources_async(
+        self, rec_area_id: int, search_filter: Dict[str, Any]
+    ) -> Tuple[Dict[Union[int, str], Dict[str, Any]], List[str]]:
+        """
+        Fetch the Resources of a Single Map - From an Event Loop
+
+        Parameters
+        ----------
+        rec_area_id: int
+        search_filter: Dict[str, Any]
+
+        Returns
+        -------
+        Tuple[Dict[Union[int, str], Dict[str, Any]], List[str]]
+        """
+        results = await self._api_request_async(rec_area_id, "MAPDATA", search_filter)
+        return self._get_map_results(search_filter=search_filter, results=results)
+
+    @classmethod
+    def _get_map_results(
+        cls, search_filter: Dict[str, Any], results: Dict[str, Any]
+    ) -> Tuple[Dict[Union[int, str], Dict[str, Any]], List[str]]:
+        """
+        Get the Resources of a Map, and the Maps it Links to
+
+        Parameters
+        ----------
+        search_filter: Dict[str, Any]
+        results: Dict[str, Any]
+            MAPDATA response
+
+        Returns
+        -------
+        Tuple[Dict[Union[int, str], Dict[str, Any]], List[str]]
+        """
         availability_details = {
             search_filter["mapId"]: results["resourceAvailabilities"]
         }
 
         return availability_details, list(results["mapLinkAvailabilities"].keys())
 
+    def _find_map_resources(
+        self,
+        rec_area_id: int,
+        search_filter: Dict[str, Any],
+        map_ids: Sequence[Union[int, str]],
+        workers: int = 1,
+    ) -> Tuple[Dict[Union[int, str], Dict[str, Any]], List[Union[int, str]]]:
+        """
+        Fetch Several Maps of a Campground Concurrently
+
+        Parameters
+        ----------
+        rec_area_id: int
+        search_filter: Dict[str, Any]
+            MAPDATA search filter, its `mapId` is replaced for every map
+        map_ids: Sequence[Union[int, str]]
+        workers: int
+            Number of maps to fetch concurrently
+
+        Returns
+        -------
+        Tuple[Dict[Union[int, str], Dict[str, Any]], List[Union[int, str]]]
+            The resources of each map, in the order of `map_ids`, and every
+            map they link to
+        """
+        map_results: List[Tuple[Dict[Any, Any], List[str]]] = [
+            ({}, []) for _ in map_ids
+        ]
+        for index, result in map_concurrently(
+            func=self._find_matching_resources,
+            arguments=[
+                {
+                    "rec_area_id": rec_area_id,
+                    "search_filter": {**search_filter, "mapId": map_id},
+                }
+                for map_id in map_ids
+            ],
+            workers=workers,
+        ):
+            map_results[index] = result
+        return self._combine_map_results(map_results=map_results)
+
+    async def _find_map_resources_async(
+        self,
+        rec_area_id: int,
+        search_filter: Dict[str, Any],
+        map_ids: Sequence[Union[int, str]],
+    ) -> Tuple[Dict[Union[int, str], Dict[str, Any]], List[Union[int, str]]]:
+        """
+        Fetch Several Maps of a Campground at Once - From an Event Loop
+
+        Parameters
+        ----------
+        rec_area_id: int
+        search_filter: Dict[str, Any]
+            MAPDATA search filter, its `mapId` is replaced for every map
+        map_ids: Sequence[Union[int, str]]
+
+        Returns
+        -------
+        Tuple[Dict[Union[int, str], Dict[str, Any]], List[Union[int, str]]]
+            The resources of each map, in the order of `map_ids`, and every
+            map they link to
+        """
+        map_results = await asyncio.gather(
+            *[
+                self._find_matching_resources_async(
+                    rec_area_id=rec_area_id,
+                    search_filter={**search_filter, "mapId": map_id},
+                )
+                for map_id in map_ids
+            ]
+        )
+        return self._combine_map_results(map_results=map_results)
+
+    @classmethod
+    def _combine_map_results(
+        cls, map_results: Sequence[Tuple[Dict[Any, Any], List[str]]]
+    ) -> Tuple[Dict[Union[int, str], Dict[str, Any]], List[Union[int, str]]]:
+        """
+        Combine the Resources and Map Links of Several Maps
+
+        Parameters
+        ----------
+        map_results: Sequence[Tuple[Dict[Any, Any], List[str]]]
+
+        Returns
+        -------
+        Tuple[Dict[Union[int, str], Dict[str, Any]], List[Union[int, str]]]
+        """
+        resources: Dict[Union[int, str], Dict[str, Any]] = {}
+        linked_maps: List[Union[int, str]] = []
+        for availability_details, map_links in map_results:
+            resources.update(availability_details)
+            linked_maps += map_links
+        return resources, linked_maps
+
+    def _crawl_campground_maps(
+        self,
+        campground: CampgroundFacility,
+        search_filter: Dict[str, Any],
+        workers: int = 1,
+    ) -> Dict[Union[int, str], Dict[str, Any]]:
+        """
+        Crawl the Map Tree of a Campground, Breadth First
+
+        Resources are often deeply nested in sub-maps. Every level of the tree
+        is fetched concurrently, and the maps holding resources are remembered
+        so later searches of the campground can skip the crawl.
+
+        Parameters
+        ----------
+        campground: CampgroundFacility
+        search_filter: Dict[str, Any]
+        workers: int
+            Number of maps to fetch concurrently
+
+        Returns
+        -------
+        Dict[Union[int, str], Dict[str, Any]]
+            The resources of every map in the tree
+        """
+        resources: Dict[Union[int, str], Dict[str, Any]] = {}
+        visited_maps = {str(campground.map_id)}
+        map_level: List[Union[int, str]] = [campground.map_id]
+        while map_level:
+            level_resources, linked_maps = self._find_map_resources(
+                rec_area_id=campground.recreation_area_id,
+                search_filter=search_filter,
+                map_ids=map_level,
+                workers=workers,
+            )
+            resources.update(level_resources)
+            map_level = self._get_next_map_level(
+                linked_maps=linked_maps, visited_maps=visited_maps
+            )
+        self._memoize_map_tree(campground=campground, resources=resources)
+        return resources
+
+    async def _crawl_campground_maps_async(
+        self,
+        campground: CampgroundFacility,
+        search_filter: Dict[str, Any],
+    ) -> Dict[Union[int, str], Dict[str, Any]]:
+        """
+        Crawl the Map Tree of a Campground, Breadth First - From an Event Loop
+
+        Parameters
+        ----------
+        campground: CampgroundFacility
+        search_filter: Dict[str, Any]
+
+        Returns
+        -------
+        Dict[Union[int, str], Dict[str, Any]]
+            The resources of every map in the tree
+        """
+        resources: Dict[Union[int, str], Dict[str, Any]] = {}
+        visited_maps = {str(campground.map_id)}
+        map_level: List[Union[int, str]] = [campground.map_id]
+        while map_level:
+            level_resources, linked_maps = await self._find_map_resources_async(
+                rec_area_id=campground.recreation_area_id,
+                search_filter=search_filter,
+                map_ids=map_level,
+            )
+            resources.update(level_resources)
+            map_level = self._get_next_map_level(
+                linked_maps=linked_maps, visited_maps=visited_maps
+            )
+        self._memoize_map_tree(campground=campground, resources=resources)
+        return resources
+
+    @classmethod
+    def _get_next_map_level(
+        cls, linked_maps: List[Union[int, str]], visited_maps: Set[str]
+    ) -> List[Union[int, str]]:
+        """
+        Get the Linked Maps that Haven't Been Visited Yet, Marking Them Visited
+
+        Parameters
+        ----------
+        linked_maps: List[Union[int, str]]
+        visited_maps: Set[str]
+
+        Returns
+        -------
+        List[Union[int, str]]
+        """
+        map_level = []
+        for map_id in linked_maps:
+            if str(map_id) not in visited_maps:
+                visited_maps.add(str(map_id))
+                map_level.append(map_id)
+        return map_level
+
+    def _memoize_map_tree(
+        self,
+        campground: CampgroundFacility,
+        resources: Dict[Union[int, str], Dict[str, Any]],
+    ) -> None:
+        """
+        Remember Which Maps of a Campground Hold Resources
+
+        Parameters
+        ----------
+        campground: CampgroundFacility
+        resources: Dict[Union[int, str], Dict[str, Any]]
+        """
+        self._map_trees[self._get_map_tree_key(campground=campground)] = [
+            map_id for map_id, map_resources in resources.items() if map_resources
+        ]
+
+    @classmethod
+    def _get_map_tree_key(cls, campground: CampgroundFacility) -> Tuple[str, str, str]:
+        """
+        Key of the Memoized Map Tree of a Campground
+
+        Parameters
+        ----------
+        campground: CampgroundFacility
+
+        Returns
+        -------
+        Tuple[str, str, str]
+        """
+        return (
+            str(campground.recreation_area_id),
+            str(campground.facility_id),
+            str(campground.map_id),
+        )
+
     def list_equipment_types(self, rec_area_id: int) -> Dict[str, int]:
         """
         List equipment types available for a recreation area
@@ -491,18 +1025,124 @@ class GoingToCamp(BaseProvider):
         start_date: datetime.date,
         end_date: datetime.date,
         equipment_type_id: Optional[str],
+        workers: int = 1,
     ) -> List[AvailableResource]:
         """
         Retrieve the Availability for all Sites in a Camp Area
 
         Sites are filtered on the provided date range and compatible
-        equipment.
+        equipment. The first search of a campground crawls its whole map tree,
+        later searches fetch only the maps known to hold sites, concurrently.
+
+        Returns
+        -------
+        available_sites: List[AvailableResource]
+            The list of available sites
+        """
+        return self.coalesce_request(
+            key=(
+                *self._get_map_tree_key(campground),
+                start_date,
+                end_date,
+                equipment_type_id,
+            ),
+            func=self._fetch_site_availability,
+            campground=campground,
+            start_date=start_date,
+            end_date=end_date,
+            equipment_type_id=equipment_type_id,
+            workers=workers,
+        )
+
+    def _fetch_site_availability(
+        self,
+        campground: CampgroundFacility,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        equipment_type_id: Optional[str],
+        workers: int = 1,
+    ) -> List[AvailableResource]:
+        """
+        Crawl a Camp Area's Maps for the Availability of its Sites
 
         Returns
         -------
         available_sites: List[AvailableResource]
             The list of available sites
         """
+        search_filter = self._get_site_search_filter(
+            campground=campground,
+            start_date=start_date,
+            end_date=end_date,
+            equipment_type_id=equipment_type_id,
+        )
+        resource_maps = self._map_trees.get(self._get_map_tree_key(campground))
+        resources = {}
+        if resource_maps:
+            resources, _ = self._find_map_resources(
+                rec_area_id=campground.recreation_area_id,
+                search_filter=search_filter,
+                map_ids=resource_maps,
+                workers=workers,
+            )
+        if not any(resources.values()):
+            resources = self._crawl_campground_maps(
+                campground=campground, search_filter=search_filter, workers=workers
+            )
+        return self._get_available_resources(resources=resources)
+
+    async def list_site_availability_async(
+        self,
+        campground: CampgroundFacility,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        equipment_type_id: Optional[str],
+    ) -> List[AvailableResource]:
+        """
+        Retrieve the Availability for all Sites in a Camp Area - From an Event Loop
+
+        Every map of a level of the map tree is requested at once.
+
+        Returns
+        -------
+        available_sites: List[AvailableResource]
+            The list of available sites
+        """
+        search_filter = self._get_site_search_filter(
+            campground=campground,
+            start_date=start_date,
+            end_date=end_date,
+            equipment_type_id=equipment_type_id,
+        )
+        resource_maps = self._map_trees.get(self._get_map_tree_key(campground))
+        resources = {}
+        if resource_maps:
+            resources, _ = await self._find_map_resources_async(
+                rec_area_id=campground.recreation_area_id,
+                search_filter=search_filter,
+                map_ids=resource_maps,
+            )
+        if not any(resources.values()):
+            resources = await self._crawl_campground_maps_async(
+                campground=campground, search_filter=search_filter
+            )
+        return self._get_available_resources(resources=resources)
+
+    @classmethod
+    def _get_site_search_filter(
+        cls,
+        campground: CampgroundFacility,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        equipment_type_id: Optional[str],
+    ) -> Dict[str, Any]:
+        """
+        Get the MAPDATA Search Filter of a Campground
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
         search_filter = {
             "mapId": campground.map_id,
             "resourceLocationId": campground.facility_id,
@@ -518,19 +1158,23 @@ class GoingToCamp(BaseProvider):
         }
         if equipment_type_id:
             search_filter["subEquipmentCategoryId"] = equipment_type_id
+        return search_filter
 
-        resources, additional_resources = self._find_matching_resources(
-            campground.recreation_area_id, search_filter
-        )
+    @classmethod
+    def _get_available_resources(
+        cls, resources: Dict[Union[int, str], Dict[str, Any]]
+    ) -> List[AvailableResource]:
+        """
+        Get the Available Sites of Every Map
 
-        # Resources are often deeply nested; fetch nested resources
-        for map_id in additional_resources:
-            search_filter["mapId"] = map_id
-            avail, _ = self._find_matching_resources(
-                campground.recreation_area_id, search_filter
-            )
-            resources.update(avail)
+        Parameters
+        ----------
+        resources: Dict[Union[int, str], Dict[str, Any]]
 
+        Returns
+        -------
+        List[AvailableResource]
+        """
         availabilities = []
         for map_id, resource_details in resources.items():
             for resource_id, availability_details in resource_details.items():
@@ -2,30 +2,64 @@
 Campsite Searching: Recreation.gov
 """
 
-import json
 import logging
+import weakref
+from calendar import monthrange
 from datetime import datetime, timedelta
 from itertools import chain
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import pandas as pd
-import requests
 
 from camply.config import RecreationBookingConfig, RIDBConfig
 from camply.containers import AvailableCampsite
 from camply.containers.api_responses import (
-    CampsiteAvailabilityResponse,
     CampsiteResponse,
     RecDotGovCampsite,
     RecDotGovCampsiteResponse,
+    _CampsiteAvailabilityCampsiteResponse,
+    parse_unaware_datetime,
+)
+from camply.containers.availability_batch import AvailabilityBatch, AvailabilitySnapshot
+from camply.containers.availability_filter import AvailabilityFilter
+from camply.containers.base_container import (
+    CamplyModel,
+    RecDotGovAttribute,
+    RecDotGovEquipment,
 )
 from camply.containers.data_containers import CampsiteLocation
 from camply.providers.recreation_dot_gov.recdotgov_provider import RecreationDotGovBase
-from camply.utils import api_utils
 
 logger = logging.getLogger(__name__)
 
 
+class CampsiteMetadata(NamedTuple):
+    """
+    Equipment, Attributes and Location Shared by Every Night of a Campsite
+
+    The models are built once per campsite and every nightly availability,
+    including the `AvailableCampsite` objects built from them, holds these
+    same instances. Equipment and attributes are tuples so they can't be
+    extended or reordered through a single night, and the models themselves
+    must not be modified.
+    """
+
+    permitted_equipment: Optional[Tuple[RecDotGovEquipment, ...]]
+    campsite_attributes: Optional[Tuple[RecDotGovAttribute, ...]]
+    location: Optional[CampsiteLocation]
+
+
 class RecreationDotGov(RecreationDotGovBase):
     """
     Recreation.gov: Campsite Searcher
@@ -38,6 +72,9 @@ class RecreationDotGov(RecreationDotGovBase):
     api_base_path = RecreationBookingConfig.API_BASE_PATH
     api_search_result_class = RecDotGovCampsite
     api_search_result_key = "campsite_id"
+    _metadata_indexes: Dict[
+        int, Tuple[Callable[[], Optional[pd.DataFrame]], Dict[Any, CampsiteMetadata]]
+    ] = {}
 
     def paginate_recdotgov_campsites(
         self, facility_id: int, equipment: Optional[List[str]] = None
@@ -45,46 +82,60 @@ class RecreationDotGov(RecreationDotGovBase):
         """
         Paginate through the RecDotGov Campsite Metadata
         """
-        results = 0
-        continue_paginate = True
-        endpoint_url = api_utils.generate_url(
-            scheme=RecreationBookingConfig.API_SCHEME,
-            netloc=RecreationBookingConfig.API_NET_LOC,
-            path="api/search/campsites",
+        campsites, _ = self._paginate_recdotgov_campsites(
+            facility_id=facility_id, equipment=equipment
         )
+        return campsites
+
+    def _paginate_recdotgov_campsites(
+        self,
+        facility_id: int,
+        equipment: Optional[List[str]] = None,
+        validators: Optional[Dict[str, Optional[str]]] = None,
+        workers: int = 1,
+    ) -> Tuple[Optional[List[RecDotGovCampsite]], Dict[str, Optional[str]]]:
+        """
+        Paginate through the RecDotGov Campsite Metadata - Conditionally
+
+        Parameters
+        ----------
+        facility_id: int
+        equipment: Optional[List[str]]
+        validators: Optional[Dict[str, Optional[str]]]
+            `ETag` / `Last-Modified` validators of a previous response
+        workers: int
+            Number of pages to fetch concurrently
+
+        Returns
+        -------
+        Tuple[Optional[List[RecDotGovCampsite]], Dict[str, Optional[str]]]
+            The campsites (None if unchanged since `validators`) and the
+            validators of the new response
+        """
         fq_list = [f"asset_id:{facility_id}"]
         if isinstance(equipment, list) and len(equipment) > 0:
             for item in equipment:
                 fq_list.append(f"campsite_equipment_name:{item}")
         params = {
-            "start": 0,
-            "size": 1000,
             "fq": fq_list,
             "include_non_site_specific_campsites": True,
         }
-        campsites: List[RecDotGovCampsite] = []
-        while continue_paginate is True:
-            response = self.make_recdotgov_request_retry(
-                method="GET",
-                url=endpoint_url,
-                params=params,
-            )
-            returned_data = json.loads(response.content)
-            campsite_response = RecDotGovCampsiteResponse(**returned_data)
-            campsites += campsite_response.campsites
-            results += campsite_response.size
-            params.update(start=results)
-            if results == campsite_response.total:
-                continue_paginate = False
-        return campsites
+        return self._paginate_recdotgov_search(
+            path="api/search/campsites",
+            params=params,
+            response_class=RecDotGovCampsiteResponse,
+            results_field="campsites",
+            validators=validators,
+            workers=workers,
+        )
 
-    def make_recdotgov_availability_request(
+    def get_availability_request(
         self,
         campground_id: int,
         month: datetime,
-    ) -> requests.Response:
+    ) -> Tuple[str, Dict[str, Any]]:
         """
-        Make a request to the RecreationDotGov API
+        Get the URL and Query Parameters of an Availability Request
 
         Parameters
         ----------
@@ -93,18 +144,14 @@ class RecreationDotGov(RecreationDotGovBase):
 
         Returns
         -------
-        requests.Response
+        Tuple[str, Dict[str, Any]]
         """
         api_endpoint = self._rec_availability_get_endpoint(
             path=f"{campground_id}/{RecreationBookingConfig.API_MONTH_PATH}"
         )
         formatted_month = month.strftime("%Y-%m-01T00:00:00.000Z")
         query_params = {"start_date": formatted_month}
-        return self.make_recdotgov_request(
-            method="GET",
-            url=api_endpoint,
-            params=query_params,
-        )
+        return api_endpoint, query_params
 
     @classmethod
     def _items_to_unique_dicts(
@@ -152,6 +199,79 @@ class RecreationDotGov(RecreationDotGovBase):
         attributes = cls._items_to_unique_dicts(item=attributes)
         return equipment, attributes, location
 
+    @classmethod
+    def _construct_models(cls, items: Any, model: Type[CamplyModel]) -> Any:
+        """
+        Build the Shared Equipment / Attribute Models of a Campsite
+
+        Parameters
+        ----------
+        items: Any
+            Equipment / attribute dictionaries, anything other than a list
+            (i.e. missing metadata) is returned unchanged
+        model: Type[CamplyModel]
+
+        Returns
+        -------
+        Any
+        """
+        if not isinstance(items, list):
+            return items
+        return tuple(
+            model.construct(**item) if isinstance(item, dict) else item
+            for item in items
+        )
+
+    @classmethod
+    def _get_campsite_metadata(
+        cls, campsite_id: Any, campsite_metadata: pd.DataFrame
+    ) -> CampsiteMetadata:
+        """
+        Get the Interned Metadata of a Campsite
+
+        The metadata of each campsite is looked up in the DataFrame once and
+        kept for as long as the DataFrame itself is.
+
+        Parameters
+        ----------
+        campsite_id: Any
+        campsite_metadata: pd.DataFrame
+            Metadata Fetched from the Recreation.gov API about the Campsites
+
+        Returns
+        -------
+        CampsiteMetadata
+        """
+        index_key = id(campsite_metadata)
+        reference, metadata_index = cls._metadata_indexes.get(index_key, (None, None))
+        if reference is None or reference() is not campsite_metadata:
+            metadata_index = {}
+            reference = weakref.ref(
+                campsite_metadata,
+                lambda _: cls._metadata_indexes.pop(index_key, None),
+            )
+            cls._metadata_indexes[index_key] = (reference, metadata_index)
+        metadata = metadata_index.get(campsite_id)
+        if metadata is None:
+            (
+                equipment,
+                attributes,
+                location,
+            ) = cls._get_equipment_attributes_location(
+                campsite_id=campsite_id, campsite_metadata=campsite_metadata
+            )
+            metadata = CampsiteMetadata(
+                permitted_equipment=cls._construct_models(
+                    items=equipment, model=RecDotGovEquipment
+                ),
+                campsite_attributes=cls._construct_models(
+                    items=attributes, model=RecDotGovAttribute
+                ),
+                location=location,
+            )
+            metadata_index[campsite_id] = metadata
+        return metadata
+
     @classmethod
     def process_campsite_availability(
         cls,
@@ -188,49 +308,346 @@ class RecreationDotGov(RecreationDotGovBase):
         total_campsite_availability: List[Optional[AvailableCampsite]]
             Any monthly availabilities
         """
-        total_campsite_availability: List[Optional[AvailableCampsite]] = []
-        campsite_data = CampsiteAvailabilityResponse(**availability)
-        for campsite_id, site_related_data in campsite_data.campsites.items():
-            for (
-                matching_date,
-                availability_status,
-            ) in site_related_data.availabilities.items():
-                if (
-                    availability_status
-                    not in RecreationBookingConfig.CAMPSITE_UNAVAILABLE_STRINGS
-                ):
-                    booking_url = (
-                        f"{RecreationBookingConfig.CAMPSITE_BOOKING_URL}/{campsite_id}"
-                    )
-                    (
-                        equipment,
-                        attributes,
-                        location,
-                    ) = cls._get_equipment_attributes_location(
-                        campsite_id=campsite_id, campsite_metadata=campsite_metadata
-                    )
-                    available_campsite = AvailableCampsite(
+        campsite_batch = cls.process_campsite_availability_batch(
+            availability=availability,
+            recreation_area=recreation_area,
+            recreation_area_id=recreation_area_id,
+            facility_name=facility_name,
+            facility_id=facility_id,
+            month=month,
+            campsite_metadata=campsite_metadata,
+        )
+        return campsite_batch.to_campsites()
+
+    @classmethod
+    def process_campsite_availability_batch(
+        cls,
+        availability: Dict[str, Any],
+        recreation_area: str,
+        recreation_area_id: int,
+        facility_name: str,
+        facility_id: int,
+        month: datetime,
+        campsite_metadata: pd.DataFrame,
+        availability_filter: Optional[AvailabilityFilter] = None,
+    ) -> AvailabilityBatch:
+        """
+        Parse the JSON Response into a Columnar Batch of Availabilities
+
+        Availabilities are streamed into the batch as plain values, no
+        `AvailableCampsite` is created until a search reports them.
+
+        Parameters
+        ----------
+        availability: Dict[str, Any]
+            API Response
+        recreation_area: str
+            Name of Recreation Area
+        recreation_area_id: int
+            ID of Recreation Area
+        facility_name: str
+            Campground Facility Name
+        facility_id: int
+            Campground Facility ID
+        month: datetime
+            Month to Process
+        campsite_metadata: pd.DataFrame
+            Metadata Fetched from the Recreation.gov API about the Campsites
+        availability_filter: Optional[AvailabilityFilter]
+            Search days and minimum stay, nights that can't match are skipped
+
+        Returns
+        -------
+        AvailabilityBatch
+            Any monthly availabilities
+        """
+        return AvailabilityBatch.from_fields(
+            cls.iter_campsite_availability(
+                availability=availability,
+                recreation_area=recreation_area,
+                recreation_area_id=recreation_area_id,
+                facility_name=facility_name,
+                facility_id=facility_id,
+                month=month,
+                campsite_metadata=campsite_metadata,
+                availability_filter=availability_filter,
+            )
+        )
+
+    def process_campsite_availability_changes(
+        self,
+        availability: Dict[str, Any],
+        previous: Optional[AvailabilitySnapshot],
+        recreation_area: str,
+        recreation_area_id: int,
+        facility_name: str,
+        facility_id: int,
+        month: datetime,
+        campsite_metadata: pd.DataFrame,
+        availability_filter: Optional[AvailabilityFilter] = None,
+    ) -> AvailabilitySnapshot:
+        """
+        Process a Payload Incrementally, Given the Snapshot of the Previous One
+
+        An unchanged payload reuses the previous snapshot as is. Otherwise the
+        raw availability of each campsite is compared to the previous payload
+        and only the campsites whose availability changed are parsed again.
+        Search days only ever shrink, so the nights of reused campsites are
+        still a superset of what the search needs.
+
+        Parameters
+        ----------
+        availability: Dict[str, Any]
+            API Response
+        previous: Optional[AvailabilitySnapshot]
+            Snapshot of the previous payload of the same facility and month
+        recreation_area: str
+            Name of Recreation Area
+        recreation_area_id: int
+            ID of Recreation Area
+        facility_name: str
+            Campground Facility Name
+        facility_id: int
+            Campground Facility ID
+        month: datetime
+            Month to Process
+        campsite_metadata: pd.DataFrame
+            Metadata Fetched from the Recreation.gov API about the Campsites
+        availability_filter: Optional[AvailabilityFilter]
+            Search days and minimum stay, nights that can't match are skipped
+
+        Returns
+        -------
+        AvailabilitySnapshot
+        """
+        if previous is not None and previous.is_current(payload=availability):
+            return previous
+        previous_parts = previous.parts if previous is not None else {}
+        parts: Dict[str, Tuple[Any, AvailabilityBatch]] = {}
+        changed_campsites = 0
+        searched_timestamps: Dict[str, bool] = {}
+        for campsite_id, campsite_payload in availability.get("campsites", {}).items():
+            previous_part = previous_parts.get(campsite_id)
+            if previous_part is not None and previous_part[0] == campsite_payload:
+                parts[campsite_id] = previous_part
+                continue
+            changed_campsites += 1
+            parts[campsite_id] = (
+                campsite_payload,
+                AvailabilityBatch.from_fields(
+                    self._iter_campsite_nights(
                         campsite_id=campsite_id,
-                        booking_date=matching_date,
-                        booking_end_date=matching_date + timedelta(days=1),
-                        booking_nights=1,
-                        campsite_site_name=site_related_data.site,
-                        campsite_loop_name=site_related_data.loop,
-                        campsite_type=site_related_data.campsite_type,
-                        campsite_occupancy=(
-                            site_related_data.min_num_people,
-                            site_related_data.max_num_people,
-                        ),
-                        campsite_use_type=site_related_data.type_of_use,
-                        availability_status=availability_status,
+                        campsite_payload=campsite_payload,
                         recreation_area=recreation_area,
                         recreation_area_id=recreation_area_id,
                         facility_name=facility_name,
                         facility_id=facility_id,
-                        booking_url=booking_url,
-                        permitted_equipment=equipment,
-                        campsite_attributes=attributes,
-                        location=location,
+                        month=month,
+                        campsite_metadata=campsite_metadata,
+                        availability_filter=availability_filter,
+                        searched_timestamps=searched_timestamps,
                     )
-                    total_campsite_availability.append(available_campsite)
-        return total_campsite_availability
+                ),
+            )
+        logger.debug(
+            "%s of %s campsites changed: %s, %s",
+            changed_campsites,
+            len(parts),
+            facility_id,
+            month,
+        )
+        return AvailabilitySnapshot.from_parts(payload=availability, parts=parts)
+
+    @classmethod
+    def iter_campsite_availability(
+        cls,
+        availability: Dict[str, Any],
+        recreation_area: str,
+        recreation_area_id: int,
+        facility_name: str,
+        facility_id: int,
+        month: datetime,
+        campsite_metadata: pd.DataFrame,
+        availability_filter: Optional[AvailabilityFilter] = None,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Stream the Bookable Nights of a Payload, Campsite by Campsite
+
+        Parameters
+        ----------
+        availability: Dict[str, Any]
+            API Response
+        recreation_area: str
+        recreation_area_id: int
+        facility_name: str
+        facility_id: int
+        month: datetime
+        campsite_metadata: pd.DataFrame
+        availability_filter: Optional[AvailabilityFilter]
+            Search days and minimum stay, nights that can't match are skipped
+
+        Yields
+        ------
+        Dict[str, Any]
+            `AvailableCampsite` field values of each bookable night
+        """
+        searched_timestamps: Dict[str, bool] = {}
+        for campsite_id, campsite_payload in availability["campsites"].items():
+            yield from cls._iter_campsite_nights(
+                campsite_id=campsite_id,
+                campsite_payload=campsite_payload,
+                recreation_area=recreation_area,
+                recreation_area_id=recreation_area_id,
+                facility_name=facility_name,
+                facility_id=facility_id,
+                month=month,
+                campsite_metadata=campsite_metadata,
+                availability_filter=availability_filter,
+                searched_timestamps=searched_timestamps,
+            )
+
+    @classmethod
+    def _iter_campsite_nights(
+        cls,
+        campsite_id: Union[int, str],
+        campsite_payload: Dict[str, Any],
+        recreation_area: str,
+        recreation_area_id: int,
+        facility_name: str,
+        facility_id: int,
+        month: datetime,
+        campsite_metadata: pd.DataFrame,
+        availability_filter: Optional[AvailabilityFilter] = None,
+        searched_timestamps: Optional[Dict[str, bool]] = None,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Stream the Bookable Nights of a Single Campsite's Payload
+
+        Unavailable and unsearched nights are dropped from the raw payload
+        before the rest of it is decoded.
+
+        Parameters
+        ----------
+        campsite_id: Union[int, str]
+        campsite_payload: Dict[str, Any]
+            Raw availability of the campsite
+        recreation_area: str
+        recreation_area_id: int
+        facility_name: str
+        facility_id: int
+        month: datetime
+        campsite_metadata: pd.DataFrame
+        availability_filter: Optional[AvailabilityFilter]
+        searched_timestamps: Optional[Dict[str, bool]]
+            Whether each raw timestamp is searched, shared by the campsites of
+            a payload so each timestamp is only parsed once
+
+        Yields
+        ------
+        Dict[str, Any]
+            `AvailableCampsite` field values of each bookable night
+        """
+        availabilities = cls._filter_raw_availabilities(
+            availabilities=campsite_payload.get("availabilities"),
+            availability_filter=availability_filter,
+            searched_timestamps=(
+                searched_timestamps if searched_timestamps is not None else {}
+            ),
+        )
+        if availabilities is not None:
+            campsite_payload = {**campsite_payload, "availabilities": availabilities}
+        campsite_id = int(campsite_id)
+        site_related_data = _CampsiteAvailabilityCampsiteResponse.from_payload(
+            campsite_payload
+        )
+        nights = (
+            (matching_date, availability_status)
+            for matching_date, availability_status in (
+                site_related_data.availabilities.items()
+            )
+            if availability_status
+            not in RecreationBookingConfig.CAMPSITE_UNAVAILABLE_STRINGS
+        )
+        if availability_filter is not None:
+            nights = availability_filter.filter_nights(
+                nights=nights,
+                first_night=month.replace(day=1),
+                last_night=month.replace(day=monthrange(month.year, month.month)[1]),
+            )
+        booking_url = f"{RecreationBookingConfig.CAMPSITE_BOOKING_URL}/{campsite_id}"
+        metadata: Optional[CampsiteMetadata] = None
+        for matching_date, availability_status in nights:
+            if metadata is None:
+                metadata = cls._get_campsite_metadata(
+                    campsite_id=campsite_id, campsite_metadata=campsite_metadata
+                )
+            yield {
+                "campsite_id": campsite_id,
+                "booking_date": matching_date,
+                "booking_end_date": matching_date + timedelta(days=1),
+                "booking_nights": 1,
+                "campsite_site_name": site_related_data.site,
+                "campsite_loop_name": site_related_data.loop,
+                "campsite_type": site_related_data.campsite_type,
+                "campsite_occupancy": (
+                    site_related_data.min_num_people,
+                    site_related_data.max_num_people,
+                ),
+                "campsite_use_type": site_related_data.type_of_use,
+                "availability_status": availability_status,
+                "recreation_area": recreation_area,
+                "recreation_area_id": recreation_area_id,
+                "facility_name": facility_name,
+                "facility_id": facility_id,
+                "booking_url": booking_url,
+                "permitted_equipment": metadata.permitted_equipment,
+                "campsite_attributes": metadata.campsite_attributes,
+                "location": metadata.location,
+            }
+
+    @classmethod
+    def _filter_raw_availabilities(
+        cls,
+        availabilities: Any,
+        availability_filter: Optional[AvailabilityFilter],
+        searched_timestamps: Dict[str, bool],
+    ) -> Optional[Dict[Any, Any]]:
+        """
+        Drop Unavailable and Unsearched Nights From a Raw Payload
+
+        Values that don't look like the API's are left for validation.
+
+        Parameters
+        ----------
+        availabilities: Any
+            Raw availabilities of a campsite, keyed by timestamp
+        availability_filter: Optional[AvailabilityFilter]
+        searched_timestamps: Dict[str, bool]
+            Whether each timestamp is searched, filled in as they're parsed
+
+        Returns
+        -------
+        Optional[Dict[Any, Any]]
+            None when the availabilities can't be filtered
+        """
+        if availabilities.__class__ is not dict:
+            return None
+        unavailable = RecreationBookingConfig.CAMPSITE_UNAVAILABLE_STRINGS
+        filtered = {}
+        for timestamp, status in availabilities.items():
+            if status.__class__ is str and status.strip() in unavailable:
+                continue
+            if availability_filter is not None:
+                searched = searched_timestamps.get(timestamp)
+                if searched is None:
+                    try:
+                        night = parse_unaware_datetime(timestamp)
+                    except (TypeError, ValueError):
+                        searched = True
+                    else:
+                        searched = availability_filter.includes(night)
+                    searched_timestamps[timestamp] = searched
+                if searched is False:
+                    continue
+            filtered[timestamp] = status
+        return filtered
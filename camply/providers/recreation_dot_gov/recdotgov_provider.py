@@ -2,23 +2,32 @@
 Recreation.gov Web Searching Utilities
 """
 
+import asyncio
+import hashlib
 import json
 import logging
+import pathlib
+import threading
 from abc import ABC, abstractmethod
 from base64 import b64decode
-from datetime import datetime
-from json import loads
+from datetime import datetime, timedelta
+from itertools import chain
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
 from urllib import parse
 
 import pandas as pd
-import ratelimit
 import requests
 import tenacity
 from fake_useragent import UserAgent
 from pydantic import ValidationError
+from requests.adapters import HTTPAdapter
 
-from camply.config import STANDARD_HEADERS, RecreationBookingConfig, RIDBConfig
+from camply.config import (
+    STANDARD_HEADERS,
+    FileConfig,
+    RecreationBookingConfig,
+    RIDBConfig,
+)
 from camply.containers import CampgroundFacility, RecreationArea
 from camply.containers.api_responses import (
     CampsiteResponse,
@@ -29,10 +38,15 @@ from camply.containers.api_responses import (
     RecreationAreaResponse,
     TourResponse,
 )
+from camply.containers.availability_batch import AvailabilityBatch, AvailabilitySnapshot
+from camply.containers.availability_filter import AvailabilityFilter
 from camply.containers.base_container import CamplyModel
 from camply.containers.data_containers import ListedCampsite
 from camply.providers.base_provider import BaseProvider, ProviderSearchError
 from camply.utils import api_utils
+from camply.utils.concurrency import map_concurrently
+from camply.utils.disk_cache import DiskCache
+from camply.utils.json_decoding import loads
 from camply.utils.logging_utils import log_sorted_response
 
 logger = logging.getLogger(__name__)
@@ -43,6 +57,13 @@ class RecreationDotGovBase(BaseProvider, ABC):
     Python Class for Working with Recreation.gov API / NPS APIs
     """
 
+    RATE_LIMIT_CONFIG = RecreationBookingConfig
+
+    _recdotgov_session: Optional[requests.Session] = None
+    _recdotgov_session_lock = threading.Lock()
+
+    __offline_cache_dir__: Optional[pathlib.Path] = None
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize with Search Dates
@@ -60,6 +81,9 @@ class RecreationDotGovBase(BaseProvider, ABC):
         }
         _user_agent = UserAgent(browsers=["chrome"]).random
         self._user_agent = {"User-Agent": _user_agent}
+        self._availability_payloads: Dict[
+            Tuple[int, datetime], Tuple[bytes, Union[dict, list]]
+        ] = {}
 
     @property
     @abstractmethod
@@ -371,9 +395,11 @@ class RecreationDotGovBase(BaseProvider, ABC):
         api_endpoint = self._ridb_get_endpoint(path=path)
         headers = self.headers.copy()
         headers.update(self._ridb_api_headers)
+        self.acquire_rate_limit(url=api_endpoint)
         response = self.session.get(
             url=api_endpoint, headers=headers, params=params, timeout=30
         )
+        self.report_rate_limit(url=api_endpoint, response=response)
         if response.ok is False:
             error_message = (
                 f"Receiving bad data from Recreation.gov API: {response.text}"
@@ -556,8 +582,44 @@ class RecreationDotGovBase(BaseProvider, ABC):
         return endpoint_url
 
     @classmethod
-    @ratelimit.sleep_and_retry
-    @ratelimit.limits(calls=3, period=1)
+    def get_recdotgov_session(cls) -> requests.Session:
+        """
+        Get the Shared, Pooled Session Used for Recreation.gov Requests
+
+        The session (and its User-Agent) is created once and then shared by every
+        provider instance and thread, so connections are kept alive and re-used.
+
+        Returns
+        -------
+        requests.Session
+        """
+        with RecreationDotGovBase._recdotgov_session_lock:
+            if RecreationDotGovBase._recdotgov_session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=RecreationBookingConfig.POOL_CONNECTIONS,
+                    pool_maxsize=RecreationBookingConfig.POOL_SIZE,
+                )
+                session = requests.Session()
+                session.mount(prefix="https://", adapter=adapter)
+                session.mount(prefix="http://", adapter=adapter)
+                session.headers.update(STANDARD_HEADERS)
+                session.headers.update(RecreationBookingConfig.API_REFERRERS)
+                session.headers["User-Agent"] = UserAgent(browsers=["chrome"]).random
+                RecreationDotGovBase._recdotgov_session = session
+            return RecreationDotGovBase._recdotgov_session
+
+    @classmethod
+    def rotate_recdotgov_user_agent(cls) -> None:
+        """
+        Pick a New User-Agent for the Shared Recreation.gov Session
+        """
+        session = cls.get_recdotgov_session()
+        with RecreationDotGovBase._recdotgov_session_lock:
+            user_agent = UserAgent(browsers=["chrome"]).random
+            session.headers["User-Agent"] = user_agent
+        logger.debug("Rotated Recreation.gov User-Agent: %s", user_agent)
+
+    @classmethod
     def make_recdotgov_request(
         cls,
         url: str,
@@ -578,14 +640,14 @@ class RecreationDotGovBase(BaseProvider, ABC):
         -------
         requests.Response
         """
-        # BUILD THE HEADERS EXPECTED FROM THE API
-        user_agent = {"User-Agent": UserAgent(browsers=["chrome"]).random}
-        headers = STANDARD_HEADERS.copy()
-        headers.update(user_agent)
-        headers.update(RecreationBookingConfig.API_REFERRERS)
-        response = requests.request(
-            method=method, url=url, headers=headers, params=params, timeout=30, **kwargs
+        session = cls.get_recdotgov_session()
+        cls.acquire_rate_limit(url=url)
+        response = session.request(
+            method=method, url=url, params=params, timeout=30, **kwargs
         )
+        cls.report_rate_limit(url=url, response=response)
+        if response.status_code in RecreationBookingConfig.BLOCKED_STATUS_CODES:
+            cls.rotate_recdotgov_user_agent()
         return response
 
     @classmethod
@@ -619,17 +681,71 @@ class RecreationDotGovBase(BaseProvider, ABC):
         response.raise_for_status()
         return response
 
-    @tenacity.retry(
-        wait=tenacity.wait_random_exponential(multiplier=3, max=1800),
-        stop=tenacity.stop.stop_after_delay(6000),
-    )
-    def _make_recdotgov_availability_request(
+    @classmethod
+    async def make_recdotgov_request_async(
+        cls,
+        url: str,
+        method: str = "GET",
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Make a Raw Request to RecreationDotGov - From an Event Loop
+
+        The shared rate limit is awaited on the event loop and only the request
+        itself runs in a worker thread, on the shared session.
+
+        Parameters
+        ----------
+        url: str
+        method: str
+        params: Optional[Dict[str, Any]]
+
+        Returns
+        -------
+        requests.Response
+        """
+        session = cls.get_recdotgov_session()
+        await cls.acquire_rate_limit_async(url=url)
+        response = await asyncio.to_thread(
+            session.request,
+            method=method,
+            url=url,
+            params=params,
+            timeout=30,
+            **kwargs,
+        )
+        cls.report_rate_limit(url=url, response=response)
+        if response.status_code in RecreationBookingConfig.BLOCKED_STATUS_CODES:
+            cls.rotate_recdotgov_user_agent()
+        return response
+
+    @abstractmethod
+    def get_availability_request(
+        self,
+        campground_id: int,
+        month: datetime,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Get the URL and Query Parameters of an Availability Request
+
+        Parameters
+        ----------
+        campground_id
+        month
+
+        Returns
+        -------
+        Tuple[str, Dict[str, Any]]
+        """
+
+    def make_recdotgov_availability_request(
         self,
         campground_id: int,
         month: datetime,
     ) -> requests.Response:
         """
-        Make a request to the RecreationDotGov API - Handle Exponential Backoff
+        Make a request to the RecreationDotGov API
 
         Parameters
         ----------
@@ -640,7 +756,56 @@ class RecreationDotGovBase(BaseProvider, ABC):
         -------
         requests.Response
         """
-        response = self.make_recdotgov_availability_request(campground_id, month)
+        api_endpoint, query_params = self.get_availability_request(
+            campground_id=campground_id, month=month
+        )
+        return self.make_recdotgov_request(
+            method="GET",
+            url=api_endpoint,
+            params=query_params,
+        )
+
+    async def make_recdotgov_availability_request_async(
+        self,
+        campground_id: int,
+        month: datetime,
+    ) -> requests.Response:
+        """
+        Make a request to the RecreationDotGov API - From an Event Loop
+
+        Parameters
+        ----------
+        campground_id
+        month
+
+        Returns
+        -------
+        requests.Response
+        """
+        api_endpoint, query_params = self.get_availability_request(
+            campground_id=campground_id, month=month
+        )
+        return await self.make_recdotgov_request_async(
+            method="GET",
+            url=api_endpoint,
+            params=query_params,
+        )
+
+    @classmethod
+    def _check_availability_response(
+        cls, response: requests.Response
+    ) -> requests.Response:
+        """
+        Raise a ConnectionError, to be Retried, on Bad Availability Responses
+
+        Parameters
+        ----------
+        response: requests.Response
+
+        Returns
+        -------
+        requests.Response
+        """
         if response.ok is True:
             return response
         else:
@@ -650,6 +815,30 @@ class RecreationDotGovBase(BaseProvider, ABC):
             logger.debug(f"Error Details: {response_error}")
             raise ConnectionError(f"{error_message}: {response_error}")
 
+    @tenacity.retry(
+        wait=tenacity.wait_random_exponential(multiplier=3, max=1800),
+        stop=tenacity.stop.stop_after_delay(6000),
+    )
+    def _make_recdotgov_availability_request(
+        self,
+        campground_id: int,
+        month: datetime,
+    ) -> requests.Response:
+        """
+        Make a request to the RecreationDotGov API - Handle Exponential Backoff
+
+        Parameters
+        ----------
+        campground_id
+        month
+
+        Returns
+        -------
+        requests.Response
+        """
+        response = self.make_recdotgov_availability_request(campground_id, month)
+        return self._check_availability_response(response=response)
+
     def get_recdotgov_data(
         self, campground_id: int, month: datetime
     ) -> Union[dict, list]:
@@ -663,6 +852,28 @@ class RecreationDotGovBase(BaseProvider, ABC):
         month: datetime
             datetime object, results will be filtered to month
 
+        Returns
+        -------
+        Union[dict, list]
+        """
+        return self.coalesce_request(
+            key=(campground_id, month),
+            func=self._fetch_recdotgov_data,
+            campground_id=campground_id,
+            month=month,
+        )
+
+    def _fetch_recdotgov_data(
+        self, campground_id: int, month: datetime
+    ) -> Union[dict, list]:
+        """
+        Request and Parse Campsite Availability Data
+
+        Parameters
+        ----------
+        campground_id: int
+        month: datetime
+
         Returns
         -------
         Union[dict, list]
@@ -676,7 +887,175 @@ class RecreationDotGovBase(BaseProvider, ABC):
                 "Something went wrong in fetching data from the "
                 "RecreationDotGov API."
             ) from re
-        return loads(response.content)
+        return self._load_availability_payload(
+            campground_id=campground_id, month=month, content=response.content
+        )
+
+    async def get_recdotgov_data_async(
+        self, campground_id: int, month: datetime
+    ) -> Union[dict, list]:
+        """
+        Find Campsite Availability Data - From an Event Loop
+
+        Retries follow the same exponential backoff as `get_recdotgov_data`,
+        but the waiting happens on the event loop.
+
+        Parameters
+        ----------
+        campground_id: int
+            Campground ID from the RIDB API. Can also be pulled of URLs on Recreation.gov
+        month: datetime
+            datetime object, results will be filtered to month
+
+        Returns
+        -------
+        Union[dict, list]
+        """
+        retryer = tenacity.AsyncRetrying(
+            wait=tenacity.wait_random_exponential(multiplier=3, max=1800),
+            stop=tenacity.stop.stop_after_delay(6000),
+        )
+        try:
+            async for attempt in retryer:
+                with attempt:
+                    response = await self.make_recdotgov_availability_request_async(
+                        campground_id=campground_id, month=month
+                    )
+                    self._check_availability_response(response=response)
+        except tenacity.RetryError as re:
+            raise RuntimeError(
+                "Something went wrong in fetching data from the "
+                "RecreationDotGov API."
+            ) from re
+        return self._load_availability_payload(
+            campground_id=campground_id, month=month, content=response.content
+        )
+
+    def _load_availability_payload(
+        self, campground_id: int, month: datetime, content: bytes
+    ) -> Union[dict, list]:
+        """
+        Parse an Availability Payload, Unless it Hasn't Changed Since Last Time
+
+        The raw payload of every campground / month is hashed, when the hash
+        matches the previous payload the previously parsed object is returned
+        as is, which lets searches skip processing it altogether.
+
+        Parameters
+        ----------
+        campground_id: int
+        month: datetime
+        content: bytes
+            Raw response body
+
+        Returns
+        -------
+        Union[dict, list]
+        """
+        key = (campground_id, month)
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        previous = self._availability_payloads.get(key)
+        if previous is not None and previous[0] == digest:
+            logger.debug("Availability unchanged: %s, %s", campground_id, month)
+            return previous[1]
+        availability = loads(content)
+        self._availability_payloads[key] = (digest, availability)
+        return availability
+
+    def process_campsite_availability_changes(
+        self,
+        availability: Union[Dict[str, Any], List[Dict[str, Any]]],
+        previous: Optional[AvailabilitySnapshot],
+        **kwargs: Any,
+    ) -> AvailabilitySnapshot:
+        """
+        Process a Payload Incrementally, Given the Snapshot of the Previous One
+
+        An unchanged payload reuses the previous snapshot without any
+        processing. Providers that can diff the parts of a payload override
+        this to only reprocess what changed.
+
+        Parameters
+        ----------
+        availability: Union[Dict[str, Any], List[Dict[str, Any]]]
+            API Response
+        previous: Optional[AvailabilitySnapshot]
+            Snapshot of the previous payload of the same facility and month
+        **kwargs: Any
+            See `process_campsite_availability_batch`
+
+        Returns
+        -------
+        AvailabilitySnapshot
+        """
+        if previous is not None and previous.is_current(payload=availability):
+            return previous
+        return AvailabilitySnapshot(
+            payload=availability,
+            batch=self.process_campsite_availability_batch(
+                availability=availability, **kwargs
+            ),
+        )
+
+    @classmethod
+    def process_campsite_availability_batch(
+        cls,
+        availability: Union[Dict[str, Any], List[Dict[str, Any]]],
+        recreation_area: str,
+        recreation_area_id: int,
+        facility_name: str,
+        facility_id: int,
+        month: datetime,
+        campsite_metadata: pd.DataFrame,
+        availability_filter: Optional[AvailabilityFilter] = None,
+    ) -> AvailabilityBatch:
+        """
+        Parse the JSON Response into a Columnar Batch of Availabilities
+
+        Providers that don't fill an `AvailabilityBatch` directly fall back to
+        converting the results of `process_campsite_availability`, dropping
+        the single nights that aren't searched.
+
+        Parameters
+        ----------
+        availability: Union[Dict[str, Any], List[Dict[str, Any]]]
+            API Response
+        recreation_area: str
+            Name of Recreation Area
+        recreation_area_id: int
+            ID of Recreation Area
+        facility_name: str
+            Campground Facility Name
+        facility_id: int
+            Campground Facility ID
+        month: datetime
+            Month to Process
+        campsite_metadata: pd.DataFrame
+            Metadata Fetched from the Recreation.gov API about the Campsites
+        availability_filter: Optional[AvailabilityFilter]
+            Search days and minimum stay, nights that can't match are skipped
+
+        Returns
+        -------
+        AvailabilityBatch
+        """
+        campsites = cls.process_campsite_availability(
+            availability=availability,
+            recreation_area=recreation_area,
+            recreation_area_id=recreation_area_id,
+            facility_name=facility_name,
+            facility_id=facility_id,
+            month=month,
+            campsite_metadata=campsite_metadata,
+        )
+        if availability_filter is not None:
+            campsites = [
+                campsite
+                for campsite in campsites
+                if campsite.booking_nights != 1
+                or availability_filter.includes(campsite.booking_date)
+            ]
+        return AvailabilityBatch.from_campsites(campsites=campsites)
 
     def get_campsite_by_id(
         self, campsite_id: int
@@ -754,23 +1133,255 @@ class RecreationDotGovBase(BaseProvider, ABC):
             )
         return facilities
 
+    @property
+    def offline_cache_dir(self) -> pathlib.Path:
+        """
+        Offline Cache Directory
+        """
+        if self.__offline_cache_dir__ is None:
+            return FileConfig.RECREATION_DOT_GOV_PROVIDER / self.__class__.__name__
+        else:
+            return self.__offline_cache_dir__
+
+    @property
+    def metadata_cache(self) -> DiskCache:
+        """
+        On-Disk Cache of Campsite Metadata, One File per Facility
+        """
+        return DiskCache(
+            directory=self.offline_cache_dir.joinpath("campsites"),
+            version=RecreationBookingConfig.METADATA_CACHE_VERSION,
+            ttl=timedelta(seconds=RecreationBookingConfig.METADATA_CACHE_TTL),
+        )
+
     def get_internal_campsites(
-        self, facility_ids: List[int]
+        self, facility_ids: List[int], workers: int = 1
     ) -> List[RecDotGovCampsite]:
         """
         Retrieve all of the underlying Campsites to Search
+
+        Campsite metadata is cached on disk per facility. Fresh entries are used
+        as-is, expired entries are revalidated with their `ETag` /
+        `Last-Modified` headers and only re-downloaded when they've changed.
+        With multiple `workers` facilities, and the pages of each facility, are
+        fetched concurrently within the provider's rate limit. The workers are
+        split between facilities and their pages so that no more than `workers`
+        requests are in flight at once. Each facility is written to the cache as
+        soon as it arrives.
+
+        Parameters
+        ----------
+        facility_ids: List[int]
+        workers: int
+            Number of concurrent requests to make, defaults to 1
+
+        Returns
+        -------
+        List[RecDotGovCampsite]
+        """
+        facility_campsites: List[List[RecDotGovCampsite]] = [[] for _ in facility_ids]
+        facility_workers = max(min(workers, len(facility_ids)), 1)
+        page_workers = max(workers // facility_workers, 1)
+        for index, campsites in map_concurrently(
+            func=self._get_cached_campsites,
+            arguments=[
+                {"facility_id": facility_id, "workers": page_workers}
+                for facility_id in facility_ids
+            ],
+            workers=workers,
+        ):
+            facility_campsites[index] = campsites
+        return list(chain.from_iterable(facility_campsites))
+
+    def _get_cached_campsites(
+        self, facility_id: int, workers: int = 1
+    ) -> List[RecDotGovCampsite]:
+        """
+        Retrieve the Campsites of a Facility, Using the Metadata Cache
+
+        Parameters
+        ----------
+        facility_id: int
+        workers: int
+            Number of pages to fetch concurrently
+
+        Returns
+        -------
+        List[RecDotGovCampsite]
+        """
+        cache = self.metadata_cache
+        key = str(facility_id)
+        entry = cache.get(key=key)
+        if entry is not None and cache.is_fresh(entry=entry):
+            logger.debug("Using cached campsite metadata: %s", facility_id)
+            return [self.api_search_result_class(**item) for item in entry.data]
+        validators = None
+        if entry is not None:
+            validators = {"etag": entry.etag, "last_modified": entry.last_modified}
+        campsites, validators = self._paginate_recdotgov_campsites(
+            facility_id=facility_id, validators=validators, workers=workers
+        )
+        if campsites is None:
+            logger.debug("Cached campsite metadata still valid: %s", facility_id)
+            try:
+                cache.touch(entry=entry)
+            except OSError as e:
+                logger.warning("Unable to cache campsite metadata: %s", e)
+            return [self.api_search_result_class(**item) for item in entry.data]
+        try:
+            cache.set(
+                key=key,
+                data=[item.dict() for item in campsites],
+                etag=validators.get("etag"),
+                last_modified=validators.get("last_modified"),
+            )
+        except OSError as e:
+            logger.warning("Unable to cache campsite metadata: %s", e)
+        return campsites
+
+    def _paginate_recdotgov_search(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        response_class: Type[CamplyModel],
+        results_field: str,
+        validators: Optional[Dict[str, Optional[str]]] = None,
+        workers: int = 1,
+    ) -> Tuple[Optional[List[CamplyModel]], Dict[str, Optional[str]]]:
         """
-        all_campsites: List[RecDotGovCampsite] = []
-        for facility_id in facility_ids:
-            all_campsites += self.paginate_recdotgov_campsites(facility_id=facility_id)
-        return all_campsites
+        Paginate Through a Recreation.gov Search Endpoint
+
+        When `validators` are provided the first page is requested conditionally,
+        and None is returned if Recreation.gov reports it as unchanged. The first
+        page reports the `total` number of results, so the offsets of every
+        other page are known up front and fetched across `workers` threads.
+
+        Parameters
+        ----------
+        path: str
+            Search endpoint path
+        params: Dict[str, Any]
+            Search parameters, besides pagination
+        response_class: Type[CamplyModel]
+            Model of each page of the response
+        results_field: str
+            Field of the `response_class` holding the results
+        validators: Optional[Dict[str, Optional[str]]]
+            `etag` / `last_modified` of a previous response
+        workers: int
+            Number of pages to fetch concurrently, defaults to 1
 
-    def get_internal_campsite_metadata(self, facility_ids: List[int]) -> pd.DataFrame:
+        Returns
+        -------
+        Tuple[Optional[List[CamplyModel]], Dict[str, Optional[str]]]
+            The results (None if unchanged) and the validators of the response
+        """
+        endpoint_url = api_utils.generate_url(
+            scheme=RecreationBookingConfig.API_SCHEME,
+            netloc=RecreationBookingConfig.API_NET_LOC,
+            path=path,
+        )
+        params = {"start": 0, "size": 1000, **params}
+        request_kwargs: Dict[str, Any] = {}
+        conditional_headers = self._get_conditional_headers(validators=validators)
+        if conditional_headers:
+            request_kwargs.update(headers=conditional_headers)
+        response = self.make_recdotgov_request_retry(
+            method="GET", url=endpoint_url, params=params, **request_kwargs
+        )
+        if response.status_code == requests.codes.not_modified:
+            return None, validators
+        response_validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        first_page = response_class(**loads(response.content))
+        page_size = first_page.size
+        offsets = []
+        if page_size > 0:
+            offsets = list(
+                range(params["start"] + page_size, first_page.total, page_size)
+            )
+        pages: List[List[CamplyModel]] = [[] for _ in offsets]
+        for index, page in map_concurrently(
+            func=self._get_recdotgov_search_page,
+            arguments=[
+                {
+                    "url": endpoint_url,
+                    "params": {**params, "start": offset},
+                    "response_class": response_class,
+                    "results_field": results_field,
+                }
+                for offset in offsets
+            ],
+            workers=workers,
+        ):
+            pages[index] = page
+        results: List[CamplyModel] = list(
+            chain(getattr(first_page, results_field), *pages)
+        )
+        return results, response_validators
+
+    def _get_recdotgov_search_page(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        response_class: Type[CamplyModel],
+        results_field: str,
+    ) -> List[CamplyModel]:
+        """
+        Fetch a Single Page of a Recreation.gov Search Endpoint
+
+        Parameters
+        ----------
+        url: str
+        params: Dict[str, Any]
+            Search parameters, including the `start` offset of the page
+        response_class: Type[CamplyModel]
+        results_field: str
+
+        Returns
+        -------
+        List[CamplyModel]
+        """
+        response = self.make_recdotgov_request_retry(
+            method="GET", url=url, params=params
+        )
+        search_response = response_class(**loads(response.content))
+        return getattr(search_response, results_field)
+
+    @classmethod
+    def _get_conditional_headers(
+        cls, validators: Optional[Dict[str, Optional[str]]]
+    ) -> Dict[str, str]:
+        """
+        Build `If-None-Match` / `If-Modified-Since` Headers from Validators
+
+        Parameters
+        ----------
+        validators: Optional[Dict[str, Optional[str]]]
+
+        Returns
+        -------
+        Dict[str, str]
+        """
+        headers: Dict[str, str] = {}
+        if not validators:
+            return headers
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def get_internal_campsite_metadata(
+        self, facility_ids: List[int], workers: int = 1
+    ) -> pd.DataFrame:
         """
         Retrieve Metadata About all of the underlying Campsites to Search
         """
         all_campsites: List[RecDotGovCampsite] = self.get_internal_campsites(
-            facility_ids=facility_ids
+            facility_ids=facility_ids, workers=workers
         )
         all_campsite_df = pd.DataFrame(
             [item.dict() for item in all_campsites],
@@ -813,3 +1424,29 @@ class RecreationDotGovBase(BaseProvider, ABC):
         -------
         List[RecDotGovCampsite]
         """
+
+    @abstractmethod
+    def _paginate_recdotgov_campsites(
+        self,
+        facility_id: int,
+        equipment: Optional[List[str]] = None,
+        validators: Optional[Dict[str, Optional[str]]] = None,
+        workers: int = 1,
+    ) -> Tuple[Optional[List[CamplyModel]], Dict[str, Optional[str]]]:
+        """
+        Paginate Campsites - Conditionally
+
+        Parameters
+        ----------
+        facility_id: int
+        equipment: Optional[List[str]]
+        validators: Optional[Dict[str, Optional[str]]]
+            `etag` / `last_modified` of a previous response
+        workers: int
+            Number of pages to fetch concurrently
+
+        Returns
+        -------
+        Tuple[Optional[List[CamplyModel]], Dict[str, Optional[str]]]
+            The campsites (None if unchanged) and the validators of the response
+        """
@@ -2,16 +2,14 @@
 Recreation.gov Implementation for Tours.
 """
 
-import json
 import logging
 from abc import ABC, abstractmethod
 from datetime import date, datetime, time, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
-import requests
 
-from camply.config import RecreationBookingConfig, RIDBConfig
+from camply.config import RIDBConfig
 from camply.containers import AvailableCampsite
 from camply.containers.api_responses import (
     RecDotGovSearchResponse,
@@ -23,7 +21,6 @@ from camply.containers.api_responses import (
 from camply.containers.base_container import CamplyModel, RecDotGovEquipment
 from camply.providers.base_provider import ProviderSearchError
 from camply.providers.recreation_dot_gov.recdotgov_provider import RecreationDotGovBase
-from camply.utils import api_utils
 
 logger = logging.getLogger(__name__)
 
@@ -61,47 +58,59 @@ class RecreationDotGovTours(RecreationDotGovBase, ABC):
         """
         Paginate through the RecDotGov Campsite Metadata
         """
-        results = 0
-        continue_paginate = True
-        endpoint_url = api_utils.generate_url(
-            scheme=RecreationBookingConfig.API_SCHEME,
-            netloc=RecreationBookingConfig.API_NET_LOC,
-            path="api/search",
+        campsites, _ = self._paginate_recdotgov_campsites(
+            facility_id=facility_id, equipment=equipment
         )
+        return campsites
+
+    def _paginate_recdotgov_campsites(
+        self,
+        facility_id: int,
+        equipment: Optional[List[str]] = None,
+        validators: Optional[Dict[str, Optional[str]]] = None,
+        workers: int = 1,
+    ) -> Tuple[Optional[List[RecDotGovSearchResult]], Dict[str, Optional[str]]]:
+        """
+        Paginate through the RecDotGov Tour Metadata - Conditionally
+
+        Parameters
+        ----------
+        facility_id: int
+        equipment: Optional[List[str]]
+            Not used for tours
+        validators: Optional[Dict[str, Optional[str]]]
+            `ETag` / `Last-Modified` validators of a previous response
+        workers: int
+            Number of pages to fetch concurrently
+
+        Returns
+        -------
+        Tuple[Optional[List[RecDotGovSearchResult]], Dict[str, Optional[str]]]
+            The tours (None if unchanged since `validators`) and the
+            validators of the new response
+        """
         fq_list = [
             f"asset_id:{facility_id}",
             # Currently, entity_type:tour (parent is entity_type:ticketfacility)
             # or entity_type:timedentry_tour (parent is entity_type:timedentry).
             self.api_search_fq,
         ]
-        params = {
-            "start": 0,
-            "size": 1000,
-            "fq": fq_list,
-        }
-        campsites: List[RecDotGovSearchResult] = []
-        while continue_paginate is True:
-            response = self.make_recdotgov_request_retry(
-                method="GET",
-                url=endpoint_url,
-                params=params,
-            )
-            returned_data = json.loads(response.content)
-            campsite_response = RecDotGovSearchResponse(**returned_data)
-            campsites += campsite_response.results
-            results += campsite_response.size
-            params.update(start=results)
-            if results == campsite_response.total:
-                continue_paginate = False
-        return campsites
+        return self._paginate_recdotgov_search(
+            path="api/search",
+            params={"fq": fq_list},
+            response_class=RecDotGovSearchResponse,
+            results_field="results",
+            validators=validators,
+            workers=workers,
+        )
 
-    def make_recdotgov_availability_request(
+    def get_availability_request(
         self,
         campground_id: int,
         month: datetime,
-    ) -> requests.Response:
+    ) -> Tuple[str, Dict[str, Any]]:
         """
-        Make a request to the RecreationDotGov API
+        Get the URL and Query Parameters of an Availability Request
 
         Parameters
         ----------
@@ -110,7 +119,7 @@ class RecreationDotGovTours(RecreationDotGovBase, ABC):
 
         Returns
         -------
-        requests.Response
+        Tuple[str, Dict[str, Any]]
         """
         api_endpoint = self._rec_availability_get_endpoint(
             path=f"{campground_id}/monthlyAvailabilitySummaryView"
@@ -120,11 +129,7 @@ class RecreationDotGovTours(RecreationDotGovBase, ABC):
             "month": month.strftime("%m"),
             "inventoryBucket": "FIT",
         }
-        return self.make_recdotgov_request(
-            method="GET",
-            url=api_endpoint,
-            params=query_params,
-        )
+        return api_endpoint, query_params
 
     @classmethod
     def make_campsite_availability_fields(
@@ -313,13 +318,13 @@ class RecreationDotGovDailyMixin(RecreationDotGovTours, ABC):
         """
         return search_days
 
-    def make_recdotgov_availability_request(
+    def get_availability_request(
         self,
         campground_id: int,
         month: datetime,
-    ) -> requests.Response:
+    ) -> Tuple[str, Dict[str, Any]]:
         """
-        Make a request to the RecreationDotGov API
+        Get the URL and Query Parameters of an Availability Request
 
         Parameters
         ----------
@@ -328,17 +333,13 @@ class RecreationDotGovDailyMixin(RecreationDotGovTours, ABC):
 
         Returns
         -------
-        requests.Response
+        Tuple[str, Dict[str, Any]]
         """
         api_endpoint = self._rec_availability_get_endpoint(path=str(campground_id))
         query_params = {
             "date": month.strftime("%Y-%m-%d"),
         }
-        return self.make_recdotgov_request(
-            method="GET",
-            url=api_endpoint,
-            params=query_params,
-        )
+        return api_endpoint, query_params
 
     @classmethod
     def process_campsite_availability(
@@ -2,26 +2,32 @@
 UseDirect Provider
 """
 
+import asyncio
 import json
 import logging
 import pathlib
 import sys
+import threading
 from abc import ABC, abstractmethod
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Generator, List, Optional, Union
+from urllib.parse import urlparse
 
-import ratelimit
+import requests
 from fake_useragent import UserAgent
 from pydantic import ValidationError
+from requests.adapters import HTTPAdapter
 
 from camply.config import FileConfig
 from camply.config.api_config import UseDirectConfig
 from camply.containers import (
+    AvailabilityFilter,
     AvailableCampsite,
     CampgroundFacility,
     CamplyModel,
     RecreationArea,
 )
+from camply.containers.campsite_record import CampsiteRecord
 from camply.containers.data_containers import CampsiteLocation
 from camply.containers.usedirect import (
     UseDirectAvailabilityResponse,
@@ -34,6 +40,7 @@ from camply.containers.usedirect import (
 )
 from camply.exceptions import CamplyError
 from camply.providers.base_provider import BaseProvider
+from camply.utils.json_decoding import loads
 from camply.utils.logging_utils import log_sorted_response
 
 logger = logging.getLogger(__name__)
@@ -50,6 +57,8 @@ class UseDirectProvider(BaseProvider, ABC):
     Camply Provider for UseDirect RDR Campgrounds
     """
 
+    RATE_LIMIT_CONFIG = UseDirectConfig
+
     usedirect_city_parks: Dict[int, UseDirectCityPark] = {}
     usedirect_rec_areas: Dict[int, RecreationArea] = {}
     usedirect_campgrounds: Dict[int, CampgroundFacility] = {}
@@ -62,6 +71,10 @@ class UseDirectProvider(BaseProvider, ABC):
 
     __offline_cache_dir__: Optional[pathlib.Path] = None
 
+    _tenant_sessions: Dict[str, requests.Session] = {}
+    _tenant_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+    _tenant_lock = threading.Lock()
+
     rdr_path: str = "rdr"
 
     booking_path_params: bool = True
@@ -91,6 +104,17 @@ class UseDirectProvider(BaseProvider, ABC):
         """
         pass
 
+    def __init__(self) -> None:
+        """
+        Initialize with the Shared Session of the Tenant
+
+        `grid_bytes` counts the bytes of every availability grid downloaded.
+        """
+        super().__init__()
+        self.session = self.get_tenant_session()
+        self.grid_bytes: int = 0
+        self._grid_bytes_lock = threading.Lock()
+
     @property
     def offline_cache_dir(self) -> pathlib.Path:
         """
@@ -101,6 +125,90 @@ class UseDirectProvider(BaseProvider, ABC):
         else:
             return self.__offline_cache_dir__
 
+    @property
+    def tenant(self) -> str:
+        """
+        UseDirect Tenant (<subdomain>.usedirect.com) of the Provider
+        """
+        return urlparse(self.base_url).netloc.lower()
+
+    def get_tenant_session(self) -> requests.Session:
+        """
+        Get the Shared, Pooled Session of the Provider's Tenant
+
+        Every provider instance (and thread) talking to the same tenant re-uses
+        one session, while each tenant gets a connection pool of its own.
+
+        Returns
+        -------
+        requests.Session
+        """
+        with UseDirectProvider._tenant_lock:
+            session = UseDirectProvider._tenant_sessions.get(self.tenant)
+            if session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=UseDirectConfig.POOL_SIZE
+                )
+                session = requests.Session()
+                session.mount(prefix="https://", adapter=adapter)
+                session.mount(prefix="http://", adapter=adapter)
+                session.headers.update(self.headers)
+                UseDirectProvider._tenant_sessions[self.tenant] = session
+            return session
+
+    def get_tenant_semaphore(self) -> threading.BoundedSemaphore:
+        """
+        Get the Semaphore Capping Concurrent Requests to the Provider's Tenant
+
+        Returns
+        -------
+        threading.BoundedSemaphore
+        """
+        with UseDirectProvider._tenant_lock:
+            semaphore = UseDirectProvider._tenant_semaphores.get(self.tenant)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(UseDirectConfig.POOL_SIZE)
+                UseDirectProvider._tenant_semaphores[self.tenant] = semaphore
+            return semaphore
+
+    def _send_http_request(
+        self,
+        url: str,
+        method: str = "GET",
+        data: Optional[Union[Dict[str, Any], str]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        retry_response_codes: Optional[List[int]] = None,
+    ) -> requests.Response:
+        """
+        Send an HTTP Request, Within the Tenant's Concurrency Pool
+
+        Parameters
+        ----------
+        url: str
+            URL to make the request to
+        method: str
+            HTTP Method to use. Defaults to GET
+        data: Optional[Union[Dict[str, Any], str]]
+            Data to send with the request
+        headers: Optional[Dict[str, Any]]
+            Headers to send with the request
+        retry_response_codes: Optional[List[int]]
+            List of response codes to raise a ProviderError. on. Defaults to 500 range
+            and 429 (Too Many Requests)
+
+        Returns
+        -------
+        response: requests.Response
+        """
+        with self.get_tenant_semaphore():
+            return super()._send_http_request(
+                url=url,
+                method=method,
+                data=data,
+                headers=headers,
+                retry_response_codes=retry_response_codes,
+            )
+
     def refresh_metadata(self) -> None:
         """
         Refresh All the Campground Metadata
@@ -256,8 +364,6 @@ class UseDirectProvider(BaseProvider, ABC):
             ]
         return found_campgrounds
 
-    @ratelimit.sleep_and_retry
-    @ratelimit.limits(calls=1, period=1)
     def get_campsites_response(
         self,
         campground_id: int,
@@ -304,6 +410,93 @@ class UseDirectProvider(BaseProvider, ABC):
         -------
         UseDirectAvailabilityResponse
         """
+        search_parameters = {
+            "is_ada": is_ada,
+            "min_vehicle_length": min_vehicle_length,
+            "unit_category_id": unit_category_id,
+            "web_only": web_only,
+            "unit_type_group_ids": unit_type_group_ids,
+            "sleeping_unit_id": sleeping_unit_id,
+            "unit_sort": unit_sort,
+            "in_season_only": in_season_only,
+        }
+        return self.coalesce_request(
+            key=(
+                campground_id,
+                start_date,
+                end_date,
+                *(
+                    tuple(value) if isinstance(value, list) else value
+                    for value in search_parameters.values()
+                ),
+            ),
+            func=self._fetch_campsites_response,
+            campground_id=campground_id,
+            start_date=start_date,
+            end_date=end_date,
+            **search_parameters,
+        )
+
+    def _fetch_campsites_response(
+        self,
+        campground_id: int,
+        start_date: Union[datetime, date],
+        end_date: Union[datetime, date],
+        **kwargs: Any,
+    ) -> UseDirectAvailabilityResponse:
+        """
+        Request and Parse a Campground's Availability Grid
+
+        Parameters
+        ----------
+        campground_id: int
+        start_date: Union[datetime, date]
+        end_date: Union[datetime, date]
+        **kwargs: Any
+            Search parameters, see `get_campsites_response`
+
+        Returns
+        -------
+        UseDirectAvailabilityResponse
+        """
+        response = self.make_http_request_retry(
+            **self._get_availability_request(
+                campground_id=campground_id,
+                start_date=start_date,
+                end_date=end_date,
+                **kwargs,
+            )
+        )
+        return self._parse_availability_response(
+            campground_id=campground_id, response=response
+        )
+
+    def _get_availability_request(
+        self,
+        campground_id: int,
+        start_date: Union[datetime, date],
+        end_date: Union[datetime, date],
+        is_ada: Optional[bool] = None,
+        min_vehicle_length: Optional[int] = None,
+        unit_category_id: Optional[int] = None,
+        web_only: Optional[bool] = True,
+        unit_type_group_ids: Optional[List[int]] = None,
+        sleeping_unit_id: Optional[int] = None,
+        unit_sort: Optional[str] = "orderby",
+        in_season_only: Optional[bool] = True,
+    ) -> Dict[str, Any]:
+        """
+        Build the Availability Grid Request
+
+        Parameters
+        ----------
+        See `get_campsites_response`
+
+        Returns
+        -------
+        Dict[str, Any]
+            Keyword arguments for `make_http_request_retry`
+        """
         greatest_start = max(start_date, date.today() - timedelta(days=1))
         data = {
             "IsADA": is_ada,
@@ -325,16 +518,33 @@ class UseDirectProvider(BaseProvider, ABC):
         }
         url = f"{self.base_url}/{self.rdr_path}/{UseDirectConfig.AVAILABILITY_ENDPOINT}"
         random_ua = UserAgent(browsers=["chrome"]).random
-        self.json_headers["User-Agent"] = random_ua
-        response = self.make_http_request_retry(
-            url=url,
-            method="POST",
-            data=json.dumps(non_null_data),
-            headers=self.json_headers,
-        )
-        response_json = response.json()
+        return {
+            "url": url,
+            "method": "POST",
+            "data": json.dumps(non_null_data),
+            "headers": {**self.json_headers, "User-Agent": random_ua},
+        }
+
+    def _parse_availability_response(
+        self, campground_id: int, response: requests.Response
+    ) -> UseDirectAvailabilityResponse:
+        """
+        Parse the Availability Grid Response
+
+        Parameters
+        ----------
+        campground_id: int
+        response: requests.Response
+
+        Returns
+        -------
+        UseDirectAvailabilityResponse
+        """
+        with self._grid_bytes_lock:
+            self.grid_bytes += len(response.content)
+        response_json = loads(response.content)
         try:
-            return UseDirectAvailabilityResponse(**response_json)
+            return UseDirectAvailabilityResponse.from_payload(response_json)
         except ValidationError as e:
             raise
             error_message = (
@@ -345,6 +555,43 @@ class UseDirectProvider(BaseProvider, ABC):
                 error_message += " " + response_json["Message"]
             raise UseDirectError(error_message) from e
 
+    async def get_campsites_response_async(
+        self,
+        campground_id: int,
+        start_date: Union[datetime, date],
+        end_date: Union[datetime, date],
+        **kwargs: Any,
+    ) -> UseDirectAvailabilityResponse:
+        """
+        Get Campsites from UseDirect - From an Event Loop
+
+        Parameters
+        ----------
+        campground_id: int
+            Facility ID of the campground
+        start_date: Union[datetime, date]
+            Search Start Date
+        end_date: Union[datetime, date]
+            Search End Date
+        **kwargs: Any
+            Additional search parameters, see `get_campsites_response`
+
+        Returns
+        -------
+        UseDirectAvailabilityResponse
+        """
+        response = await self.make_http_request_retry_async(
+            **self._get_availability_request(
+                campground_id=campground_id,
+                start_date=start_date,
+                end_date=end_date,
+                **kwargs,
+            )
+        )
+        return self._parse_availability_response(
+            campground_id=campground_id, response=response
+        )
+
     def get_campsites(
         self,
         campground_id: int,
@@ -358,6 +605,8 @@ class UseDirectProvider(BaseProvider, ABC):
         sleeping_unit_id: Optional[int] = None,
         unit_sort: Optional[str] = "orderby",
         in_season_only: Optional[bool] = True,
+        campsite_ids: Optional[List[int]] = None,
+        availability_filter: Optional[AvailabilityFilter] = None,
     ) -> List[AvailableCampsite]:
         """
         Get Campsites from UseDirect
@@ -386,6 +635,11 @@ class UseDirectProvider(BaseProvider, ABC):
             Sort Order
         in_season_only: Optional[bool]
             Searching for in-season only campgrounds
+        campsite_ids: Optional[List[int]]
+            Only return these campsites. Defaults to the campsites validated
+            with `validate_campsites`
+        availability_filter: Optional[AvailabilityFilter]
+            Search days and minimum stay, nights that can't match are skipped
 
         Returns
         -------
@@ -405,43 +659,170 @@ class UseDirectProvider(BaseProvider, ABC):
             unit_sort=unit_sort,
             in_season_only=in_season_only,
         )
-        campsites: List[AvailableCampsite] = []
+        return self._process_availability_response(
+            availability_response=availability_response,
+            campsite_ids=campsite_ids,
+            availability_filter=availability_filter,
+        )
+
+    async def get_campsites_async(
+        self,
+        campground_id: int,
+        start_date: Union[datetime, date],
+        end_date: Union[datetime, date],
+        campsite_ids: Optional[List[int]] = None,
+        availability_filter: Optional[AvailabilityFilter] = None,
+        **kwargs: Any,
+    ) -> List[AvailableCampsite]:
+        """
+        Get Campsites from UseDirect - From an Event Loop
+
+        Parameters
+        ----------
+        campground_id: int
+            Facility ID of the campground
+        start_date: Union[datetime, date]
+            Search Start Date
+        end_date: Union[datetime, date]
+            Search End Date
+        campsite_ids: Optional[List[int]]
+            Only return these campsites. Defaults to the campsites validated
+            with `validate_campsites`
+        availability_filter: Optional[AvailabilityFilter]
+            Search days and minimum stay, nights that can't match are skipped
+        **kwargs: Any
+            Additional search parameters, see `get_campsites`
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
+        await asyncio.to_thread(self.refresh_metadata)
+        availability_response = await self.get_campsites_response_async(
+            campground_id=campground_id,
+            start_date=start_date,
+            end_date=end_date,
+            **kwargs,
+        )
+        return self._process_availability_response(
+            availability_response=availability_response,
+            campsite_ids=campsite_ids,
+            availability_filter=availability_filter,
+        )
+
+    def _process_availability_response(
+        self,
+        availability_response: UseDirectAvailabilityResponse,
+        campsite_ids: Optional[List[int]] = None,
+        availability_filter: Optional[AvailabilityFilter] = None,
+    ) -> List[AvailableCampsite]:
+        """
+        Get the Available Campsites of an Availability Grid
+
+        Parameters
+        ----------
+        availability_response: UseDirectAvailabilityResponse
+        campsite_ids: Optional[List[int]]
+            Only return these campsites, defaults to `campsite_ids`
+        availability_filter: Optional[AvailabilityFilter]
+            Search days and minimum stay, nights that can't match are skipped
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
+        return [
+            campsite_record.to_campsite()
+            for campsite_record in self.iter_campsite_records(
+                availability_response=availability_response,
+                campsite_ids=campsite_ids,
+                availability_filter=availability_filter,
+            )
+        ]
+
+    def iter_campsite_records(
+        self,
+        availability_response: UseDirectAvailabilityResponse,
+        campsite_ids: Optional[List[int]] = None,
+        availability_filter: Optional[AvailabilityFilter] = None,
+    ) -> Generator[CampsiteRecord, None, None]:
+        """
+        Stream the Available Nights of an Availability Grid, Unit by Unit
+
+        Filtered units, booked nights and nights that can't match the search
+        are skipped before a record is created.
+
+        Parameters
+        ----------
+        availability_response: UseDirectAvailabilityResponse
+        campsite_ids: Optional[List[int]]
+            Only return these campsites, defaults to `campsite_ids`
+        availability_filter: Optional[AvailabilityFilter]
+            Search days and minimum stay, nights that can't match are skipped
+
+        Yields
+        ------
+        CampsiteRecord
+        """
+        if campsite_ids is None:
+            campsite_ids = self.campsite_ids
         if availability_response.Facility.Units is None:
-            return campsites
+            return
+        location = CampsiteLocation(
+            latitude=availability_response.Facility.Latitude,
+            longitude=availability_response.Facility.Longitude,
+        )
         for _campground_unit_id, unit in availability_response.Facility.Units.items():
-            for _slice_date, availability_slice in unit.Slices.items():
-                campsite = self._get_available_campsite(
+            if len(campsite_ids) > 0 and unit.UnitId not in campsite_ids:
+                continue
+            nights = (
+                (availability_slice.Date, availability_slice)
+                for availability_slice in unit.Slices.values()
+                if availability_slice.IsFree is True
+            )
+            if availability_filter is not None and unit.Slices:
+                slice_dates = [
+                    availability_slice.Date
+                    for availability_slice in unit.Slices.values()
+                ]
+                nights = availability_filter.filter_nights(
+                    nights=nights,
+                    first_night=min(slice_dates),
+                    last_night=max(slice_dates),
+                )
+            for _slice_date, availability_slice in nights:
+                yield self._get_campsite_record(
                     availability_slice=availability_slice,
                     availability_response=availability_response,
                     unit=unit,
+                    location=location,
                 )
-                campsite_available = campsite.availability_status == "Available"
-                if campsite_available is True:
-                    if (
-                        len(self.campsite_ids) == 0
-                        or campsite.campsite_id in self.campsite_ids
-                    ):
-                        campsites.append(campsite)
-        return campsites
 
-    def _get_available_campsite(
+    def _get_campsite_record(
         self,
         availability_slice: UseDirectAvailabilitySlice,
         availability_response: UseDirectAvailabilityResponse,
         unit: UseDirectAvailabilityUnit,
-    ) -> AvailableCampsite:
+        location: Optional[CampsiteLocation] = None,
+    ) -> CampsiteRecord:
         """
-        Create an AvailableCampsite Object from the Availability Grid Response
+        Create a CampsiteRecord from the Availability Grid Response
+
+        Every night of every unit in the grid goes through here, so the values
+        aren't validated, only the available nights become `AvailableCampsite`
+        objects.
 
         Parameters
         ----------
         availability_slice: UseDirectAvailabilitySlice
         availability_response: UseDirectAvailabilityResponse
         unit: UseDirectAvailabilityUnit
+        location: Optional[CampsiteLocation]
+            Location of the facility, shared by its campsites
 
         Returns
         -------
-        AvailableCampsite
+        CampsiteRecord
         """
         start_date = datetime.fromordinal(availability_slice.Date.toordinal())
         facility_id = availability_response.Facility.FacilityId
@@ -458,7 +839,12 @@ class UseDirectProvider(BaseProvider, ABC):
         campsite_use_type = self.usedirect_unit_type_groups.get(
             unit.UnitTypeGroupId, None
         )
-        campsite = AvailableCampsite(
+        if location is None:
+            location = CampsiteLocation(
+                latitude=availability_response.Facility.Latitude,
+                longitude=availability_response.Facility.Longitude,
+            )
+        return CampsiteRecord(
             campsite_id=unit.UnitId,
             booking_date=start_date,
             booking_end_date=start_date + timedelta(days=1),
@@ -475,12 +861,8 @@ class UseDirectProvider(BaseProvider, ABC):
             campsite_occupancy=(0, 1),
             campsite_type=campsite_type,
             campsite_use_type=campsite_use_type,
-            location=CampsiteLocation(
-                latitude=availability_response.Facility.Latitude,
-                longitude=availability_response.Facility.Longitude,
-            ),
+            location=location,
         )
-        return campsite
 
     def _fetch_metadata_from_disk(
         self, file_path: pathlib.Path
@@ -2,10 +2,13 @@
 Python Class Check Yellowstone Campground Booking API for Availability
 """
 
+import asyncio
 import logging
+import pathlib
+import threading
 from datetime import datetime, timedelta
-from json import loads
-from typing import List, Optional
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple
 from urllib import parse
 
 import requests
@@ -13,13 +16,17 @@ import tenacity
 from fake_useragent import UserAgent
 from pandas import DataFrame, to_datetime
 from pytz import timezone
+from requests.adapters import HTTPAdapter
 
-from camply.config import STANDARD_HEADERS
+from camply.config import STANDARD_HEADERS, FileConfig
 from camply.config.api_config import YellowstoneConfig
 from camply.containers import AvailableCampsite, CampgroundFacility, RecreationArea
 from camply.containers.api_responses import XantResortData
 from camply.providers.base_provider import BaseProvider
 from camply.utils import logging_utils
+from camply.utils.concurrency import map_concurrently
+from camply.utils.disk_cache import DiskCache, DiskCacheEntry
+from camply.utils.json_decoding import loads
 from camply.utils.logging_utils import log_sorted_response
 
 logger = logging.getLogger(__name__)
@@ -30,12 +37,49 @@ class Yellowstone(BaseProvider):
     Scanner for Lodging in Yellowstone
     """
 
+    RATE_LIMIT_CONFIG = YellowstoneConfig
+
     recreation_area = RecreationArea(
         recreation_area=YellowstoneConfig.YELLOWSTONE_RECREATION_AREA_FULL_NAME,
         recreation_area_id=YellowstoneConfig.YELLOWSTONE_RECREATION_AREA_ID,
         recreation_area_location="USA",
     )
 
+    __offline_cache_dir__: Optional[pathlib.Path] = None
+
+    _yellowstone_session: Optional[requests.Session] = None
+    _yellowstone_session_lock = threading.Lock()
+    _property_info: Dict[str, DiskCacheEntry] = {}
+    _property_info_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """
+        Initialize with the Shared Yellowstone Session
+        """
+        super().__init__()
+        self.session = self.get_yellowstone_session()
+
+    @property
+    def offline_cache_dir(self) -> pathlib.Path:
+        """
+        Offline Cache Directory
+        """
+        if self.__offline_cache_dir__ is None:
+            return FileConfig.XANTERRA_PROVIDER / self.__class__.__name__
+        else:
+            return self.__offline_cache_dir__
+
+    @property
+    def property_info_cache(self) -> DiskCache:
+        """
+        On-Disk Cache of Property Information, One File per Hotel
+        """
+        return DiskCache(
+            directory=self.offline_cache_dir.joinpath("property_info"),
+            version=YellowstoneConfig.PROPERTY_INFO_CACHE_VERSION,
+            ttl=timedelta(seconds=YellowstoneConfig.PROPERTY_INFO_CACHE_TTL),
+        )
+
     def _get_monthly_availability(
         self, month: datetime, nights: Optional[int] = None
     ) -> dict:
@@ -47,6 +91,70 @@ class Yellowstone(BaseProvider):
         data_availability: dict
             Data Availability Dictionary
         """
+        return self.coalesce_request(
+            key=(month, nights),
+            func=self._fetch_monthly_availability,
+            month=month,
+            nights=nights,
+        )
+
+    def _fetch_monthly_availability(
+        self, month: datetime, nights: Optional[int] = None
+    ) -> dict:
+        """
+        Request the Monthly Availability of All Lodging in Yellowstone
+
+        Returns
+        -------
+        data_availability: dict
+            Data Availability Dictionary
+        """
+        api_endpoint, query_dict = self._get_monthly_availability_request(
+            month=month, nights=nights
+        )
+        all_resort_availability_data = self.make_yellowstone_request(
+            endpoint=api_endpoint, params=query_dict
+        )
+        return self._ensure_booking_availability(
+            availability_data=all_resort_availability_data
+        )
+
+    async def _get_monthly_availability_async(
+        self, month: datetime, nights: Optional[int] = None
+    ) -> dict:
+        """
+        Check All Lodging in Yellowstone for Campground Data - From an Event Loop
+
+        Returns
+        -------
+        data_availability: dict
+            Data Availability Dictionary
+        """
+        api_endpoint, query_dict = self._get_monthly_availability_request(
+            month=month, nights=nights
+        )
+        all_resort_availability_data = await self.make_yellowstone_request_async(
+            endpoint=api_endpoint, params=query_dict
+        )
+        return self._ensure_booking_availability(
+            availability_data=all_resort_availability_data
+        )
+
+    def _get_monthly_availability_request(
+        self, month: datetime, nights: Optional[int] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Get the Endpoint and Query Parameters of a Monthly Availability Request
+
+        Parameters
+        ----------
+        month: datetime
+        nights: Optional[int]
+
+        Returns
+        -------
+        Tuple[str, Dict[str, Any]]
+        """
         query_dict = {
             "date": self._ensure_current_month(month=month),
             "limit": 31,
@@ -60,43 +168,116 @@ class Yellowstone(BaseProvider):
         logger.info(
             f"Searching for Yellowstone Lodging Availability: {month.strftime('%B, %Y')}"
         )
-        all_resort_availability_data = self.make_yellowstone_request(
-            endpoint=api_endpoint, params=query_dict
-        )
-        if not all_resort_availability_data.get(YellowstoneConfig.BOOKING_AVAILABILITY):
-            all_resort_availability_data[YellowstoneConfig.BOOKING_AVAILABILITY] = {}
-        return all_resort_availability_data
+        return api_endpoint, query_dict
 
-    @staticmethod
-    @tenacity.retry(
-        wait=tenacity.wait_random_exponential(multiplier=3, max=1800),
-        stop=tenacity.stop.stop_after_delay(6000),
-    )
-    def _try_retry_get_data(endpoint: str, params: Optional[dict] = None) -> dict:
+    @classmethod
+    def _ensure_booking_availability(cls, availability_data: dict) -> dict:
         """
-        Try and Retry Fetching Data from the Yellowstone API.
-
-        Unfortunately this is a required method to request the data since the
-        Yellowstone API doesn't always return data.
+        Make Sure the Availability Response Has a Booking Availability Mapping
 
         Parameters
         ----------
-        endpoint: str
-            API Endpoint
-        params
+        availability_data: dict
 
         Returns
         -------
         dict
         """
+        if not availability_data.get(YellowstoneConfig.BOOKING_AVAILABILITY):
+            availability_data[YellowstoneConfig.BOOKING_AVAILABILITY] = {}
+        return availability_data
+
+    @staticmethod
+    def _get_yellowstone_headers() -> Dict[str, str]:
+        """
+        Get the Headers of a Yellowstone API Request, with a Random User-Agent
+
+        Returns
+        -------
+        Dict[str, str]
+        """
         yellowstone_headers = {}
         user_agent = {"User-Agent": UserAgent(browsers=["chrome"]).random}
         yellowstone_headers.update(user_agent)
         yellowstone_headers.update(STANDARD_HEADERS)
         yellowstone_headers.update(YellowstoneConfig.API_REFERRERS)
-        response = requests.get(
-            url=endpoint, headers=yellowstone_headers, params=params, timeout=30
-        )
+        return yellowstone_headers
+
+    @classmethod
+    def get_yellowstone_session(cls) -> requests.Session:
+        """
+        Get the Shared, Pooled Session Used for Yellowstone Requests
+
+        The session (and its User-Agent) is created once and then shared by every
+        provider instance and thread, so connections are kept alive and re-used.
+
+        Returns
+        -------
+        requests.Session
+        """
+        with Yellowstone._yellowstone_session_lock:
+            if Yellowstone._yellowstone_session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=YellowstoneConfig.POOL_SIZE
+                )
+                session = requests.Session()
+                session.mount(prefix="https://", adapter=adapter)
+                session.mount(prefix="http://", adapter=adapter)
+                session.headers.update(cls._get_yellowstone_headers())
+                Yellowstone._yellowstone_session = session
+            return Yellowstone._yellowstone_session
+
+    @classmethod
+    def rotate_yellowstone_user_agent(cls) -> None:
+        """
+        Pick a New User-Agent for the Shared Yellowstone Session
+        """
+        session = cls.get_yellowstone_session()
+        with Yellowstone._yellowstone_session_lock:
+            user_agent = UserAgent(browsers=["chrome"]).random
+            session.headers["User-Agent"] = user_agent
+        logger.debug("Rotated Yellowstone User-Agent: %s", user_agent)
+
+    @staticmethod
+    def _get_yellowstone_response(
+        endpoint: str, params: Optional[dict] = None
+    ) -> requests.Response:
+        """
+        Make a Single Request With the Shared Yellowstone Session
+
+        The User-Agent is rotated whenever the API doesn't return data, so the
+        next attempt looks like a different browser.
+
+        Parameters
+        ----------
+        endpoint: str
+            API Endpoint
+        params: Optional[dict]
+
+        Returns
+        -------
+        requests.Response
+        """
+        session = Yellowstone.get_yellowstone_session()
+        response = session.get(url=endpoint, params=params, timeout=30)
+        Yellowstone.report_rate_limit(url=endpoint, response=response)
+        if response.ok is False or response.text.strip() == "":
+            Yellowstone.rotate_yellowstone_user_agent()
+        return response
+
+    @staticmethod
+    def _load_yellowstone_response(response: requests.Response) -> dict:
+        """
+        Load a Yellowstone API Response, Raise a RuntimeError When it's Empty
+
+        Parameters
+        ----------
+        response: requests.Response
+
+        Returns
+        -------
+        dict
+        """
         if response.ok is True and response.text.strip() != "":
             return loads(response.content)
         else:
@@ -107,6 +288,34 @@ class Yellowstone(BaseProvider):
             logger.warning(error_message)
             raise RuntimeError(error_message)
 
+    @staticmethod
+    @tenacity.retry(
+        wait=tenacity.wait_random_exponential(multiplier=3, max=1800),
+        stop=tenacity.stop.stop_after_delay(6000),
+    )
+    def _try_retry_get_data(endpoint: str, params: Optional[dict] = None) -> dict:
+        """
+        Try and Retry Fetching Data from the Yellowstone API.
+
+        Unfortunately this is a required method to request the data since the
+        Yellowstone API doesn't always return data.
+
+        Parameters
+        ----------
+        endpoint: str
+            API Endpoint
+        params
+
+        Returns
+        -------
+        dict
+        """
+        Yellowstone.acquire_rate_limit(url=endpoint)
+        response = Yellowstone._get_yellowstone_response(
+            endpoint=endpoint, params=params
+        )
+        return Yellowstone._load_yellowstone_response(response=response)
+
     @staticmethod
     def make_yellowstone_request(endpoint: str, params: Optional[dict] = None) -> dict:
         """
@@ -131,6 +340,41 @@ class Yellowstone(BaseProvider):
             raise RuntimeError(f"error_message: {re}") from re
         return content
 
+    @staticmethod
+    async def make_yellowstone_request_async(
+        endpoint: str, params: Optional[dict] = None
+    ) -> dict:
+        """
+        Try and Retry Fetching Data from the Yellowstone API - From an Event Loop
+
+        Parameters
+        ----------
+        endpoint: str
+            API Endpoint
+        params
+
+        Returns
+        -------
+        dict
+        """
+        retryer = tenacity.AsyncRetrying(
+            wait=tenacity.wait_random_exponential(multiplier=3, max=1800),
+            stop=tenacity.stop.stop_after_delay(6000),
+        )
+        try:
+            async for attempt in retryer:
+                with attempt:
+                    await Yellowstone.acquire_rate_limit_async(url=endpoint)
+                    response = await asyncio.to_thread(
+                        Yellowstone._get_yellowstone_response,
+                        endpoint=endpoint,
+                        params=params,
+                    )
+                    content = Yellowstone._load_yellowstone_response(response=response)
+        except (RuntimeError, tenacity.RetryError) as re:
+            raise RuntimeError(f"error_message: {re}") from re
+        return content
+
     @classmethod
     def _get_api_endpoint(cls, url_path: str, query: Optional[dict] = None) -> str:
         """
@@ -256,7 +500,9 @@ class Yellowstone(BaseProvider):
         Get campsite extra information
 
         Given a DataFrame of campsite availability, return updated Data with details
-        about the actual campsites that are available (i.e Tent Size, RV Length, Etc)
+        about the actual campsites that are available (i.e Tent Size, RV Length, Etc).
+        Every hotel is requested concurrently over the shared session, and the
+        rooms are returned in hotel order.
 
         Parameters
         ----------
@@ -269,33 +515,161 @@ class Yellowstone(BaseProvider):
         -------
         List[dict]
         """
-        available_room_array = []
-        availability_df = DataFrame(data=available_campsites)
-        if availability_df.empty is True:
-            return available_room_array
-        for facility_id, _facility_df in availability_df.groupby(
-            YellowstoneConfig.FACILITY_ID
+        facility_ids = self._get_campsite_facility_ids(
+            available_campsites=available_campsites
+        )
+        facility_rooms: List[List[dict]] = [[] for _ in facility_ids]
+        for index, availabilities in map_concurrently(
+            func=self._get_facility_availability,
+            arguments=[
+                {"facility_id": facility_id, "month": month, "nights": nights}
+                for facility_id in facility_ids
+            ],
+            workers=YellowstoneConfig.POOL_SIZE,
         ):
-            api_endpoint = self._get_api_endpoint(
-                url_path=YellowstoneConfig.YELLOWSTONE_CAMPSITE_AVAILABILITY, query=None
-            )
-            params = {"date": self._ensure_current_month(month=month), "limit": 31}
-            if nights is not None:
-                params.update({"nights": nights})
-            campsite_data = self.make_yellowstone_request(
-                endpoint=f"{api_endpoint}/{facility_id}", params=params
-            )
-            campsite_availability = campsite_data[
-                YellowstoneConfig.BOOKING_AVAILABILITY
+            facility_rooms[index] = availabilities
+        return list(chain.from_iterable(facility_rooms))
+
+    async def _gather_campsite_specific_availability_async(
+        self,
+        available_campsites: List[dict],
+        month: datetime,
+        nights: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        Get campsite extra information - From an Event Loop
+
+        Every hotel is requested at once, the rooms are returned in the same
+        order as `_gather_campsite_specific_availability`.
+
+        Parameters
+        ----------
+        available_campsites: List[dict]
+            List of Available Campsites as JSON objects
+        month: datetime
+            Month object
+        nights: Optional[int]
+            Search for consecutive nights
+
+        Returns
+        -------
+        List[dict]
+        """
+        facility_ids = self._get_campsite_facility_ids(
+            available_campsites=available_campsites
+        )
+        facility_responses = await asyncio.gather(
+            *[
+                self.make_yellowstone_request_async(
+                    **self._get_facility_availability_request(
+                        facility_id=facility_id, month=month, nights=nights
+                    )
+                )
+                for facility_id in facility_ids
             ]
-            booking_dates = campsite_availability.keys()
-            availabilities = self._process_daily_availability(
-                booking_dates=booking_dates,
-                campsite_availability=campsite_availability,
-                facility_id=facility_id,
+        )
+        return list(
+            chain.from_iterable(
+                self._process_facility_availability(
+                    facility_id=facility_id, campsite_data=campsite_data
+                )
+                for facility_id, campsite_data in zip(facility_ids, facility_responses)
             )
-            available_room_array += availabilities
-        return available_room_array
+        )
+
+    @classmethod
+    def _get_campsite_facility_ids(cls, available_campsites: List[dict]) -> List[str]:
+        """
+        Get the Unique Hotels of the Available Campsites, Sorted
+
+        Parameters
+        ----------
+        available_campsites: List[dict]
+
+        Returns
+        -------
+        List[str]
+        """
+        availability_df = DataFrame(data=available_campsites)
+        if availability_df.empty is True:
+            return []
+        return sorted(availability_df[YellowstoneConfig.FACILITY_ID].unique())
+
+    def _get_facility_availability(
+        self, facility_id: str, month: datetime, nights: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Get the Available Rooms of a Single Hotel
+
+        Parameters
+        ----------
+        facility_id: str
+            Identification of the Facility
+        month: datetime
+            Month object
+        nights: Optional[int]
+            Search for consecutive nights
+
+        Returns
+        -------
+        List[dict]
+        """
+        campsite_data = self.make_yellowstone_request(
+            **self._get_facility_availability_request(
+                facility_id=facility_id, month=month, nights=nights
+            )
+        )
+        return self._process_facility_availability(
+            facility_id=facility_id, campsite_data=campsite_data
+        )
+
+    def _get_facility_availability_request(
+        self, facility_id: str, month: datetime, nights: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the Endpoint and Query Parameters of a Hotel's Availability Request
+
+        Parameters
+        ----------
+        facility_id: str
+        month: datetime
+        nights: Optional[int]
+
+        Returns
+        -------
+        Dict[str, Any]
+            `endpoint` and `params` of the request
+        """
+        api_endpoint = self._get_api_endpoint(
+            url_path=YellowstoneConfig.YELLOWSTONE_CAMPSITE_AVAILABILITY, query=None
+        )
+        params = {"date": self._ensure_current_month(month=month), "limit": 31}
+        if nights is not None:
+            params.update({"nights": nights})
+        return {"endpoint": f"{api_endpoint}/{facility_id}", "params": params}
+
+    @classmethod
+    def _process_facility_availability(
+        cls, facility_id: str, campsite_data: Dict[str, Any]
+    ) -> List[dict]:
+        """
+        Get the Available Rooms of a Hotel's Availability Response
+
+        Parameters
+        ----------
+        facility_id: str
+        campsite_data: Dict[str, Any]
+
+        Returns
+        -------
+        List[dict]
+        """
+        campsite_availability = campsite_data[YellowstoneConfig.BOOKING_AVAILABILITY]
+        return cls._process_daily_availability(
+            booking_dates=campsite_availability.keys(),
+            campsite_availability=campsite_availability,
+            facility_id=facility_id,
+        )
 
     @classmethod
     def _process_daily_availability(
@@ -346,45 +720,257 @@ class Yellowstone(BaseProvider):
         """
         Gather Information About All Campgrounds / Hotels within Yellowstone
 
+        Property information is cached for the life of the process and on disk.
+        Only hotels without a fresh cache entry are requested, concurrently.
+
         Parameters
         ----------
         available_rooms: List[dict]
 
+        Returns
+        -------
+        List[dict]
+        """
+        facility_identifiers = self._get_property_identifiers(
+            available_rooms=available_rooms
+        )
+        property_infos = self._get_cached_property_info(
+            facility_ids=facility_identifiers
+        )
+        missing_ids = [
+            facility_id
+            for facility_id in facility_identifiers
+            if facility_id not in property_infos
+        ]
+        for index, campsite_info in map_concurrently(
+            func=self.make_yellowstone_request,
+            arguments=[
+                {"endpoint": self._get_property_endpoint(facility_id=facility_id)}
+                for facility_id in missing_ids
+            ],
+            workers=YellowstoneConfig.POOL_SIZE,
+        ):
+            property_infos[missing_ids[index]] = self._cache_property_info(
+                facility_id=missing_ids[index], campsite_info=campsite_info
+            )
+        return self._compile_property_information(
+            facility_ids=facility_identifiers, property_infos=property_infos
+        )
+
+    async def _get_property_information_async(
+        self, available_rooms: List[dict]
+    ) -> List[dict]:
+        """
+        Gather Information About All Campgrounds / Hotels - From an Event Loop
+
+        Every hotel without a fresh cache entry is requested at once.
+
+        Parameters
+        ----------
+        available_rooms: List[dict]
+
+        Returns
+        -------
+        List[dict]
+        """
+        facility_identifiers = self._get_property_identifiers(
+            available_rooms=available_rooms
+        )
+        property_infos = self._get_cached_property_info(
+            facility_ids=facility_identifiers
+        )
+        missing_ids = [
+            facility_id
+            for facility_id in facility_identifiers
+            if facility_id not in property_infos
+        ]
+        property_responses = await asyncio.gather(
+            *[
+                self.make_yellowstone_request_async(
+                    endpoint=self._get_property_endpoint(facility_id=facility_id)
+                )
+                for facility_id in missing_ids
+            ]
+        )
+        for facility_id, campsite_info in zip(missing_ids, property_responses):
+            property_infos[facility_id] = self._cache_property_info(
+                facility_id=facility_id, campsite_info=campsite_info
+            )
+        return self._compile_property_information(
+            facility_ids=facility_identifiers, property_infos=property_infos
+        )
+
+    def _get_cached_property_info(
+        self, facility_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the Fresh, Cached Property Information of Hotels
+
+        The in-process cache is checked first, then the disk cache.
+
+        Parameters
+        ----------
+        facility_ids: List[str]
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            Property information keyed by hotel, hotels without a fresh entry
+            are left out
+        """
+        cache = self.property_info_cache
+        property_infos = {}
+        for facility_id in facility_ids:
+            with Yellowstone._property_info_lock:
+                entry = Yellowstone._property_info.get(facility_id)
+            if entry is None or not cache.is_fresh(entry):
+                entry = cache.get(key=self._get_property_cache_key(facility_id))
+                if entry is None or not cache.is_fresh(entry):
+                    continue
+                with Yellowstone._property_info_lock:
+                    Yellowstone._property_info[facility_id] = entry
+            property_infos[facility_id] = entry.data
+        return property_infos
+
+    def _cache_property_info(
+        self, facility_id: str, campsite_info: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Store Freshly Fetched Property Information in Both Caches
+
+        Parameters
+        ----------
+        facility_id: str
+        campsite_info: Dict[str, Any]
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        cache = self.property_info_cache
+        key = self._get_property_cache_key(facility_id=facility_id)
+        try:
+            entry = cache.set(key=key, data=campsite_info)
+        except OSError as e:
+            logger.warning("Unable to cache property information: %s", e)
+            entry = DiskCacheEntry(
+                key=key,
+                version=cache.version,
+                fetched_at=datetime.utcnow(),
+                data=campsite_info,
+            )
+        with Yellowstone._property_info_lock:
+            Yellowstone._property_info[facility_id] = entry
+        return campsite_info
+
+    @classmethod
+    def _get_property_cache_key(cls, facility_id: str) -> str:
+        """
+        Get the Cache Key of a Hotel, Safe to Use as a File Name
+
+        Parameters
+        ----------
+        facility_id: str
+
+        Returns
+        -------
+        str
+        """
+        return parse.quote(facility_id, safe="")
+
+    @classmethod
+    def _compile_property_information(
+        cls, facility_ids: List[str], property_infos: Dict[str, Dict[str, Any]]
+    ) -> List[dict]:
+        """
+        Flatten the Property Information of Hotels, in Hotel Order
+
+        Parameters
+        ----------
+        facility_ids: List[str]
+        property_infos: Dict[str, Dict[str, Any]]
+
         Returns
         -------
         List[dict]
         """
         property_info_array = []
+        for facility_id in facility_ids:
+            property_info_array.extend(
+                cls._process_property_information(
+                    facility_id=facility_id, campsite_info=property_infos[facility_id]
+                )
+            )
+        return property_info_array
+
+    @classmethod
+    def _get_property_identifiers(cls, available_rooms: List[dict]) -> List[str]:
+        """
+        Get the Unique Hotels of the Available Rooms
+
+        Parameters
+        ----------
+        available_rooms: List[dict]
+
+        Returns
+        -------
+        List[str]
+        """
         availability_df = DataFrame(data=available_rooms)
         if availability_df.empty is True:
-            return property_info_array
-        facility_identifiers = availability_df[YellowstoneConfig.FACILITY_ID].unique()
-        for facility_id in facility_identifiers:
-            api_endpoint = self._get_api_endpoint(
-                url_path=YellowstoneConfig.YELLOWSTONE_PROPERTY_INFO, query=None
-            )
-            campsite_info = self.make_yellowstone_request(
-                endpoint=f"{api_endpoint}/{facility_id}"
+            return []
+        return availability_df[YellowstoneConfig.FACILITY_ID].unique().tolist()
+
+    @classmethod
+    def _get_property_endpoint(cls, facility_id: str) -> str:
+        """
+        Get the Property Information Endpoint of a Hotel
+
+        Parameters
+        ----------
+        facility_id: str
+
+        Returns
+        -------
+        str
+        """
+        api_endpoint = cls._get_api_endpoint(
+            url_path=YellowstoneConfig.YELLOWSTONE_PROPERTY_INFO, query=None
+        )
+        return f"{api_endpoint}/{facility_id}"
+
+    @classmethod
+    def _process_property_information(
+        cls, facility_id: str, campsite_info: Dict[str, Any]
+    ) -> List[dict]:
+        """
+        Flatten the Property Information of a Single Hotel
+
+        Parameters
+        ----------
+        facility_id: str
+        campsite_info: Dict[str, Any]
+
+        Returns
+        -------
+        List[dict]
+        """
+        property_info_array = []
+        for campsite_code, campsite_data in campsite_info.items():
+            property_info_array.append(
+                {
+                    "facility_id": facility_id,
+                    "campsite_code": campsite_code,
+                    "campsite_title": campsite_data[YellowstoneConfig.LODGING_TITLE],
+                    "campsite_type": campsite_data[
+                        YellowstoneConfig.FACILITY_TYPE
+                    ].upper(),
+                    "capacity": (
+                        campsite_data[YellowstoneConfig.LODGING_OCCUPANCY_BASE],
+                        campsite_data[YellowstoneConfig.LODGING_OCCUPANCY_MAX],
+                    ),
+                }
             )
-            campsite_codes = campsite_info.keys()
-            for campsite_code in campsite_codes:
-                campsite_data = campsite_info[campsite_code]
-                property_info_array.append(
-                    {
-                        "facility_id": facility_id,
-                        "campsite_code": campsite_code,
-                        "campsite_title": campsite_data[
-                            YellowstoneConfig.LODGING_TITLE
-                        ],
-                        "campsite_type": campsite_data[
-                            YellowstoneConfig.FACILITY_TYPE
-                        ].upper(),
-                        "capacity": (
-                            campsite_data[YellowstoneConfig.LODGING_OCCUPANCY_BASE],
-                            campsite_data[YellowstoneConfig.LODGING_OCCUPANCY_MAX],
-                        ),
-                    }
-                )
         return property_info_array
 
     def get_monthly_campsites(
@@ -404,6 +990,75 @@ class Yellowstone(BaseProvider):
         -------
         List[AvailableCampsite]
         """
+        availability_found = self._get_monthly_availability(
+            month=self._get_search_date(month=month), nights=nights
+        )
+        campsite_data, available_room_array = self._process_monthly_availability(
+            availability_found=availability_found, month=month, nights=nights
+        )
+        if campsite_data.empty is True:
+            return []
+        property_info = self._get_property_information(
+            available_rooms=available_room_array
+        )
+        return self._compile_monthly_campsites(
+            campsite_data=campsite_data,
+            available_room_array=available_room_array,
+            property_info=property_info,
+            nights=nights,
+        )
+
+    async def get_monthly_campsites_async(
+        self, month: datetime, nights: Optional[int] = None
+    ) -> List[AvailableCampsite]:
+        """
+        Return All Campsites Available in a Given Month - From an Event Loop
+
+        Parameters
+        ----------
+        month: datetime
+            Month to Search
+        nights: Optional[int]
+            Search for consecutive nights
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
+        availability_found = await self._get_monthly_availability_async(
+            month=self._get_search_date(month=month), nights=nights
+        )
+        (
+            campsite_data,
+            available_room_array,
+        ) = await self._process_monthly_availability_async(
+            availability_found=availability_found, month=month, nights=nights
+        )
+        if campsite_data.empty is True:
+            return []
+        property_info = await self._get_property_information_async(
+            available_rooms=available_room_array
+        )
+        return self._compile_monthly_campsites(
+            campsite_data=campsite_data,
+            available_room_array=available_room_array,
+            property_info=property_info,
+            nights=nights,
+        )
+
+    @classmethod
+    def _get_search_date(cls, month: datetime) -> datetime:
+        """
+        Get the First Searchable Day of a Month
+
+        Parameters
+        ----------
+        month: datetime
+
+        Returns
+        -------
+        datetime
+        """
         now = datetime.now().date()
         search_date = month.replace(day=1)
         if month <= now:
@@ -413,9 +1068,83 @@ class Yellowstone(BaseProvider):
             search_date = search_date.replace(
                 year=now.year, month=now.month, day=now.day
             )
-        availability_found = self._get_monthly_availability(
-            month=search_date, nights=nights
+        return search_date
+
+    def _process_monthly_availability(
+        self,
+        availability_found: dict,
+        month: datetime,
+        nights: Optional[int] = None,
+    ) -> Tuple[DataFrame, List[dict]]:
+        """
+        Get the Available Lodging and Rooms of a Monthly Availability Response
+
+        Parameters
+        ----------
+        availability_found: dict
+        month: datetime
+        nights: Optional[int]
+
+        Returns
+        -------
+        Tuple[DataFrame, List[dict]]
+            The available lodging and the individual available rooms
+        """
+        campsite_data, monthly_campsites = self._get_available_lodging(
+            availability_found=availability_found
+        )
+        if campsite_data.empty is True:
+            return campsite_data, []
+        available_room_array = self._gather_campsite_specific_availability(
+            available_campsites=monthly_campsites, month=month, nights=nights
+        )
+        return campsite_data, available_room_array
+
+    async def _process_monthly_availability_async(
+        self,
+        availability_found: dict,
+        month: datetime,
+        nights: Optional[int] = None,
+    ) -> Tuple[DataFrame, List[dict]]:
+        """
+        Get the Available Lodging and Rooms of a Month - From an Event Loop
+
+        Parameters
+        ----------
+        availability_found: dict
+        month: datetime
+        nights: Optional[int]
+
+        Returns
+        -------
+        Tuple[DataFrame, List[dict]]
+            The available lodging and the individual available rooms
+        """
+        campsite_data, monthly_campsites = self._get_available_lodging(
+            availability_found=availability_found
         )
+        if campsite_data.empty is True:
+            return campsite_data, []
+        available_room_array = await self._gather_campsite_specific_availability_async(
+            available_campsites=monthly_campsites, month=month, nights=nights
+        )
+        return campsite_data, available_room_array
+
+    def _get_available_lodging(
+        self, availability_found: dict
+    ) -> Tuple[DataFrame, List[dict]]:
+        """
+        Get the Available Lodging of a Monthly Availability Response
+
+        Parameters
+        ----------
+        availability_found: dict
+
+        Returns
+        -------
+        Tuple[DataFrame, List[dict]]
+            The unique available lodging and every available night of it
+        """
         availability = XantResortData(**availability_found)
         monthly_campsites = self._compile_campground_availabilities(
             availability=availability
@@ -423,15 +1152,30 @@ class Yellowstone(BaseProvider):
         campsite_data = DataFrame(
             monthly_campsites, columns=YellowstoneConfig.CAMPSITE_DATA_COLUMNS
         ).drop_duplicates()
-        if campsite_data.empty is True:
-            return []
-        available_room_array = self._gather_campsite_specific_availability(
-            available_campsites=monthly_campsites, month=month, nights=nights
-        )
+        return campsite_data, monthly_campsites
+
+    def _compile_monthly_campsites(
+        self,
+        campsite_data: DataFrame,
+        available_room_array: List[dict],
+        property_info: List[dict],
+        nights: Optional[int] = None,
+    ) -> List[AvailableCampsite]:
+        """
+        Merge Available Rooms with their Lodging and Property Information
+
+        Parameters
+        ----------
+        campsite_data: DataFrame
+        available_room_array: List[dict]
+        property_info: List[dict]
+        nights: Optional[int]
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
         available_rooms = DataFrame(available_room_array)
-        property_info = self._get_property_information(
-            available_rooms=available_room_array
-        )
         properties = DataFrame(property_info)
         merged_campsites = available_rooms.merge(
             properties,
@@ -2,33 +2,55 @@
 Recreation.gov Web Searching Utilities
 """
 
-import json
+import asyncio
 import logging
 import pathlib
-import pickle
 from abc import ABC, abstractmethod
 from datetime import datetime
-from itertools import groupby, islice, tee
-from operator import itemgetter
 from os import getenv
 from time import sleep
-from typing import Any, Dict, Generator, Iterable, List, Optional, Sequence, Set, Union
-
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
 import pandas as pd
 import tenacity
-from pandas import DataFrame, Series, Timedelta, concat, date_range
-from pydantic.json import pydantic_encoder
+from pandas import DataFrame, Series, Timedelta
 
 from camply.config import CampsiteContainerFields, DataColumns, SearchConfig
-from camply.containers import AvailableCampsite, CampgroundFacility, SearchWindow
+from camply.containers import (
+    AvailabilityFilter,
+    AvailableCampsite,
+    CampgroundFacility,
+    SearchWindow,
+)
+from camply.containers.campsite_record import construct_campsite
 from camply.containers.data_containers import ListedCampsite
-from camply.exceptions import CamplyError, CampsiteNotFoundError
+from camply.exceptions import CampsiteNotFoundError
 from camply.notifications.base_notifications import BaseNotifications
 from camply.notifications.multi_provider_notifications import MultiNotifierProvider
 from camply.providers import ProviderType
+from camply.search.polling_scheduler import PollingScheduler
 from camply.utils import make_list
+from camply.utils.coalescing import request_coalescer
+from camply.utils.concurrency import map_concurrently
 from camply.utils.general_utils import days_of_the_week_base
 from camply.utils.logging_utils import get_emoji
+from camply.utils.offline_store import (
+    OfflineCampsiteStore,
+    get_campsite_key,
+    get_offline_store,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +72,8 @@ class BaseCampingSearch(ABC):
         offline_search: bool = False,
         offline_search_path: Optional[str] = None,
         days_of_the_week: Optional[Sequence[int]] = None,
+        workers: Optional[int] = None,
+        campsite_finder: Optional[ProviderType] = None,
         **kwargs,
     ) -> None:
         """
@@ -73,9 +97,17 @@ class BaseCampingSearch(ABC):
             When not specified, the filename will default to `camply_campsites.json`
         days_of_the_week: Optional[Sequence[int]]
             Days of the week (by weekday integer) to search for.
+        workers: Optional[int]
+            Number of concurrent requests to make when fetching availability.
+            Defaults to 1, which searches each campground / month serially.
+        campsite_finder: Optional[ProviderType]
+            An existing provider to search with, so several searches can share
+            its sessions and caches. Defaults to a new `provider_class` instance.
         """
         self._verbose = kwargs.get("verbose", True)
-        self.campsite_finder: ProviderType = self.provider_class()
+        self.campsite_finder: ProviderType = (
+            campsite_finder if campsite_finder is not None else self.provider_class()
+        )
         self.search_window: List[SearchWindow] = make_list(search_window)
         self.days_of_the_week = set(
             days_of_the_week if days_of_the_week is not None else ()
@@ -87,10 +119,14 @@ class BaseCampingSearch(ABC):
         if len(self.days_of_the_week) == 0:
             self.days_of_the_week = {0, 1, 2, 3, 4, 5, 6}
         self._original_search_days: List[datetime] = self._get_search_days()
+        self._original_search_day_array: np.ndarray = np.array(
+            self._original_search_days, dtype="datetime64[D]"
+        )
         self._original_search_months: List[
             datetime
         ] = self.campsite_finder.get_search_months(self._original_search_days)
         self.nights = self._validate_consecutive_nights(nights=nights)
+        self.workers = self._validate_workers(workers=workers)
         if offline_search_path is not None:
             self.offline_search = True
         else:
@@ -100,24 +136,28 @@ class BaseCampingSearch(ABC):
         )
         self.campsites_found: Set[AvailableCampsite] = set()
         self.loaded_campsites: Set[AvailableCampsite] = set()
-        if self.offline_search_path.suffixes[-1] == ".json":
-            self.offline_mode: str = "json"
-        elif self.offline_search_path.suffixes[-1] in [".pkl", ".pickle"]:
-            self.offline_mode: str = "pickle"
-        else:
-            raise CamplyError(
-                "You must provide a `.json` or a `.pickle` / `.pkl` file name for offline searches"
-            )
+        self.offline_store: OfflineCampsiteStore = get_offline_store(
+            path=self.offline_search_path
+        )
+        self.offline_mode: str = self.offline_store.mode
         if self.offline_search is True:
             logger.info(
                 "Campsite search is configured to save offline: %s",
                 self.offline_search_path,
             )
-            self.campsites_found: Set[
-                AvailableCampsite
-            ] = self.load_campsites_from_file()
-            self.loaded_campsites: Set[AvailableCampsite] = self.campsites_found.copy()
+            if self.offline_store.append_only is True:
+                stored_campsites = self.offline_store.initialize()
+                if stored_campsites > 0:
+                    logger.info(
+                        "%s campsites loaded from file: %s",
+                        stored_campsites,
+                        self.offline_search_path,
+                    )
+            else:
+                self.campsites_found = self.load_campsites_from_file()
+                self.loaded_campsites = self.campsites_found.copy()
         self.search_attempts: int = 0
+        self.poll_scheduler: Optional[PollingScheduler] = None
 
     @property
     def search_days(self) -> List[datetime]:
@@ -148,6 +188,20 @@ class BaseCampingSearch(ABC):
         List[AvailableCampsite]
         """
 
+    async def get_all_campsites_async(self) -> List[AvailableCampsite]:
+        """
+        Perform the Search and Return Matching Availabilities - From an Event Loop
+
+        Searches with an asynchronous provider fetch every request of the
+        search on the event loop. By default the synchronous search runs in a
+        worker thread, so it doesn't block the event loop.
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
+        return await asyncio.to_thread(self.get_all_campsites)
+
     @property
     @abstractmethod
     def provider_class(self) -> ProviderType:
@@ -155,32 +209,76 @@ class BaseCampingSearch(ABC):
         Provider Class Dependency Injection
         """
 
-    def _get_intersection_date_overlap(
-        self,
-        date: datetime,
-        periods: int,
-        search_days: List[datetime],
-    ) -> bool:
+    @property
+    def search_day_array(self) -> np.ndarray:
+        """
+        Get the Sorted `datetime64[D]` Array of the Days that need to be Searched
+        """
+        today = np.datetime64(datetime.now().date(), "D")
+        first_day = np.searchsorted(self._original_search_day_array, today)
+        return self._original_search_day_array[first_day:]
+
+    @property
+    def availability_filter(self) -> AvailabilityFilter:
+        """
+        Get the Search Days and Minimum Stay, for Providers to Apply While Parsing
+        """
+        return AvailabilityFilter(search_days=self.search_days, nights=self.nights)
+
+    @staticmethod
+    def _get_date_overlap(
+        start_dates: np.ndarray,
+        nights: np.ndarray,
+        search_days: np.ndarray,
+    ) -> np.ndarray:
         """
-        Find Date Overlap
+        Find Which Stays Overlap at Least One Search Day
+
+        A stay covers the days `[start, start + nights)`. Since the search days
+        are sorted, the number of them inside each stay is the difference of
+        two binary searches, which keeps this O(n log m) for n stays and m
+        search days.
 
         Parameters
         ----------
-        date: datetime
-        periods: int
-        search_days: List[datetime]
+        start_dates: np.ndarray
+            First night of each stay
+        nights: np.ndarray
+            Number of nights of each stay
+        search_days: np.ndarray
+            Sorted `datetime64[D]` array of the days to search
 
         Returns
         -------
-        bool
+        np.ndarray
+            Boolean mask of the stays that overlap a search day
         """
-        timestamp_range = date_range(start=date, periods=periods)
-        campsite_date_range = {item.date() for item in timestamp_range}
-        intersection = campsite_date_range.intersection(search_days)
-        if intersection:
-            return True
-        else:
-            return False
+        start_dates = np.asarray(start_dates, dtype="datetime64[D]")
+        end_dates = start_dates + np.asarray(nights, dtype="timedelta64[D]")
+        first_match = np.searchsorted(search_days, start_dates)
+        last_match = np.searchsorted(search_days, end_dates)
+        return last_match > first_match
+
+    @classmethod
+    def _get_booking_day_array(cls, booking_dates: Sequence[datetime]) -> np.ndarray:
+        """
+        Get the Days of Booking Dates, at Their Local Wall Time
+
+        Timezone aware dates have their timezone dropped rather than being
+        converted to UTC, the same way `_filter_date_overlap` handles them.
+
+        Parameters
+        ----------
+        booking_dates: Sequence[datetime]
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return np.array(
+            [booking_date.replace(tzinfo=None) for booking_date in booking_dates],
+            dtype="datetime64[D]",
+        )
 
     def _compare_date_overlap(self, campsite: AvailableCampsite) -> bool:
         """
@@ -194,12 +292,14 @@ class BaseCampingSearch(ABC):
         -------
         bool
         """
-        intersection = self._get_intersection_date_overlap(
-            date=campsite.booking_date,
-            periods=campsite.booking_nights,
-            search_days=self.search_days,
+        overlap = self._get_date_overlap(
+            start_dates=self._get_booking_day_array(
+                booking_dates=[campsite.booking_date]
+            ),
+            nights=np.array([campsite.booking_nights]),
+            search_days=self.search_day_array,
         )
-        return intersection
+        return bool(overlap[0])
 
     def _filter_date_overlap(self, campsites: DataFrame) -> pd.DataFrame:
         """
@@ -213,13 +313,15 @@ class BaseCampingSearch(ABC):
         -------
         pd.DataFrame
         """
-        matches = campsites.apply(
-            lambda x: self._get_intersection_date_overlap(
-                date=x.booking_date.to_pydatetime(),
-                periods=x.booking_nights,
-                search_days=self.search_days,
-            ),
-            axis=1,
+        if campsites.empty:
+            return campsites.copy().reset_index(drop=True)
+        booking_dates = pd.to_datetime(campsites[DataColumns.BOOKING_DATE_COLUMN])
+        if booking_dates.dt.tz is not None:
+            booking_dates = booking_dates.dt.tz_localize(None)
+        matches = self._get_date_overlap(
+            start_dates=booking_dates.to_numpy(dtype="datetime64[D]"),
+            nights=campsites[DataColumns.BOOKING_NIGHTS_COLUMN].to_numpy(),
+            search_days=self.search_day_array,
         )
         filtered_campsites = campsites[matches].copy().reset_index(drop=True)
         return filtered_campsites
@@ -243,15 +345,29 @@ class BaseCampingSearch(ABC):
         -------
         List[AvailableCampsite]
         """
-        matching_campgrounds = []
-        for camp in self.get_all_campsites():
-            if all(
-                [
-                    self._compare_date_overlap(campsite=camp) is True,
-                    camp.booking_nights >= self.nights,
-                ]
-            ):
-                matching_campgrounds.append(camp)
+        with request_coalescer.tick():
+            all_campsites = list(self.get_all_campsites())
+        if self.poll_scheduler is not None:
+            self.poll_scheduler.record_poll(
+                key=self,
+                campsites=all_campsites,
+                requests_per_poll=self.get_requests_per_poll(),
+                stay_start=self._get_stay_start(),
+            )
+        booking_nights = np.array(
+            [camp.booking_nights for camp in all_campsites], dtype=np.int64
+        )
+        overlap = self._get_date_overlap(
+            start_dates=self._get_booking_day_array(
+                booking_dates=[camp.booking_date for camp in all_campsites]
+            ),
+            nights=booking_nights,
+            search_days=self.search_day_array,
+        )
+        matches = overlap & (booking_nights >= self.nights)
+        matching_campgrounds = [
+            camp for camp, match in zip(all_campsites, matches) if match
+        ]
         logger.info(
             f"{(get_emoji(matching_campgrounds) + ' ') * 4}{len(matching_campgrounds)} "
             "Reservable Campsites Matching Search Preferences"
@@ -261,7 +377,7 @@ class BaseCampingSearch(ABC):
         )
         if (
             self.offline_search is True
-            and self.loaded_campsites.issuperset(matching_campgrounds)
+            and self._all_campsites_loaded(campsites=matching_campgrounds)
             and raise_error is True
         ):
             campsite_availability_message = (
@@ -302,6 +418,76 @@ class BaseCampingSearch(ABC):
         polling_interval_minutes = int(round(float(polling_interval), 2))
         return polling_interval_minutes
 
+    def get_requests_per_poll(self) -> int:
+        """
+        Estimate the Number of Availability Requests a Single Poll Makes
+
+        Returns
+        -------
+        int
+        """
+        campgrounds = getattr(self, "campgrounds", None) or [None]
+        return max(len(campgrounds) * len(self.search_months), 1)
+
+    def schedule_polling(
+        self,
+        polling_interval: Optional[int],
+        poll_scheduler: Optional[PollingScheduler] = None,
+        requests_per_hour: Optional[float] = None,
+    ) -> PollingScheduler:
+        """
+        Register the Search with an Adaptive Polling Scheduler
+
+        Parameters
+        ----------
+        polling_interval: Optional[int]
+            Configured minutes between polls, the scheduler adapts from there
+        poll_scheduler: Optional[PollingScheduler]
+            Scheduler shared with other searches, defaults to a new scheduler
+        requests_per_hour: Optional[float]
+            Hourly request budget of a new scheduler
+
+        Returns
+        -------
+        PollingScheduler
+        """
+        if poll_scheduler is None:
+            poll_scheduler = PollingScheduler(requests_per_hour=requests_per_hour)
+        poll_scheduler.register(
+            key=self,
+            base_interval=self._get_polling_minutes(polling_interval=polling_interval)
+            * 60,
+            requests_per_poll=self.get_requests_per_poll(),
+            stay_start=self._get_stay_start(),
+            release_times=self.campsite_finder.RATE_LIMIT_CONFIG.RELEASE_TIMES,
+            release_timezone=self.campsite_finder.RATE_LIMIT_CONFIG.RELEASE_TIMEZONE,
+        )
+        self.poll_scheduler = poll_scheduler
+        return poll_scheduler
+
+    def _get_stay_start(self) -> Optional[datetime]:
+        """
+        Get the First Night Still Being Searched For
+
+        Returns
+        -------
+        Optional[datetime]
+        """
+        search_days = self.search_days
+        return min(search_days) if search_days else None
+
+    def get_polling_wait(self) -> float:
+        """
+        Seconds to Wait Before the Next Poll, According to the Scheduler
+
+        Returns
+        -------
+        float
+        """
+        wait = self.poll_scheduler.get_interval(key=self)
+        logger.info(f"Searching again in {round(wait / 60, 1)} minutes.")
+        return wait
+
     def _continuous_search_retry(
         self,
         log: bool,
@@ -346,12 +532,14 @@ class BaseCampingSearch(ABC):
         )
         self.notifier = MultiNotifierProvider(provider=notification_provider)
         logger.info(
-            f"Searching for campsites every {polling_interval_minutes} minutes. "
+            f"Searching for campsites about every {polling_interval_minutes} minutes. "
         )
         self.notifier.log_providers()
+        if self.poll_scheduler is None:
+            self.schedule_polling(polling_interval=polling_interval)
         retryer = tenacity.Retrying(
             retry=tenacity.retry_if_exception_type(CampsiteNotFoundError),
-            wait=tenacity.wait.wait_fixed(int(polling_interval_minutes) * 60),
+            wait=lambda retry_state: self.get_polling_wait(),
         )
         matching_campsites = retryer.__call__(
             fn=self._search_matching_campsites_available,
@@ -359,38 +547,77 @@ class BaseCampingSearch(ABC):
             verbose=False,
             raise_error=not search_once,
         )
-        found_campsites = set(matching_campsites)
-        new_campsites = found_campsites.difference(self.campsites_found)
+        self._notify_new_campsites(
+            matching_campsites=matching_campsites,
+            log=log,
+            verbose=verbose,
+            attempt_number=retryer.statistics.get("attempt_number", 1),
+            continuous_search_attempts=continuous_search_attempts,
+            notify_first_try=notify_first_try,
+        )
+        return list(self.campsites_found)
+
+    def _notify_new_campsites(
+        self,
+        matching_campsites: List[AvailableCampsite],
+        log: bool,
+        verbose: bool,
+        attempt_number: int,
+        continuous_search_attempts: int,
+        notify_first_try: bool,
+    ) -> List[AvailableCampsite]:
+        """
+        Log and Send Notifications for Campsites that Weren't Found Before
+
+        Parameters
+        ----------
+        matching_campsites: List[AvailableCampsite]
+        log: bool
+        verbose: bool
+        attempt_number: int
+            Number of searches it took to find the campsites
+        continuous_search_attempts: int
+        notify_first_try: bool
+
+        Returns
+        -------
+        List[AvailableCampsite]
+            The new campsites
+        """
+        new_campsites = self._get_new_campsites(campsites=matching_campsites)
         self.assemble_availabilities(
             matching_data=list(new_campsites), log=log, verbose=verbose
         )
         logger.info(f"{len(new_campsites)} New Campsites Found.")
         self.campsites_found.update(new_campsites)
         logged_campsites = list(new_campsites)
-        self._handle_notifications(
-            retryer=retryer,
+        notified_campsites = self._handle_notifications(
+            attempt_number=attempt_number,
             notifier=self.notifier,
             logged_campsites=logged_campsites,
             continuous_search_attempts=continuous_search_attempts,
             notify_first_try=notify_first_try,
         )
-        return list(self.campsites_found)
+        if self.offline_search is True:
+            self.offline_store.record_notifications(campsites=notified_campsites)
+        return logged_campsites
 
     @classmethod
     def _handle_notifications(
         cls,
-        retryer: tenacity.Retrying,
+        attempt_number: int,
         notifier: MultiNotifierProvider,
         logged_campsites: List[AvailableCampsite],
         continuous_search_attempts: int,
         notify_first_try: bool,
-    ) -> None:
+    ) -> List[AvailableCampsite]:
         """
         Handle sending notifications
 
         Parameters
         ----------
-        retryer: tenacity.Retrying
+        attempt_number: int
+            Number of searches it took to find the campsites
         notifier: MultiNotifierProvider
         logged_campsites: List[AvailableCampsite]
         continuous_search_attempts: int
@@ -398,9 +625,9 @@ class BaseCampingSearch(ABC):
 
         Returns
         -------
-        None
+        List[AvailableCampsite]
+            The campsites notifications were sent for
         """
-        attempt_number = retryer.statistics.get("attempt_number", 1)
         minimum_first_notify = SearchConfig.MINIMUM_CAMPSITES_FIRST_NOTIFY
         if max([attempt_number, continuous_search_attempts]) > 1:
             logged_campsites = cls._handle_too_many_campsites_found(
@@ -429,6 +656,7 @@ class BaseCampingSearch(ABC):
                 notifier.send_message(message=error_message)
                 logged_campsites = logged_campsites[:minimum_first_notify]
             notifier.send_campsites(campsites=logged_campsites)
+        return logged_campsites
 
     @classmethod
     def _handle_too_many_campsites_found(
@@ -469,6 +697,7 @@ class BaseCampingSearch(ABC):
         notify_first_try: bool = False,
         search_forever: bool = False,
         search_once: bool = False,
+        requests_per_hour: Optional[float] = None,
     ):
         """
         Continuously Search For Campsites
@@ -495,13 +724,17 @@ class BaseCampingSearch(ABC):
             the caveat being that it will never notify about the same campsite.
         search_once: bool
             Whether to only search once (and not actually continuously)
+        requests_per_hour: Optional[float]
+            Used with `continuous=True`, the most requests to make per hour.
+            Defaults to the `POLLING_REQUESTS_PER_HOUR` environment variable,
+            unlimited when it isn't set.
 
         Returns
         -------
         List[AvailableCampsite]
         """
-        polling_interval_minutes = self._get_polling_minutes(
-            polling_interval=polling_interval
+        self.schedule_polling(
+            polling_interval=polling_interval, requests_per_hour=requests_per_hour
         )
         continuous_search = True
         continuous_search_attempts = 1
@@ -523,7 +756,7 @@ class BaseCampingSearch(ABC):
             if search_once is True:
                 continuous_search = False
             elif search_forever is True:
-                sleep(int(polling_interval_minutes) * 60)
+                sleep(self.get_polling_wait())
             else:
                 continuous_search = False
         return list(self.campsites_found)
@@ -538,6 +771,7 @@ class BaseCampingSearch(ABC):
         notify_first_try: bool = False,
         search_forever: bool = False,
         search_once: bool = False,
+        requests_per_hour: Optional[float] = None,
     ) -> List[AvailableCampsite]:
         """
         Perform the Search and Return Matching Availabilities
@@ -566,6 +800,11 @@ class BaseCampingSearch(ABC):
             the caveat being that it will never notify about the same campsite.
         search_once: bool
             Whether to only search once (and not actually continuously)
+        requests_per_hour: Optional[float]
+            Used with `continuous=True`, the most requests to make per hour.
+            Searches poll hot campgrounds more often and back off dead ones
+            within this budget. Defaults to the `POLLING_REQUESTS_PER_HOUR`
+            environment variable, unlimited when it isn't set.
 
         Returns
         -------
@@ -581,6 +820,7 @@ class BaseCampingSearch(ABC):
                     notify_first_try=notify_first_try,
                     search_forever=search_forever,
                     search_once=search_once,
+                    requests_per_hour=requests_per_hour,
                 )
             except Exception as e:
                 if self.search_attempts >= 1:
@@ -649,107 +889,129 @@ class BaseCampingSearch(ABC):
         """
         Consolidate Single Night Campsites into Multiple Night Campsites
 
+        Every campsite's nights are sorted once and split into runs of
+        consecutive nights, every `nights` long window of a run becomes one
+        stay. The windows of all campsites are built together with array
+        operations instead of campsite by campsite.
+
         Parameters
         ----------
         campsite_df: DataFrame
             DataFrame of AvailableCampsites
+        nights: int
+            Number of consecutive nights per stay
 
         Returns
         -------
         pd.DataFrame
         """
-        composed_groupings = []
-        for _, campsite_slice in campsite_df.groupby(
-            [CampsiteContainerFields.CAMPSITE_ID, CampsiteContainerFields.CAMPGROUND_ID]
-        ):
-            # SORT THE VALUES AND CREATE A COPIED SLICE
-            campsite_grouping = campsite_slice.sort_values(
-                by=CampsiteContainerFields.BOOKING_DATE, ascending=True
-            ).copy()
-            # ASSEMBLE THE CAMPSITES AVAILABILITIES INTO GROUPS THAT ARE CONSECUTIVE
-            booking_date = campsite_grouping[CampsiteContainerFields.BOOKING_DATE]
-            date = Timedelta("1d")
-            consecutive_nights = booking_date.diff() != date
-            group_identifier = consecutive_nights.cumsum()
-            campsite_grouping[CampsiteContainerFields.CAMPSITE_GROUP] = group_identifier
-            # USE THE ASSEMBLED GROUPS TO CREATE UPDATED CAMPSITES AND REMOVE DUPLICATES
-            for _campsite_group, campsite_group_slice in campsite_grouping.groupby(
-                CampsiteContainerFields.CAMPSITE_GROUP
-            ):
-                composed_grouping = campsite_group_slice.sort_values(
-                    by=CampsiteContainerFields.BOOKING_DATE, ascending=True
-                ).copy()
-                composed_grouping.drop(
-                    columns=[CampsiteContainerFields.CAMPSITE_GROUP], inplace=True
-                )
-                nightly_breakouts = cls._find_consecutive_nights(
-                    dataframe=composed_grouping, nights=nights
-                )
-                composed_groupings.append(nightly_breakouts)
-        if len(composed_groupings) == 0:
-            composed_groupings = [DataFrame()]
-        return concat(composed_groupings, ignore_index=True)
-
-    @classmethod
-    def _consecutive_subseq(cls, iterable: Iterable, length: int) -> Generator:
-        """
-        Find All Sub Sequences by length Given a List
-
-        See https://tinyurl.com/5av5unjd
-
-        Parameters
-        ----------
-        iterable: Iterable
-        length: int
-
-        Returns
-        -------
-        Generator
-        """
-        for _, consec_run in groupby(enumerate(iterable), lambda x: x[0] - x[1]):
-            k_wise = tee(map(itemgetter(1), consec_run), length)
-            for n, it in enumerate(k_wise):
-                next(islice(it, n, n), None)
-            yield from zip(*k_wise)
+        campsite_keys = [
+            CampsiteContainerFields.CAMPSITE_ID,
+            CampsiteContainerFields.CAMPGROUND_ID,
+        ]
+        campsite_df = campsite_df.dropna(subset=campsite_keys)
+        if campsite_df.empty:
+            return DataFrame()
+        sorted_df = campsite_df.sort_values(
+            by=[*campsite_keys, CampsiteContainerFields.BOOKING_DATE],
+            kind="mergesort",
+            ignore_index=True,
+        )
+        window_starts = cls._find_consecutive_nights(
+            campsite_df=sorted_df, campsite_keys=campsite_keys, nights=nights
+        )
+        if len(window_starts) == 0:
+            return DataFrame()
+        # EVERY ROW OF EVERY WINDOW, AND THE WINDOW EACH ONE BELONGS TO
+        window_rows = (window_starts[:, np.newaxis] + np.arange(nights)).ravel()
+        window_ids = np.repeat(np.arange(len(window_starts)), nights)
+        # NIGHTS OF A WINDOW ONLY SURVIVE IF THEY DIFFER BEYOND THEIR DATES
+        window_fields = {
+            CampsiteContainerFields.BOOKING_DATE,
+            CampsiteContainerFields.BOOKING_END_DATE,
+            CampsiteContainerFields.BOOKING_URL,
+            "booking_nights",
+        }
+        identity_columns = [
+            column
+            for column in sorted_df.columns
+            if column not in AvailableCampsite.__unhashable__
+            and column not in window_fields
+        ]
+        if identity_columns:
+            identities = (
+                sorted_df.groupby(identity_columns, dropna=False, sort=False)
+                .ngroup()
+                .to_numpy()
+            )
+        else:
+            identities = np.zeros(len(sorted_df), dtype=np.int64)
+        duplicated = DataFrame(
+            {"window": window_ids, "identity": identities[window_rows]}
+        ).duplicated()
+        kept = ~duplicated.to_numpy()
+        kept_rows = window_rows[kept]
+        kept_windows = window_ids[kept]
+        booking_dates = sorted_df[CampsiteContainerFields.BOOKING_DATE].to_numpy()
+        booking_end_dates = sorted_df[
+            CampsiteContainerFields.BOOKING_END_DATE
+        ].to_numpy()
+        booking_urls = sorted_df[CampsiteContainerFields.BOOKING_URL].to_numpy()
+        window_start_dates = booking_dates[window_rows].reshape(-1, nights).min(axis=1)
+        window_end_dates = (
+            booking_end_dates[window_rows].reshape(-1, nights).max(axis=1)
+        )
+        consolidated_df = sorted_df.iloc[kept_rows].reset_index(drop=True)
+        consolidated_df[CampsiteContainerFields.BOOKING_DATE] = window_start_dates[
+            kept_windows
+        ]
+        consolidated_df[CampsiteContainerFields.BOOKING_END_DATE] = window_end_dates[
+            kept_windows
+        ]
+        consolidated_df[CampsiteContainerFields.BOOKING_URL] = booking_urls[
+            window_starts
+        ][kept_windows]
+        consolidated_df["booking_nights"] = (
+            consolidated_df[CampsiteContainerFields.BOOKING_END_DATE]
+            - consolidated_df[CampsiteContainerFields.BOOKING_DATE]
+        ).dt.days
+        return consolidated_df
 
     @classmethod
-    def _find_consecutive_nights(cls, dataframe: DataFrame, nights: int) -> DataFrame:
+    def _find_consecutive_nights(
+        cls, campsite_df: DataFrame, campsite_keys: List[str], nights: int
+    ) -> np.ndarray:
         """
-        Explode a DataFrame of Consecutive Nightly Campsite Availabilities,
-
-        Expand to all unique possibilities given the length of the stay.
+        Find Where Every Window of Consecutive Nights Starts
 
         Parameters
         ----------
-        dataframe: DataFrame
+        campsite_df: DataFrame
+            AvailableCampsites, sorted by campsite and booking date
+        campsite_keys: List[str]
+            Columns identifying a campsite
         nights: int
+            Number of consecutive nights per window
 
         Returns
         -------
-        DataFrame
+        np.ndarray
+            Positional index of the first night of every window, in order
         """
-        duplicate_subset = set(dataframe.columns) - AvailableCampsite.__unhashable__
-        dataframe_slice = dataframe.copy().reset_index(drop=True)
-        nights_indexes = dataframe_slice.booking_date.index
-        consecutive_generator = cls._consecutive_subseq(
-            iterable=nights_indexes, length=nights
+        row_count = len(campsite_df)
+        campsite_keys_df = campsite_df[campsite_keys]
+        new_campsite = (
+            (campsite_keys_df != campsite_keys_df.shift()).any(axis=1).to_numpy()
+        )
+        booking_dates = campsite_df[CampsiteContainerFields.BOOKING_DATE]
+        new_run = new_campsite | (booking_dates.diff() != Timedelta("1d")).to_numpy()
+        run_starts = np.flatnonzero(new_run)
+        run_lengths = np.diff(np.append(run_starts, row_count))
+        run_ids = np.cumsum(new_run) - 1
+        nights_remaining = (
+            run_lengths[run_ids] - np.arange(row_count) + run_starts[run_ids]
         )
-        sequences = list(consecutive_generator)
-        concatted_data = []
-        for sequence in sequences:
-            index_list = list(sequence)
-            data_copy = dataframe_slice.iloc[index_list].copy()
-            data_copy.booking_date = data_copy.booking_date.min()
-            data_copy.booking_end_date = data_copy.booking_end_date.max()
-            data_copy.booking_url = data_copy.booking_url.loc[index_list[0]]
-            data_copy.booking_nights = (
-                data_copy.booking_end_date - data_copy.booking_date
-            ).dt.days
-            data_copy.drop_duplicates(inplace=True, subset=duplicate_subset)
-            concatted_data.append(data_copy)
-        if len(concatted_data) == 0:
-            concatted_data = [DataFrame()]
-        return concat(concatted_data, ignore_index=True)
+        return np.flatnonzero(nights_remaining >= nights)
 
     def _validate_consecutive_nights(self, nights: int) -> int:
         """
@@ -782,6 +1044,60 @@ class BaseCampingSearch(ABC):
         else:
             return nights
 
+    @classmethod
+    def _validate_workers(cls, workers: Optional[int]) -> int:
+        """
+        Validate the number of concurrent workers to search with
+
+        Parameters
+        ----------
+        workers: Optional[int]
+            Number of concurrent workers requested
+
+        Returns
+        -------
+        int
+            The proper number of workers to search with
+        """
+        if workers is None:
+            return SearchConfig.DEFAULT_WORKERS
+        workers = int(workers)
+        if workers < 1:
+            logger.warning(
+                "Invalid number of workers selected (%s), searching serially.", workers
+            )
+            return SearchConfig.DEFAULT_WORKERS
+        elif workers > SearchConfig.MAXIMUM_WORKERS:
+            logger.warning(
+                "Too many workers selected. The number of workers will be set to "
+                "the max possible, %s.",
+                SearchConfig.MAXIMUM_WORKERS,
+            )
+            return SearchConfig.MAXIMUM_WORKERS
+        return workers
+
+    def _map_concurrently(
+        self, func: Callable[..., Any], arguments: Sequence[Dict[str, Any]]
+    ) -> Generator[Tuple[int, Any], None, None]:
+        """
+        Call a Function Across a Thread Pool, Yielding Results as They Arrive
+
+        Parameters
+        ----------
+        func: Callable[..., Any]
+            Function to call, typically a provider request method
+        arguments: Sequence[Dict[str, Any]]
+            Keyword arguments for each individual call
+
+        Yields
+        ------
+        Tuple[int, Any]
+            The index of the arguments used and the result of the call
+        """
+        yield from map_concurrently(
+            func=func, arguments=arguments, workers=self.workers
+        )
+
     @staticmethod
     def campsites_to_df(campsites: List[AvailableCampsite]) -> DataFrame:
         """
@@ -806,6 +1122,9 @@ class BaseCampingSearch(ABC):
         """
         Convert Campsite DataFrame to array of AvailableCampsite objects
 
+        The DataFrame holds values that were already parsed, so they aren't
+        validated again.
+
         Parameters
         ----------
         campsite_df: DataFrame
@@ -823,7 +1142,7 @@ class BaseCampingSearch(ABC):
             campsite_record["booking_end_date"] = campsite_record[
                 "booking_end_date"
             ].to_pydatetime()
-            composed_campsite_array.append(AvailableCampsite(**campsite_record))
+            composed_campsite_array.append(construct_campsite(fields=campsite_record))
         return composed_campsite_array
 
     @classmethod
@@ -904,31 +1223,17 @@ class BaseCampingSearch(ABC):
 
     def unload_campsites_to_file(self) -> pathlib.Path:
         """
-        Unload a BaseSearch Object's campsites to a serialized Pickle file.
+        Unload a BaseSearch Object's campsites to its offline file.
+
+        JSON and Pickle files are rewritten with every campsite found while
+        JSON Lines files and SQLite databases only have the new campsites
+        appended.
 
         Returns
         -------
         pathlib.Path
         """
-        if self.offline_mode == "pickle":
-            with open(self.offline_search_path, mode="wb") as file_stream:
-                pickle.dump(
-                    obj=self.campsites_found,
-                    file=file_stream,
-                    protocol=4,
-                    fix_imports=True,
-                )
-                file_stream.seek(0)
-        elif self.offline_mode == "json":
-            with open(self.offline_search_path, mode="w") as file_stream:
-                json.dump(
-                    obj=self.campsites_found,
-                    fp=file_stream,
-                    sort_keys=True,
-                    default=pydantic_encoder,
-                    indent=4,
-                )
-                file_stream.seek(0)
+        self.offline_store.save(campsites=self.campsites_found)
         logger.debug(
             "%s campsites saved to file: %s",
             len(self.campsites_found),
@@ -938,34 +1243,80 @@ class BaseCampingSearch(ABC):
 
     def load_campsites_from_file(self) -> Set[AvailableCampsite]:
         """
-        Load a BaseSearch Object's campsites from a serialized Pickle file.
+        Load a BaseSearch Object's campsites from its offline file.
 
         Returns
         -------
         Set[AvailableCampsite]
         """
-        if self.offline_search_path.exists():
-            if self.offline_mode == "pickle":
-                with open(self.offline_search_path, mode="rb") as file_stream:
-                    campsites: Set[AvailableCampsite] = pickle.load(
-                        file=file_stream, fix_imports=True
-                    )
-            elif self.offline_mode == "json":
-                with open(self.offline_search_path, mode="r") as file_stream:
-                    campsites_dicts: List[Dict[str, Any]] = json.load(file_stream)
-                campsites: Set[AvailableCampsite] = {
-                    AvailableCampsite(**json_dict) for json_dict in campsites_dicts
-                }
-            if len(campsites) > 0:
-                logger.info(
-                    "%s campsites loaded from file: %s",
-                    len(campsites),
-                    self.offline_search_path,
-                )
-        else:
-            campsites = set()
+        campsites = self.offline_store.load()
+        if len(campsites) > 0:
+            logger.info(
+                "%s campsites loaded from file: %s",
+                len(campsites),
+                self.offline_search_path,
+            )
         return campsites
 
+    def _get_new_campsites(
+        self, campsites: Sequence[AvailableCampsite]
+    ) -> Set[AvailableCampsite]:
+        """
+        Get the Campsites Not Found Before, by This Search or Offline
+
+        Parameters
+        ----------
+        campsites: Sequence[AvailableCampsite]
+
+        Returns
+        -------
+        Set[AvailableCampsite]
+        """
+        new_campsites = set(campsites).difference(self.campsites_found)
+        if self._uses_append_only_store() and len(new_campsites) > 0:
+            campsite_keys = {
+                campsite: get_campsite_key(campsite) for campsite in new_campsites
+            }
+            stored_keys = self.offline_store.find_keys(keys=campsite_keys.values())
+            new_campsites = {
+                campsite
+                for campsite, key in campsite_keys.items()
+                if key not in stored_keys
+            }
+        return new_campsites
+
+    def _all_campsites_loaded(self, campsites: Sequence[AvailableCampsite]) -> bool:
+        """
+        Whether Every Campsite Was Already Saved Offline
+
+        Parameters
+        ----------
+        campsites: Sequence[AvailableCampsite]
+
+        Returns
+        -------
+        bool
+        """
+        if self._uses_append_only_store():
+            campsite_keys = {get_campsite_key(campsite) for campsite in campsites}
+            stored_keys = self.offline_store.find_keys(keys=campsite_keys)
+            return len(stored_keys) == len(campsite_keys)
+        return self.loaded_campsites.issuperset(campsites)
+
+    def _uses_append_only_store(self) -> bool:
+        """
+        Whether Campsites Found Offline are Looked Up in the Store
+
+        Append-only stores aren't loaded into memory, the campsites they hold,
+        whether saved by a previous search or a search sharing the file, are
+        looked up by their dedupe keys instead.
+
+        Returns
+        -------
+        bool
+        """
+        return self.offline_search is True and self.offline_store.append_only is True
+
     @staticmethod
     def _set_offline_search_path(file_path: Optional[str]) -> pathlib.Path:
         default_file_path = "camply_campsites.json"
@@ -977,7 +1328,9 @@ class BaseCampingSearch(ABC):
             [
                 returned_path.exists(),
                 returned_path.is_file(),
-                set(returned_path.suffixes).issubset({".pkl", ".pickle", ".json"}),
+                set(returned_path.suffixes).issubset(
+                    {".pkl", ".pickle", ".json", ".jsonl", ".sqlite", ".db"}
+                ),
             ]
         ):
             path_obj = returned_path
@@ -0,0 +1,354 @@
+"""
+Adaptive Polling of Continuous Searches
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, FrozenSet, Hashable, Iterable, Optional, Sequence, Set, Tuple
+
+from pytz import timezone
+
+from camply.config import SearchConfig
+from camply.containers import AvailableCampsite
+
+logger = logging.getLogger(__name__)
+
+
+class PollingState:
+    """
+    What the Scheduler Knows About a Single Search
+    """
+
+    def __init__(
+        self,
+        base_interval: float,
+        requests_per_poll: int,
+        stay_start: Optional[date],
+        release_times: Sequence[str] = (),
+        release_timezone: str = "UTC",
+    ) -> None:
+        """
+        Polling State Initialization
+
+        Parameters
+        ----------
+        base_interval: float
+            Configured seconds between polls
+        requests_per_poll: int
+            Estimated number of requests a single poll makes
+        stay_start: Optional[date]
+            First night being searched for
+        release_times: Sequence[str]
+            Local "HH:MM" times the provider releases new inventory
+        release_timezone: str
+            Timezone of the release times
+        """
+        self.base_interval = float(base_interval)
+        self.requests_per_poll = max(int(requests_per_poll), 1)
+        self.stay_start = stay_start
+        self.release_times = tuple(release_times)
+        self.release_timezone = release_timezone
+        self.change_rates: Dict[Hashable, float] = {}
+        self.availability: Dict[Hashable, FrozenSet[Tuple[Hashable, datetime]]] = {}
+        self.unchanged_polls: int = 0
+        self.polls: int = 0
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+
+        Returns
+        -------
+        str
+        """
+        return (
+            f"<{self.__class__.__name__}: {self.polls} polls, "
+            f"hotness={self.hotness:.2f}>"
+        )
+
+    @property
+    def hotness(self) -> float:
+        """
+        Change Rate of the Most Active Campground, Between 0 and 1
+        """
+        return max(self.change_rates.values(), default=0.0)
+
+
+class PollingScheduler:
+    """
+    Decide How Long to Wait Before Polling Each Search Again
+
+    Every search starts from its configured polling interval, which is then:
+
+    - shortened for searches with a campground whose availability keeps
+      changing, and backed off for searches where nothing has changed for
+      several polls
+    - shortened as the stay gets close, when most cancellations happen, and
+      lengthened for stays far in the future
+    - snapped to just after the provider's next known inventory release
+
+    Intervals never drop below the minimum polling interval, except to catch
+    a release, and when a requests per hour budget is configured, every
+    interval is stretched by the same factor so that all searches together
+    stay within it, hot searches keep their lead over dead ones.
+    """
+
+    def __init__(self, requests_per_hour: Optional[float] = None) -> None:
+        """
+        Polling Scheduler Initialization
+
+        Parameters
+        ----------
+        requests_per_hour: Optional[float]
+            Requests all searches together may make per hour. Defaults to
+            the `POLLING_REQUESTS_PER_HOUR` environment variable, unlimited
+            when neither is set.
+        """
+        if requests_per_hour is None:
+            requests_per_hour = SearchConfig.POLLING_REQUESTS_PER_HOUR
+        if requests_per_hour is not None and float(requests_per_hour) <= 0:
+            raise ValueError("The hourly request budget must be greater than zero")
+        self.requests_per_hour: Optional[float] = (
+            float(requests_per_hour) if requests_per_hour is not None else None
+        )
+        self.minimum_interval: float = SearchConfig.POLLING_INTERVAL_MINIMUM * 60
+        self.states: Dict[Hashable, PollingState] = {}
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+
+        Returns
+        -------
+        str
+        """
+        budget = (
+            "unlimited"
+            if self.requests_per_hour is None
+            else f"{self.requests_per_hour:.0f}"
+        )
+        return (
+            f"<{self.__class__.__name__}: {len(self.states)} searches, "
+            f"{budget} requests per hour>"
+        )
+
+    def register(self, key: Hashable, **kwargs) -> PollingState:
+        """
+        Start Scheduling a Search
+
+        Parameters
+        ----------
+        key: Hashable
+            Identity of the search
+        **kwargs
+            See `PollingState`
+
+        Returns
+        -------
+        PollingState
+        """
+        self.states[key] = PollingState(**kwargs)
+        return self.states[key]
+
+    def unregister(self, key: Hashable) -> None:
+        """
+        Stop Scheduling a Search, Freeing its Share of the Budget
+
+        Parameters
+        ----------
+        key: Hashable
+        """
+        self.states.pop(key, None)
+
+    def record_poll(
+        self,
+        key: Hashable,
+        campsites: Iterable[AvailableCampsite],
+        requests_per_poll: Optional[int] = None,
+        stay_start: Optional[date] = None,
+    ) -> None:
+        """
+        Record the Campsites a Poll Found, Per Campground
+
+        A campground's change rate is a moving average of whether its
+        available campsites and dates changed from one poll to the next.
+        Searches drop nights and months as they pass, so the requests per
+        poll and the first night searched for are updated when given.
+
+        Parameters
+        ----------
+        key: Hashable
+        campsites: Iterable[AvailableCampsite]
+            Every campsite available to the search
+        requests_per_poll: Optional[int]
+            Current estimate of the number of requests a single poll makes
+        stay_start: Optional[date]
+            First night still being searched for
+        """
+        state = self.states.get(key)
+        if state is None:
+            return
+        if requests_per_poll is not None:
+            state.requests_per_poll = max(int(requests_per_poll), 1)
+        if stay_start is not None:
+            state.stay_start = stay_start
+        availability: Dict[Hashable, Set[Tuple[Hashable, datetime]]] = {}
+        for campsite in campsites:
+            availability.setdefault(campsite.facility_id, set()).add(
+                (campsite.campsite_id, campsite.booking_date)
+            )
+        decay = SearchConfig.POLLING_CHANGE_DECAY
+        any_changes = False
+        for campground in set(availability).union(state.availability):
+            current = frozenset(availability.get(campground, ()))
+            changed = state.polls > 0 and state.availability.get(campground) != current
+            any_changes = any_changes or changed
+            state.change_rates[campground] = (1 - decay) * state.change_rates.get(
+                campground, 0.0
+            ) + decay * float(changed)
+            state.availability[campground] = current
+        state.unchanged_polls = 0 if any_changes else state.unchanged_polls + 1
+        state.polls += 1
+
+    def get_interval(self, key: Hashable, now: Optional[datetime] = None) -> float:
+        """
+        Seconds to Wait Before Polling a Search Again
+
+        Parameters
+        ----------
+        key: Hashable
+        now: Optional[datetime]
+            Defaults to the current time
+
+        Returns
+        -------
+        float
+        """
+        if now is None:
+            now = datetime.now(tz=timezone("UTC"))
+        state = self.states[key]
+        interval = self._get_adaptive_interval(state=state, today=now.date())
+        interval *= self._get_budget_factor(today=now.date())
+        until_release = self._get_seconds_until_release(state=state, now=now)
+        if until_release is not None and until_release < interval:
+            interval = until_release
+        return interval
+
+    def _get_adaptive_interval(self, state: PollingState, today: date) -> float:
+        """
+        A Search's Interval, Before Applying the Budget
+
+        Parameters
+        ----------
+        state: PollingState
+        today: date
+
+        Returns
+        -------
+        float
+        """
+        change_factor = 1 - SearchConfig.POLLING_HOT_SPEEDUP * state.hotness
+        backoff_factor = min(
+            SearchConfig.POLLING_BACKOFF_RATE**state.unchanged_polls,
+            SearchConfig.POLLING_BACKOFF_MAXIMUM,
+        )
+        interval = (
+            state.base_interval
+            * change_factor
+            * backoff_factor
+            * self._get_proximity_factor(stay_start=state.stay_start, today=today)
+        )
+        return min(
+            max(interval, self.minimum_interval),
+            max(state.base_interval, self.minimum_interval)
+            * SearchConfig.POLLING_BACKOFF_MAXIMUM,
+        )
+
+    @classmethod
+    def _get_proximity_factor(cls, stay_start: Optional[date], today: date) -> float:
+        """
+        Poll More Often as the Stay Gets Closer
+
+        Parameters
+        ----------
+        stay_start: Optional[date]
+        today: date
+
+        Returns
+        -------
+        float
+        """
+        if stay_start is None:
+            return 1.0
+        if isinstance(stay_start, datetime):
+            stay_start = stay_start.date()
+        days_until_stay = (stay_start - today).days
+        for days, factor in SearchConfig.POLLING_PROXIMITY_FACTORS:
+            if days_until_stay <= days:
+                return factor
+        return SearchConfig.POLLING_DISTANT_STAY_FACTOR
+
+    def _get_budget_factor(self, today: date) -> float:
+        """
+        Stretch Every Interval so All Searches Stay Within the Budget
+
+        Parameters
+        ----------
+        today: date
+
+        Returns
+        -------
+        float
+        """
+        if self.requests_per_hour is None or len(self.states) == 0:
+            return 1.0
+        requests_per_hour = sum(
+            state.requests_per_poll
+            * 3600
+            / self._get_adaptive_interval(state=state, today=today)
+            for state in self.states.values()
+        )
+        return max(requests_per_hour / self.requests_per_hour, 1.0)
+
+    @classmethod
+    def _get_seconds_until_release(
+        cls, state: PollingState, now: datetime
+    ) -> Optional[float]:
+        """
+        Seconds Until Just After the Provider's Next Inventory Release
+
+        Parameters
+        ----------
+        state: PollingState
+        now: datetime
+            Timezone aware current time
+
+        Returns
+        -------
+        Optional[float]
+        """
+        if len(state.release_times) == 0:
+            return None
+        local_timezone = timezone(state.release_timezone)
+        local_now = now.astimezone(local_timezone)
+        upcoming_releases = []
+        for release_time in state.release_times:
+            hour, minute = (int(part) for part in release_time.split(":"))
+            for days in (0, 1):
+                release_day = local_now.date() + timedelta(days=days)
+                release = local_timezone.localize(
+                    datetime(
+                        release_day.year,
+                        release_day.month,
+                        release_day.day,
+                        hour,
+                        minute,
+                    )
+                )
+                if release > local_now:
+                    upcoming_releases.append(release)
+                    break
+        next_release = min(upcoming_releases)
+        return (
+            next_release - local_now
+        ).total_seconds() + SearchConfig.POLLING_RELEASE_DELAY
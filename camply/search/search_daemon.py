@@ -0,0 +1,322 @@
+"""
+Run Many Campsite Searches in a Single Process
+"""
+
+import logging
+import pathlib
+from time import monotonic, sleep
+from typing import Any, Dict, List, Optional, Sequence, Type, Union
+
+from camply.containers import AvailableCampsite
+from camply.exceptions import CamplyError, CampsiteNotFoundError
+from camply.notifications.multi_provider_notifications import MultiNotifierProvider
+from camply.providers import ProviderType
+from camply.search import CAMPSITE_SEARCH_PROVIDER
+from camply.search.base_search import BaseCampingSearch
+from camply.search.polling_scheduler import PollingScheduler
+from camply.utils import yaml_utils
+from camply.utils.coalescing import request_coalescer
+from camply.utils.concurrency import map_concurrently
+
+logger = logging.getLogger(__name__)
+
+
+class DaemonSearch:
+    """
+    A Single Search Run by the `SearchDaemon`
+
+    Each search keeps its own notifier, the campsites it has already found
+    (so it never notifies about the same campsite twice) and its own base
+    polling interval. A poll never sleeps, waiting between polls is left to
+    the daemon's scheduler. The hourly request budget belongs to the daemon,
+    a `requests_per_hour` of a single search is ignored.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        camping_finder: BaseCampingSearch,
+        search_kwargs: Dict[str, Any],
+    ) -> None:
+        """
+        Initialize a Search from `get_matching_campsites` Arguments
+
+        Parameters
+        ----------
+        name: str
+            Name of the search, typically its YAML file
+        camping_finder: BaseCampingSearch
+        search_kwargs: Dict[str, Any]
+            Keyword arguments of `BaseCampingSearch.get_matching_campsites`
+        """
+        self.name = name
+        self.camping_finder = camping_finder
+        self.log: bool = search_kwargs.get("log", True)
+        self.verbose: bool = search_kwargs.get("verbose", True)
+        self.continuous: bool = search_kwargs.get("continuous", True)
+        self.search_once: bool = search_kwargs.get("search_once", False)
+        self.search_forever: bool = search_kwargs.get("search_forever", False)
+        self.notify_first_try: bool = search_kwargs.get("notify_first_try", False)
+        self.polling_interval_minutes = camping_finder._get_polling_minutes(
+            polling_interval=search_kwargs.get("polling_interval")
+        )
+        self.camping_finder.notifier = MultiNotifierProvider(
+            provider=search_kwargs.get("notification_provider", "silent")
+        )
+        if search_kwargs.get("requests_per_hour") is not None:
+            logger.warning(
+                "%s: requests_per_hour is ignored when searches run together, "
+                "set --requests-per-hour or POLLING_REQUESTS_PER_HOUR instead",
+                name,
+            )
+        self.next_poll: float = 0.0
+        self.attempt_number: int = 0
+        self.continuous_search_attempts: int = 1
+        self.finished: bool = False
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+
+        Returns
+        -------
+        str
+        """
+        return f"<{self.__class__.__name__}: {self.name}>"
+
+    def poll(self) -> List[AvailableCampsite]:
+        """
+        Search Once, Notifying About Any New Campsites
+
+        Follows the same rules as `BaseCampingSearch.get_matching_campsites`:
+        continuous searches finish once campsites are found, unless they
+        search forever, and `search_once` searches finish after a single poll.
+
+        Returns
+        -------
+        List[AvailableCampsite]
+            The new campsites found by the poll
+        """
+        finder = self.camping_finder
+        if self.continuous is False and self.search_once is False:
+            self.finished = True
+            matching_campsites = finder._search_matching_campsites_available(
+                log=self.log, verbose=True
+            )
+            new_campsites = finder._get_new_campsites(campsites=matching_campsites)
+            finder.campsites_found.update(new_campsites)
+            self._unload_campsites(new_campsites=new_campsites)
+            return list(new_campsites)
+        self.attempt_number += 1
+        try:
+            matching_campsites = finder._search_matching_campsites_available(
+                log=False, verbose=False, raise_error=not self.search_once
+            )
+        except CampsiteNotFoundError:
+            return []
+        new_campsites = finder._notify_new_campsites(
+            matching_campsites=matching_campsites,
+            log=self.log,
+            verbose=self.verbose,
+            attempt_number=self.attempt_number,
+            continuous_search_attempts=self.continuous_search_attempts,
+            notify_first_try=self.notify_first_try,
+        )
+        self._unload_campsites(new_campsites=new_campsites)
+        if self.search_once is True or self.search_forever is False:
+            self.finished = True
+        else:
+            self.attempt_number = 0
+            self.continuous_search_attempts += 1
+        return new_campsites
+
+    def _unload_campsites(self, new_campsites: Sequence[AvailableCampsite]) -> None:
+        """
+        Save the Campsites Found Offline When New Campsites Were Found
+
+        Parameters
+        ----------
+        new_campsites: Sequence[AvailableCampsite]
+        """
+        if self.camping_finder.offline_search is True and len(new_campsites) > 0:
+            self.camping_finder.unload_campsites_to_file()
+
+
+class SearchDaemon:
+    """
+    Run Many Campsite Searches on a Single Scheduler
+
+    Searches of the same provider share a single provider instance, and with
+    it its sessions and metadata caches, while every provider shares the
+    process-wide rate limiter. Identical availability requests made by searches
+    polled together are only fetched once. Searches that are due at the same time are
+    polled concurrently, one search failing never stops the others. Each
+    search is polled adaptively, with every search sharing one hourly
+    request budget, see `PollingScheduler`.
+    """
+
+    __yaml_suffixes__ = (".yaml", ".yml")
+
+    def __init__(
+        self,
+        searches: Sequence[DaemonSearch],
+        workers: Optional[int] = None,
+        requests_per_hour: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize with the Searches to Run
+
+        Parameters
+        ----------
+        searches: Sequence[DaemonSearch]
+        workers: Optional[int]
+            Number of due searches to poll concurrently
+        requests_per_hour: Optional[float]
+            The most requests all searches together may make per hour
+        """
+        self.searches: List[DaemonSearch] = list(searches)
+        self.workers: int = BaseCampingSearch._validate_workers(workers=workers)
+        self.poll_scheduler = PollingScheduler(requests_per_hour=requests_per_hour)
+        for search in self.searches:
+            search.camping_finder.schedule_polling(
+                polling_interval=search.polling_interval_minutes,
+                poll_scheduler=self.poll_scheduler,
+            )
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+
+        Returns
+        -------
+        str
+        """
+        return f"<{self.__class__.__name__}: {len(self.searches)} searches>"
+
+    @classmethod
+    def from_directory(
+        cls,
+        directory: Union[str, pathlib.Path],
+        workers: Optional[int] = None,
+        requests_per_hour: Optional[float] = None,
+    ) -> "SearchDaemon":
+        """
+        Load Every YAML Search Configuration of a Directory
+
+        Parameters
+        ----------
+        directory: Union[str, pathlib.Path]
+        workers: Optional[int]
+            Number of due searches to poll concurrently
+        requests_per_hour: Optional[float]
+            The most requests all searches together may make per hour
+
+        Returns
+        -------
+        SearchDaemon
+        """
+        yaml_files = sorted(
+            path
+            for path in pathlib.Path(directory).iterdir()
+            if path.suffix.lower() in cls.__yaml_suffixes__
+        )
+        if len(yaml_files) == 0:
+            raise CamplyError(f"No YAML search configurations found in {directory}")
+        providers: Dict[Type[ProviderType], ProviderType] = {}
+        searches: List[DaemonSearch] = []
+        for yaml_file in yaml_files:
+            (
+                provider,
+                provider_kwargs,
+                search_kwargs,
+            ) = yaml_utils.yaml_file_to_arguments(file_path=str(yaml_file))
+            search_class = CAMPSITE_SEARCH_PROVIDER[provider]
+            provider_class = search_class.provider_class
+            if provider_class not in providers:
+                providers[provider_class] = provider_class()
+            camping_finder = search_class(
+                campsite_finder=providers[provider_class], **provider_kwargs
+            )
+            searches.append(
+                DaemonSearch(
+                    name=yaml_file.name,
+                    camping_finder=camping_finder,
+                    search_kwargs=search_kwargs,
+                )
+            )
+        logger.info(
+            "%s searches loaded across %s providers", len(searches), len(providers)
+        )
+        return cls(
+            searches=searches, workers=workers, requests_per_hour=requests_per_hour
+        )
+
+    @property
+    def active_searches(self) -> List[DaemonSearch]:
+        """
+        Searches that Haven't Finished Yet
+        """
+        return [search for search in self.searches if search.finished is False]
+
+    def run(self) -> None:
+        """
+        Poll Every Search when it's Due, Until Every Search has Finished
+        """
+        logger.info("Running %s searches", len(self.searches))
+        while self.active_searches:
+            now = monotonic()
+            due_searches = [
+                search for search in self.active_searches if search.next_poll <= now
+            ]
+            if len(due_searches) == 0:
+                next_poll = min(search.next_poll for search in self.active_searches)
+                sleep(next_poll - now)
+                continue
+            self.poll_searches(searches=due_searches)
+        logger.info("All searches have finished")
+
+    def poll_searches(self, searches: Sequence[DaemonSearch]) -> None:
+        """
+        Poll Searches Concurrently and Let the Scheduler Pick their Next Polls
+
+        The searches are polled within a single polling tick, searches
+        watching the same facility and month share a single request.
+
+        Parameters
+        ----------
+        searches: Sequence[DaemonSearch]
+        """
+        with request_coalescer.tick():
+            list(
+                map_concurrently(
+                    func=self._poll_search,
+                    arguments=[{"search": search} for search in searches],
+                    workers=self.workers,
+                )
+            )
+        polled_at = monotonic()
+        for search in searches:
+            if search.finished is True:
+                self.poll_scheduler.unregister(key=search.camping_finder)
+            else:
+                search.next_poll = polled_at + self.poll_scheduler.get_interval(
+                    key=search.camping_finder
+                )
+
+    @classmethod
+    def _poll_search(cls, search: DaemonSearch) -> None:
+        """
+        Poll a Single Search, Stopping Only that Search When it Fails
+
+        Parameters
+        ----------
+        search: DaemonSearch
+        """
+        logger.info("Polling search: %s", search.name)
+        try:
+            search.poll()
+        except Exception as e:
+            logger.exception("Search %s failed and has been stopped", search.name)
+            search.finished = True
+            if search.camping_finder.search_attempts >= 1:
+                search.camping_finder.notifier.last_gasp(error=e)
@@ -2,13 +2,15 @@
 Going To Camp API search utilities
 """
 
+import asyncio
 import logging
 import sys
-from datetime import datetime, time
-from typing import Any, List, Optional, Union
+from datetime import date, datetime, time
+from typing import Any, List, Optional, Tuple, Union
 
 from camply.containers import (
     AvailableCampsite,
+    AvailableResource,
     CampgroundFacility,
     RecreationArea,
     SearchWindow,
@@ -146,66 +148,136 @@ class SearchGoingToCamp(BaseCampingSearch):
                     start_date=current_start_date,
                     end_date=search_window.end_date,
                     equipment_type_id=self.equipment_id,
+                    workers=self.workers,
                 )
-                for site in sites:
-                    site_details = self.campsite_finder.get_site_details(
-                        self._recreation_area_id, site.resource_id
-                    )
-                    nights = (search_window.end_date - current_start_date).days
-                    start_dt = datetime.combine(current_start_date, time.min)
-                    end_dt = datetime.combine(search_window.end_date, time.min)
-                    (
-                        rec_area_domain_name,
-                        rec_area,
-                    ) = self.campsite_finder.rec_area_lookup(
-                        rec_area_id=self._recreation_area_id
-                    )
-                    booking_url = self.campsite_finder.get_reservation_link(
-                        rec_area_domain_name,
-                        resource_location_id=campground.facility_id,
-                        map_id=site.map_id,
-                        equipment_id=NON_GROUP_EQUIPMENT,
-                        sub_equipment_id=self.equipment_id,
-                        party_size=1,
-                        start_date=current_start_date,
-                        end_date=search_window.end_date,
-                    )
-
-                    # Some rec areas have zero-capacity sites, which should not
-                    # be viable for camping. Skip all zero-capacity sites.
-                    if (
-                        not site_details["minCapacity"]
-                        or not site_details["maxCapacity"]
-                    ):
-                        continue
-
-                    available_sites.append(
-                        AvailableCampsite(
-                            campsite_id=site_details["resourceId"],
-                            campsite_site_name=site_details["localizedValues"][0][
-                                "name"
-                            ],
-                            booking_date=start_dt,
-                            booking_end_date=end_dt,
-                            booking_nights=nights,
-                            campsite_loop_name="Unknown",
-                            campsite_type=site_details["site_attributes"].get(
-                                "Service Type", "Unknown"
-                            ),
-                            campsite_occupancy=(
-                                site_details["minCapacity"],
-                                site_details["maxCapacity"],
-                            ),
-                            campsite_use_type="N/A",
-                            availability_status="Available",
-                            recreation_area=rec_area.recreation_area,
-                            recreation_area_id=self._recreation_area_id,
-                            facility_name=campground.facility_name,
-                            facility_id=campground.facility_id,
-                            booking_url=booking_url,
-                        )
-                    )
+                available_sites += self._get_available_sites(
+                    campground=campground,
+                    search_window=search_window,
+                    current_start_date=current_start_date,
+                    sites=sites,
+                )
+        return available_sites
+
+    async def get_all_campsites_async(self) -> List[AvailableCampsite]:
+        """
+        Search for all campsites matching search criteria - From an Event Loop
+
+        The map trees of every campground / search window are crawled at once.
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
+        search_tasks: List[Tuple[SearchWindow, date, CampgroundFacility]] = [
+            (search_window, search_window.get_current_start_date(), campground)
+            for search_window in self.search_window
+            for campground in self.campgrounds
+        ]
+        all_sites = await asyncio.gather(
+            *[
+                self.campsite_finder.list_site_availability_async(
+                    campground=campground,
+                    start_date=current_start_date,
+                    end_date=search_window.end_date,
+                    equipment_type_id=self.equipment_id,
+                )
+                for search_window, current_start_date, campground in search_tasks
+            ]
+        )
+        available_sites = []
+        for (search_window, current_start_date, campground), sites in zip(
+            search_tasks, all_sites
+        ):
+            available_sites += await asyncio.to_thread(
+                self._get_available_sites,
+                campground=campground,
+                search_window=search_window,
+                current_start_date=current_start_date,
+                sites=sites,
+            )
+        return available_sites
 
+    def _get_available_sites(
+        self,
+        campground: CampgroundFacility,
+        search_window: SearchWindow,
+        current_start_date: date,
+        sites: List[AvailableResource],
+    ) -> List[AvailableCampsite]:
+        """
+        Get the Details of the Available Sites of a Campground / Search Window
+
+        Parameters
+        ----------
+        campground: CampgroundFacility
+        search_window: SearchWindow
+        current_start_date: date
+        sites: List[AvailableResource]
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
+        available_sites = []
+        self.campsite_finder.warm_site_details(
+            rec_area_id=self._recreation_area_id,
+            resource_ids=[site.resource_id for site in sites],
+            workers=self.workers,
+        )
+        for site in sites:
+            site_details = self.campsite_finder.get_site_details(
+                self._recreation_area_id, site.resource_id
+            )
+            nights = (search_window.end_date - current_start_date).days
+            start_dt = datetime.combine(current_start_date, time.min)
+            end_dt = datetime.combine(search_window.end_date, time.min)
+            (
+                rec_area_domain_name,
+                rec_area,
+            ) = self.campsite_finder.rec_area_lookup(
+                rec_area_id=self._recreation_area_id
+            )
+            booking_url = self.campsite_finder.get_reservation_link(
+                rec_area_domain_name,
+                resource_location_id=campground.facility_id,
+                map_id=site.map_id,
+                equipment_id=NON_GROUP_EQUIPMENT,
+                sub_equipment_id=self.equipment_id,
+                party_size=1,
+                start_date=current_start_date,
+                end_date=search_window.end_date,
+            )
+
+            # Some rec areas have zero-capacity sites, which should not
+            # be viable for camping. Skip all zero-capacity sites.
+            if not site_details["minCapacity"] or not site_details["maxCapacity"]:
+                continue
+
+            available_sites.append(
+                AvailableCampsite(
+                    campsite_id=site_details["resourceId"],
+                    campsite_site_name=site_details["localizedValues"][0]["name"],
+                    booking_date=start_dt,
+                    booking_end_date=end_dt,
+                    booking_nights=nights,
+                    campsite_loop_name="Unknown",
+                    campsite_type=site_details["site_attributes"].get(
+                        "Service Type", "Unknown"
+                    ),
+                    campsite_occupancy=(
+                        site_details["minCapacity"],
+                        site_details["maxCapacity"],
+                    ),
+                    campsite_use_type="N/A",
+                    availability_status="Available",
+                    recreation_area=rec_area.recreation_area,
+                    recreation_area_id=self._recreation_area_id,
+                    facility_name=campground.facility_name,
+                    facility_id=campground.facility_id,
+                    booking_url=booking_url,
+                )
+            )
+        self.campsite_finder.save_site_details(rec_area_id=self._recreation_area_id)
         return available_sites
 
     def _get_searchable_campgrounds(self) -> List[CampgroundFacility]:
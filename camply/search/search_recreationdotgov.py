@@ -2,18 +2,24 @@
 Recreation.gov Web Searching Utilities
 """
 
+import asyncio
 import logging
 from abc import ABC
-from random import uniform
-from time import sleep
-from typing import List, Optional, Tuple, Union
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 
-from camply.config import RecreationBookingConfig
 from camply.config.search_config import EquipmentConfig, EquipmentOptions
-from camply.containers import AvailableCampsite, CampgroundFacility, SearchWindow
+from camply.containers import (
+    AvailabilityBatch,
+    AvailabilitySnapshot,
+    AvailableCampsite,
+    CampgroundFacility,
+    SearchWindow,
+)
 from camply.containers.api_responses import RecDotGovCampsite, RecDotGovSearchResult
+from camply.containers.base_container import RecDotGovEquipment
 from camply.containers.data_containers import ListedCampsite
 from camply.exceptions import SearchError
 from camply.providers import (
@@ -109,6 +115,13 @@ class SearchRecreationDotGovBase(BaseCampingSearch, ABC):
         self.campsites = make_list(campsites)
         self.campgrounds = self._get_searchable_campgrounds()
         self.campsite_metadata: Optional[pd.DataFrame] = None
+        self._availability_snapshots: Dict[
+            Tuple[int, datetime], Tuple[AvailabilitySnapshot, AvailabilityBatch]
+        ] = {}
+        self._availability_changed: bool = True
+        self._compiled_campsites: Optional[
+            Tuple[List[datetime], List[AvailableCampsite]]
+        ] = None
         self.equipment: List[Tuple[str, Optional[int]]] = []
         self.equipment = self._get_searchable_equipment(equipment=equipment)
 
@@ -236,7 +249,76 @@ class SearchRecreationDotGovBase(BaseCampingSearch, ABC):
         -------
         List[AvailableCampsite]
         """
-        found_campsites = []
+        found_campsites = AvailabilityBatch()
+        self._prepare_campground_search()
+        self._availability_changed = False
+        if self.workers > 1:
+            found_campsites = self._get_all_campsites_concurrently()
+        else:
+            for campground in self.campgrounds:
+                for month in self.search_months:
+                    self._log_campground_month(campground=campground, month=month)
+                    availabilities = self.campsite_finder.get_recdotgov_data(
+                        campground_id=campground.facility_id, month=month
+                    )
+                    found_campsites.extend(
+                        self._process_campground_month(
+                            campground=campground,
+                            month=month,
+                            availabilities=availabilities,
+                        )
+                    )
+        return self._compile_found_campsites(found_campsites=found_campsites)
+
+    async def get_all_campsites_async(self) -> List[AvailableCampsite]:
+        """
+        Perform the Search and Return All Monthly Availabilities - From an Event Loop
+
+        Every campground / month is requested at once, the shared rate limit
+        paces the requests without holding a thread per pending request.
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
+        await asyncio.to_thread(self._prepare_campground_search)
+        self._availability_changed = False
+        search_tasks: List[Tuple[CampgroundFacility, datetime]] = [
+            (campground, month)
+            for campground in self.campgrounds
+            for month in self.search_months
+        ]
+        for campground, month in search_tasks:
+            self._log_campground_month(campground=campground, month=month)
+        all_availabilities = await asyncio.gather(
+            *[
+                self.campsite_finder.get_recdotgov_data_async(
+                    campground_id=campground.facility_id, month=month
+                )
+                for campground, month in search_tasks
+            ]
+        )
+        found_campsites = AvailabilityBatch.concat(
+            batches=[
+                self._process_campground_month(
+                    campground=campground, month=month, availabilities=availabilities
+                )
+                for (campground, month), availabilities in zip(
+                    search_tasks, all_availabilities
+                )
+            ]
+        )
+        return self._compile_found_campsites(found_campsites=found_campsites)
+
+    def _prepare_campground_search(self) -> None:
+        """
+        Make Sure there are Campgrounds to Search and their Metadata is Fetched
+
+        Raises
+        ------
+        SearchError
+            When there are no campgrounds to search
+        """
         if len(self.campgrounds) == 0:
             error_message = "No campgrounds found to search"
             logger.error(error_message)
@@ -245,46 +327,35 @@ class SearchRecreationDotGovBase(BaseCampingSearch, ABC):
         if self.campsite_metadata is None:
             self.campsite_metadata = (
                 self.campsite_finder.get_internal_campsite_metadata(
-                    facility_ids=[facil.facility_id for facil in self.campgrounds]
+                    facility_ids=[facil.facility_id for facil in self.campgrounds],
+                    workers=self.workers,
                 )
             )
             logger.info(
                 "Metadata fetched for %s campsites", len(self.campsite_metadata)
             )
-        for index, campground in enumerate(self.campgrounds):
-            for month in self.search_months:
-                logger.info(
-                    f"Searching {campground.facility_name}, {campground.recreation_area} "
-                    f"({campground.facility_id}) for availability: "
-                    f"{month.strftime('%B, %Y')}"
-                )
-                availabilities = self.campsite_finder.get_recdotgov_data(
-                    campground_id=campground.facility_id, month=month
-                )
-                campsites = self.campsite_finder.process_campsite_availability(
-                    availability=availabilities,
-                    recreation_area=campground.recreation_area,
-                    recreation_area_id=campground.recreation_area_id,
-                    facility_name=campground.facility_name,
-                    facility_id=campground.facility_id,
-                    month=month,
-                    campsite_metadata=self.campsite_metadata,
-                )
-                logger.info(
-                    f"\t{logging_utils.get_emoji(campsites)}\t"
-                    f"{len(campsites)} total sites found in month of "
-                    f"{month.strftime('%B')}"
-                )
-                if self.campsites not in [None, []]:
-                    campsites = [
-                        campsite_obj
-                        for campsite_obj in campsites
-                        if int(campsite_obj.campsite_id) in self.campsites
-                    ]
-                found_campsites += campsites
-                if index + 1 < len(self.campgrounds):
-                    sleep(round(uniform(*RecreationBookingConfig.RATE_LIMITING), 2))
-        campsite_df = self.campsites_to_df(campsites=found_campsites)
+
+    def _compile_found_campsites(
+        self, found_campsites: AvailabilityBatch
+    ) -> List[AvailableCampsite]:
+        """
+        Filter, Consolidate and Validate Every Availability Found by the Search
+
+        Parameters
+        ----------
+        found_campsites: AvailabilityBatch
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
+        search_days = self.search_days
+        if self._availability_changed is False and self._compiled_campsites is not None:
+            compiled_days, compiled_campsites = self._compiled_campsites
+            if compiled_days == search_days:
+                logger.info("No availability changed since the last search")
+                return list(compiled_campsites)
+        campsite_df = found_campsites.to_df()
         campsite_df_validated = self._filter_date_overlap(campsites=campsite_df)
         compiled_campsite_df = self._consolidate_campsites(
             campsite_df=campsite_df_validated, nights=self.nights
@@ -295,8 +366,121 @@ class SearchRecreationDotGovBase(BaseCampingSearch, ABC):
         compiled_campsites = self.df_to_campsites(
             campsite_df=equipment_filtered_campsites
         )
+        self._compiled_campsites = (search_days, compiled_campsites)
+        return list(compiled_campsites)
+
+    def _get_all_campsites_concurrently(self) -> AvailabilityBatch:
+        """
+        Fetch Every Campground / Month Availability Across a Thread Pool
+
+        Requests are shared by the provider's rate limit and each response is
+        processed as soon as it arrives. Results are returned in the same order
+        as the serial search.
+
+        Returns
+        -------
+        AvailabilityBatch
+        """
+        search_tasks: List[Tuple[CampgroundFacility, datetime]] = [
+            (campground, month)
+            for campground in self.campgrounds
+            for month in self.search_months
+        ]
+        logger.info(
+            "Fetching %s campground availabilities across %s workers",
+            len(search_tasks),
+            self.workers,
+        )
+        for campground, month in search_tasks:
+            self._log_campground_month(campground=campground, month=month)
+        task_results: List[AvailabilityBatch] = [
+            AvailabilityBatch() for _ in search_tasks
+        ]
+        for index, availabilities in self._map_concurrently(
+            func=self.campsite_finder.get_recdotgov_data,
+            arguments=[
+                {"campground_id": campground.facility_id, "month": month}
+                for campground, month in search_tasks
+            ],
+        ):
+            campground, month = search_tasks[index]
+            task_results[index] = self._process_campground_month(
+                campground=campground, month=month, availabilities=availabilities
+            )
+        return AvailabilityBatch.concat(batches=task_results)
 
-        return compiled_campsites
+    @classmethod
+    def _log_campground_month(
+        cls, campground: CampgroundFacility, month: datetime
+    ) -> None:
+        """
+        Log the Campground and Month Being Searched
+
+        Parameters
+        ----------
+        campground: CampgroundFacility
+        month: datetime
+        """
+        logger.info(
+            f"Searching {campground.facility_name}, {campground.recreation_area} "
+            f"({campground.facility_id}) for availability: "
+            f"{month.strftime('%B, %Y')}"
+        )
+
+    def _process_campground_month(
+        self,
+        campground: CampgroundFacility,
+        month: datetime,
+        availabilities: Union[Dict[str, Any], List[Dict[str, Any]]],
+    ) -> AvailabilityBatch:
+        """
+        Process the Availability Response of a Single Campground / Month
+
+        Parameters
+        ----------
+        campground: CampgroundFacility
+        month: datetime
+        availabilities: Union[Dict[str, Any], List[Dict[str, Any]]]
+            Raw API Response from `get_recdotgov_data`
+
+        Returns
+        -------
+        AvailabilityBatch
+        """
+        key = (campground.facility_id, month)
+        previous_snapshot, previous_campsites = self._availability_snapshots.get(
+            key, (None, None)
+        )
+        snapshot = self.campsite_finder.process_campsite_availability_changes(
+            availability=availabilities,
+            previous=previous_snapshot,
+            recreation_area=campground.recreation_area,
+            recreation_area_id=campground.recreation_area_id,
+            facility_name=campground.facility_name,
+            facility_id=campground.facility_id,
+            month=month,
+            campsite_metadata=self.campsite_metadata,
+            availability_filter=self.availability_filter,
+        )
+        if snapshot is previous_snapshot:
+            campsites = previous_campsites
+        else:
+            self._availability_changed = True
+            campsites = snapshot.batch
+            if self.campsites not in [None, []]:
+                campsites = campsites.select(
+                    mask=[
+                        int(campsite_id) in self.campsites
+                        for campsite_id in campsites.get_column("campsite_id")
+                    ]
+                )
+            self._availability_snapshots[key] = (snapshot, campsites)
+        logger.info(
+            f"\t{logging_utils.get_emoji(snapshot.batch)}\t"
+            f"{len(snapshot.batch)} total sites found in month of "
+            f"{month.strftime('%B')}"
+        )
+        return campsites
 
     def filter_campsites_to_equipment(self, campsites: pd.DataFrame) -> pd.DataFrame:
         """
@@ -314,7 +498,11 @@ class SearchRecreationDotGovBase(BaseCampingSearch, ABC):
             return campsites
         column_names = ["campsite_id", "permitted_equipment"]
         exploded_data = campsites[column_names].explode("permitted_equipment")
-        expanded_data = exploded_data["permitted_equipment"].apply(pd.Series)
+        expanded_data = (
+            exploded_data["permitted_equipment"]
+            .map(lambda x: x.dict() if isinstance(x, RecDotGovEquipment) else x)
+            .apply(pd.Series)
+        )
         joined_data = pd.DataFrame(
             pd.concat([exploded_data, expanded_data], axis=1),
             columns=[*column_names, "equipment_name", "max_length"],
@@ -390,7 +578,8 @@ class SearchRecreationDotGovBase(BaseCampingSearch, ABC):
         List[ListedCampsite]
         """
         recdotgov_campsites = self.campsite_finder.get_internal_campsites(
-            facility_ids=[item.facility_id for item in self.campgrounds]
+            facility_ids=[item.facility_id for item in self.campgrounds],
+            workers=self.workers,
         )
         listable_campsites = self._get_listable_campsites(campsites=recdotgov_campsites)
         self.log_listed_campsites(
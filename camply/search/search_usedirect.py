@@ -2,16 +2,25 @@
 Search Implementation: Reserve California
 """
 
+import asyncio
 import logging
 import sys
 from abc import ABC, abstractmethod
-from datetime import timedelta
-from typing import Any, Dict, List, Optional, Type, Union
+from datetime import date, timedelta
+from itertools import chain
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
 
 from dateutil.relativedelta import relativedelta
 
-from camply.containers import AvailableCampsite, RecreationArea, SearchWindow
+from camply.config.api_config import UseDirectConfig
+from camply.containers import (
+    AvailableCampsite,
+    CampgroundFacility,
+    RecreationArea,
+    SearchWindow,
+)
 from camply.containers.data_containers import ListedCampsite
+from camply.containers.usedirect import UseDirectGridWindow
 from camply.providers.usedirect.variations import (
     AlabamaStateParks,
     ArizonaStateParks,
@@ -81,6 +90,7 @@ class SearchUseDirect(BaseCampingSearch, ABC):
         self._recreation_area_ids: List[int] = make_list(recreation_area, coerce=int)
         self._campground_ids: List[int] = make_list(campgrounds, coerce=int)
         campsites = make_list(kwargs.get("campsites", []), coerce=int) or []
+        self.campsite_ids: List[int] = campsites
         if len(campsites) > 0:
             self.campsite_finder.validate_campsites(
                 campsites=campsites, facility_ids=self._campground_ids
@@ -128,30 +138,106 @@ class SearchUseDirect(BaseCampingSearch, ABC):
         -------
         List[AvailableCampsite]
         """
+        grid_windows, search_tasks = self._plan_search_tasks()
+        self.campsite_finder.refresh_metadata()
+        if self.workers > 1:
+            logger.info(
+                "Fetching %s campground availabilities across %s workers",
+                len(search_tasks),
+                self.workers,
+            )
+        starting_bytes = self.campsite_finder.grid_bytes
+        task_results: List[List[AvailableCampsite]] = [[] for _ in search_tasks]
+        for index, campsites in self._map_concurrently(
+            func=self._get_campground_window,
+            arguments=[
+                {"campground": campground, "window": window}
+                for window, campground in search_tasks
+            ],
+        ):
+            task_results[index] = campsites
+        self._log_grid_savings(
+            grid_windows=grid_windows,
+            grid_bytes=self.campsite_finder.grid_bytes - starting_bytes,
+        )
+        return self._compile_found_campsites(task_results=task_results)
+
+    async def get_all_campsites_async(self) -> List[AvailableCampsite]:
+        """
+        Retrieve All Campsites from the UseDirect API - From an Event Loop
+
+        Every campground / grid window is requested at once, requests still
+        share the tenant's connection pool and rate limit.
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
+        grid_windows, search_tasks = self._plan_search_tasks()
+        await asyncio.to_thread(self.campsite_finder.refresh_metadata)
+        starting_bytes = self.campsite_finder.grid_bytes
+        task_results = await asyncio.gather(
+            *[
+                self._get_campground_window_async(campground=campground, window=window)
+                for window, campground in search_tasks
+            ]
+        )
+        self._log_grid_savings(
+            grid_windows=grid_windows,
+            grid_bytes=self.campsite_finder.grid_bytes - starting_bytes,
+        )
+        return self._compile_found_campsites(task_results=task_results)
+
+    def _plan_search_tasks(
+        self,
+    ) -> Tuple[
+        List[UseDirectGridWindow], List[Tuple[UseDirectGridWindow, CampgroundFacility]]
+    ]:
+        """
+        Plan the Grid Windows of the Search and Every Campground / Window Request
+
+        Returns
+        -------
+        Tuple[List[UseDirectGridWindow], List[Tuple[UseDirectGridWindow, CampgroundFacility]]]
+        """
         logger.info(f"Searching across {len(self.campgrounds)} campgrounds")
         for campground in self.campgrounds:
             log_str = format_log_string(campground)
             logger.info("    %s", log_str)
-        campsites_found: List[AvailableCampsite] = []
-        for month in self.search_months:
-            for campground in self.campgrounds:
-                logger.info(
-                    f"Searching {campground.facility_name}, {campground.recreation_area} "
-                    f"({campground.facility_id}) for availability: "
-                    f"{month.strftime('%B, %Y')}"
-                )
-                end_date = month + relativedelta(months=1) - timedelta(days=1)
-                campsites = self.campsite_finder.get_campsites(
-                    campground_id=campground.facility_id,
-                    start_date=month,
-                    end_date=end_date,
-                )
-                logger.info(
-                    f"\t{logging_utils.get_emoji(campsites)}\t"
-                    f"{len(campsites)} total sites found in month of "
-                    f"{month.strftime('%B')}"
-                )
-                campsites_found += campsites
+        grid_windows = self.plan_grid_windows(search_days=self.search_days)
+        search_tasks: List[Tuple[UseDirectGridWindow, CampgroundFacility]] = [
+            (window, campground)
+            for window in grid_windows
+            for campground in self.campgrounds
+        ]
+        return grid_windows, search_tasks
+
+    def get_requests_per_poll(self) -> int:
+        """
+        Estimate the Number of Availability Requests a Single Poll Makes
+
+        Returns
+        -------
+        int
+        """
+        grid_windows = self.plan_grid_windows(search_days=self.search_days)
+        return max(len(self.campgrounds) * len(grid_windows), 1)
+
+    def _compile_found_campsites(
+        self, task_results: Sequence[List[AvailableCampsite]]
+    ) -> List[AvailableCampsite]:
+        """
+        Filter and Consolidate the Campsites Found by Every Request
+
+        Parameters
+        ----------
+        task_results: Sequence[List[AvailableCampsite]]
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
+        campsites_found = list(chain.from_iterable(task_results))
         campsite_df = self.campsites_to_df(campsites=campsites_found)
         campsite_df_validated = self._filter_date_overlap(campsites=campsite_df)
         consolidated_campsites = self._consolidate_campsites(
@@ -160,6 +246,190 @@ class SearchUseDirect(BaseCampingSearch, ABC):
         compiled_campsites = self.df_to_campsites(campsite_df=consolidated_campsites)
         return compiled_campsites
 
+    def _get_campground_window(
+        self, campground: CampgroundFacility, window: UseDirectGridWindow
+    ) -> List[AvailableCampsite]:
+        """
+        Fetch the Availability of a Single Campground / Grid Window
+
+        Requests to the same UseDirect tenant share its connection pool and
+        rate limit, requests to different tenants don't wait on each other.
+
+        Parameters
+        ----------
+        campground: CampgroundFacility
+        window: UseDirectGridWindow
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
+        self._log_campground_window(campground=campground, window=window)
+        campsites = self.campsite_finder.get_campsites(
+            campground_id=campground.facility_id,
+            start_date=window.start_date,
+            end_date=window.end_date,
+            campsite_ids=self.campsite_ids,
+            availability_filter=self.availability_filter,
+        )
+        self._log_window_results(campsites=campsites, window=window)
+        return campsites
+
+    async def _get_campground_window_async(
+        self, campground: CampgroundFacility, window: UseDirectGridWindow
+    ) -> List[AvailableCampsite]:
+        """
+        Fetch the Availability of a Single Campground / Grid Window - From an Event Loop
+
+        Parameters
+        ----------
+        campground: CampgroundFacility
+        window: UseDirectGridWindow
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
+        self._log_campground_window(campground=campground, window=window)
+        campsites = await self.campsite_finder.get_campsites_async(
+            campground_id=campground.facility_id,
+            start_date=window.start_date,
+            end_date=window.end_date,
+            campsite_ids=self.campsite_ids,
+            availability_filter=self.availability_filter,
+        )
+        self._log_window_results(campsites=campsites, window=window)
+        return campsites
+
+    def _log_campground_window(
+        self, campground: CampgroundFacility, window: UseDirectGridWindow
+    ) -> None:
+        """
+        Log the Campground and Grid Window Being Searched
+
+        Parameters
+        ----------
+        campground: CampgroundFacility
+        window: UseDirectGridWindow
+        """
+        logger.info(
+            f"Searching {campground.facility_name}, {campground.recreation_area} "
+            f"({campground.facility_id}) for availability: "
+            f"{self._get_window_name(window=window)}"
+        )
+
+    def _log_window_results(
+        self, campsites: List[AvailableCampsite], window: UseDirectGridWindow
+    ) -> None:
+        """
+        Log the Number of Campsites Found in a Grid Window
+
+        Parameters
+        ----------
+        campsites: List[AvailableCampsite]
+        window: UseDirectGridWindow
+        """
+        window_name = self._get_window_name(window=window)
+        if window.start_date.month == window.end_date.month:
+            found_in = f"month of {window.start_date.strftime('%B')}"
+        else:
+            found_in = f"months of {window_name}"
+        logger.info(
+            f"\t{logging_utils.get_emoji(campsites)}\t"
+            f"{len(campsites)} total sites found in {found_in}"
+        )
+
+    @classmethod
+    def _get_window_name(cls, window: UseDirectGridWindow) -> str:
+        """
+        Describe the Months Covered by a Grid Window
+
+        Parameters
+        ----------
+        window: UseDirectGridWindow
+
+        Returns
+        -------
+        str
+        """
+        start_month = window.start_date.strftime("%B, %Y")
+        end_month = window.end_date.strftime("%B, %Y")
+        if start_month == end_month:
+            return start_month
+        return f"{start_month} - {end_month}"
+
+    @classmethod
+    def plan_grid_windows(
+        cls,
+        search_days: Sequence[date],
+        max_days: int = UseDirectConfig.MAX_GRID_DAYS,
+    ) -> List[UseDirectGridWindow]:
+        """
+        Cover the Search Days with the Fewest Availability Grid Requests
+
+        Each window starts on a search day and stretches to the last search day
+        within `max_days` of it. Since `max_days` is never shorter than a month
+        this never takes more requests than searching month by month, and the
+        windows skip the days of each month that aren't searched.
+
+        Parameters
+        ----------
+        search_days: Sequence[date]
+        max_days: int
+            Longest date range the UseDirect grid accepts
+
+        Returns
+        -------
+        List[UseDirectGridWindow]
+        """
+        windows: List[UseDirectGridWindow] = []
+        for day in sorted(search_days):
+            if windows and (day - windows[-1].start_date).days < max_days:
+                windows[-1].end_date = day
+            else:
+                windows.append(UseDirectGridWindow(start_date=day, end_date=day))
+        return windows
+
+    def _log_grid_savings(
+        self, grid_windows: List[UseDirectGridWindow], grid_bytes: int
+    ) -> None:
+        """
+        Log the Requests and Bytes Saved Compared to Monthly Grid Requests
+
+        The bytes saved are estimated from the average size of a grid day
+        downloaded during this poll.
+
+        Parameters
+        ----------
+        grid_windows: List[UseDirectGridWindow]
+        grid_bytes: int
+            Bytes downloaded for `grid_windows`
+        """
+        campground_count = len(self.campgrounds)
+        yesterday = date.today() - timedelta(days=1)
+        monthly_days = sum(
+            (month + relativedelta(months=1) - max(month, yesterday)).days
+            for month in self.search_months
+        )
+        planned_days = sum(window.days for window in grid_windows)
+        requests_saved = (len(self.search_months) - len(grid_windows)) * (
+            campground_count
+        )
+        bytes_saved = 0
+        if planned_days > 0 and campground_count > 0:
+            bytes_per_day = grid_bytes / (planned_days * campground_count)
+            bytes_saved = round(
+                bytes_per_day * (monthly_days - planned_days) * campground_count
+            )
+        logger.info(
+            "%s availability grid requests covering %s days: "
+            "%s requests and ~%s KB saved versus monthly requests",
+            len(grid_windows) * campground_count,
+            planned_days,
+            requests_saved,
+            max(bytes_saved, 0) // 1024,
+        )
+
     @classmethod
     def find_recreation_areas(
         cls, search_string: str, **kwargs
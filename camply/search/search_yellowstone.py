@@ -2,8 +2,10 @@
 Yellowstone Lodging Web Searching Utilities
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
+from itertools import chain
 from typing import Any, List, Optional, Set, Union
 
 import pandas as pd
@@ -81,12 +83,78 @@ class SearchYellowstone(BaseCampingSearch):
         """
         all_campsites = []
         searchable_campgrounds = self._get_searchable_campgrounds()
-        this_month = datetime.now().date().replace(day=1)
-        for month in self.search_months:
-            if month >= this_month:
-                all_campsites += self.campsite_finder.get_monthly_campsites(
+        for month in self._get_current_search_months():
+            all_campsites += self.campsite_finder.get_monthly_campsites(
+                month=month, nights=None if self.nights == 1 else self.nights
+            )
+        return self._compile_found_campsites(
+            all_campsites=all_campsites, searchable_campgrounds=searchable_campgrounds
+        )
+
+    async def get_all_campsites_async(self) -> List[AvailableCampsite]:
+        """
+        Search for all matching campsites in Yellowstone - From an Event Loop
+
+        Every month is requested at once.
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
+        searchable_campgrounds = self._get_searchable_campgrounds()
+        monthly_campsites = await asyncio.gather(
+            *[
+                self.campsite_finder.get_monthly_campsites_async(
                     month=month, nights=None if self.nights == 1 else self.nights
                 )
+                for month in self._get_current_search_months()
+            ]
+        )
+        return self._compile_found_campsites(
+            all_campsites=list(chain.from_iterable(monthly_campsites)),
+            searchable_campgrounds=searchable_campgrounds,
+        )
+
+    def _get_current_search_months(self) -> List[datetime]:
+        """
+        Get the Search Months, Skipping Months Already in the Past
+
+        Returns
+        -------
+        List[datetime]
+        """
+        this_month = datetime.now().date().replace(day=1)
+        return [month for month in self.search_months if month >= this_month]
+
+    def get_requests_per_poll(self) -> int:
+        """
+        Estimate the Number of Availability Requests a Single Poll Makes
+
+        Every lodge is searched by a single request per month.
+
+        Returns
+        -------
+        int
+        """
+        return max(len(self._get_current_search_months()), 1)
+
+    def _compile_found_campsites(
+        self,
+        all_campsites: List[AvailableCampsite],
+        searchable_campgrounds: Optional[Set[str]],
+    ) -> List[AvailableCampsite]:
+        """
+        Filter the Campsites Found Down to the Campgrounds and Search Window
+
+        Parameters
+        ----------
+        all_campsites: List[AvailableCampsite]
+        searchable_campgrounds: Optional[Set[str]]
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
         matching_campsites = self._filter_campsites_to_campgrounds(
             campsites=all_campsites, searchable_campgrounds=searchable_campgrounds
         )
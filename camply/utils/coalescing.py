@@ -0,0 +1,137 @@
+"""
+Coalescing of Identical Availability Requests
+"""
+
+import logging
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Generator, Hashable, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RequestCoalescer:
+    """
+    Fetch Each Unique Availability Payload Once per Polling Tick
+
+    While a tick is open, the first caller of a key fetches the payload and
+    every other caller of the same key, whether it arrives while the request
+    is in flight or afterwards, receives the same parsed result. A failed
+    request is raised to every waiting caller and isn't kept. Ticks nest,
+    the results are forgotten once the outermost tick closes so the next poll
+    fetches fresh availability. Outside of a tick nothing is coalesced.
+    """
+
+    def __init__(self) -> None:
+        """
+        Request Coalescer Initialization
+        """
+        self._results: Dict[Hashable, Future] = {}
+        self._depth: int = 0
+        self._lock = threading.Lock()
+        self.requests: int = 0
+        self.coalesced: int = 0
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+
+        Returns
+        -------
+        str
+        """
+        return (
+            f"<{self.__class__.__name__}: {self.requests} requests, "
+            f"{self.coalesced} coalesced>"
+        )
+
+    @property
+    def active(self) -> bool:
+        """
+        Whether a Polling Tick is Open
+        """
+        return self._depth > 0
+
+    @contextmanager
+    def tick(self) -> Generator["RequestCoalescer", None, None]:
+        """
+        Open a Polling Tick, Sharing Identical Requests Until it Closes
+
+        Yields
+        ------
+        RequestCoalescer
+        """
+        with self._lock:
+            self._depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._results.clear()
+
+    def fetch(
+        self,
+        key: Tuple[Hashable, ...],
+        func: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Call a Function Once per Key During a Tick
+
+        Parameters
+        ----------
+        key: Tuple[Hashable, ...]
+            Identity of the request, typically the provider, facility,
+            month or date window and any search parameters
+        func: Callable[..., T]
+            Function fetching and parsing the payload
+        *args: Any
+        **kwargs: Any
+            Arguments passed to `func`
+
+        Returns
+        -------
+        T
+        """
+        owner = False
+        with self._lock:
+            self.requests += 1
+            future = self._results.get(key) if self._depth > 0 else None
+            if future is not None:
+                self.coalesced += 1
+                logger.debug("Coalescing request: %s", key)
+            elif self._depth > 0:
+                future = Future()
+                self._results[key] = future
+                owner = True
+        if future is None:
+            return func(*args, **kwargs)
+        if owner is False:
+            return future.result()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            with self._lock:
+                self._results.pop(key, None)
+            future.set_exception(e)
+            raise
+        future.set_result(result)
+        return result
+
+    def clear(self) -> None:
+        """
+        Forget All Results and Statistics
+        """
+        with self._lock:
+            self._results.clear()
+            self.requests = 0
+            self.coalesced = 0
+
+
+request_coalescer = RequestCoalescer()
@@ -0,0 +1,50 @@
+"""
+Thread Pool Helpers for Concurrent Requests
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Generator, Sequence, Tuple
+
+
+def map_concurrently(
+    func: Callable[..., Any],
+    arguments: Sequence[Dict[str, Any]],
+    workers: int,
+) -> Generator[Tuple[int, Any], None, None]:
+    """
+    Call a Function Across a Thread Pool, Yielding Results as They Arrive
+
+    With a single worker (or a single call) the function is called serially,
+    in order, without starting a thread pool.
+
+    Parameters
+    ----------
+    func: Callable[..., Any]
+        Function to call, typically a provider request method
+    arguments: Sequence[Dict[str, Any]]
+        Keyword arguments for each individual call
+    workers: int
+        Maximum number of concurrent calls
+
+    Yields
+    ------
+    Tuple[int, Any]
+        The index of the arguments used and the result of the call
+    """
+    if workers <= 1 or len(arguments) <= 1:
+        for index, kwargs in enumerate(arguments):
+            yield index, func(**kwargs)
+        return
+    executor = ThreadPoolExecutor(
+        max_workers=min(workers, len(arguments)),
+        thread_name_prefix="camply",
+    )
+    try:
+        future_index = {
+            executor.submit(func, **kwargs): index
+            for index, kwargs in enumerate(arguments)
+        }
+        for future in as_completed(future_index):
+            yield future_index[future], future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
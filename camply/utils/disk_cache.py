@@ -0,0 +1,195 @@
+"""
+Versioned On-Disk JSON Cache
+"""
+
+import logging
+import os
+import pathlib
+import tempfile
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from pydantic import ValidationError
+
+from camply.containers.base_container import CamplyModel
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCacheEntry(CamplyModel):
+    """
+    A Single Cached Item, Stored as One JSON File
+    """
+
+    key: str
+    version: int
+    fetched_at: datetime
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    data: Any
+
+
+class DiskCache:
+    """
+    Versioned JSON Cache With a Time to Live
+
+    Every key is stored in its own file so entries can be refreshed
+    independently. Entries written with a different `version` are ignored, which
+    lets the cached format change without having to clean up old files. Expired
+    entries are still returned (see `is_fresh`) so that callers can serve or
+    revalidate them with their `etag` / `last_modified` validators.
+    """
+
+    def __init__(self, directory: pathlib.Path, version: int, ttl: timedelta) -> None:
+        """
+        Disk Cache Initialization
+
+        Parameters
+        ----------
+        directory: pathlib.Path
+            Directory to store the cache files in
+        version: int
+            Version of the cached data format
+        ttl: timedelta
+            How long an entry is considered fresh
+        """
+        self.directory = directory
+        self.version = version
+        self.ttl = ttl
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+
+        Returns
+        -------
+        str
+        """
+        return f"<{self.__class__.__name__}: {self.directory}>"
+
+    def get_path(self, key: str) -> pathlib.Path:
+        """
+        Get the File Path of a Key
+
+        Parameters
+        ----------
+        key: str
+
+        Returns
+        -------
+        pathlib.Path
+        """
+        return self.directory.joinpath(f"{key}.json")
+
+    def get(self, key: str) -> Optional[DiskCacheEntry]:
+        """
+        Read an Entry from the Cache, Fresh or Not
+
+        Parameters
+        ----------
+        key: str
+
+        Returns
+        -------
+        Optional[DiskCacheEntry]
+            None if the entry is missing, unreadable, or from another version
+        """
+        file_path = self.get_path(key=key)
+        if file_path.exists() is False:
+            return None
+        try:
+            entry = DiskCacheEntry.parse_raw(file_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError, ValidationError) as e:
+            logger.debug("Ignoring unreadable cache file %s: %s", file_path, e)
+            return None
+        if entry.version != self.version or entry.key != key:
+            return None
+        return entry
+
+    def is_fresh(self, entry: DiskCacheEntry) -> bool:
+        """
+        Whether an Entry is Still Within its Time to Live
+
+        Parameters
+        ----------
+        entry: DiskCacheEntry
+
+        Returns
+        -------
+        bool
+        """
+        return datetime.utcnow() - entry.fetched_at < self.ttl
+
+    def set(
+        self,
+        key: str,
+        data: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> DiskCacheEntry:
+        """
+        Write an Entry to the Cache
+
+        The file is written to a temporary file first and then moved into place,
+        so concurrent readers never see a partially written entry.
+
+        Parameters
+        ----------
+        key: str
+        data: Any
+            JSON serializable data
+        etag: Optional[str]
+            `ETag` header of the response the data came from
+        last_modified: Optional[str]
+            `Last-Modified` header of the response the data came from
+
+        Returns
+        -------
+        DiskCacheEntry
+        """
+        entry = DiskCacheEntry(
+            key=key,
+            version=self.version,
+            fetched_at=datetime.utcnow(),
+            etag=etag,
+            last_modified=last_modified,
+            data=data,
+        )
+        self._write(entry=entry)
+        return entry
+
+    def touch(self, entry: DiskCacheEntry) -> DiskCacheEntry:
+        """
+        Mark an Entry as Freshly Fetched Without Changing its Data
+
+        Parameters
+        ----------
+        entry: DiskCacheEntry
+
+        Returns
+        -------
+        DiskCacheEntry
+        """
+        touched_entry = entry.copy(update={"fetched_at": datetime.utcnow()})
+        self._write(entry=touched_entry)
+        return touched_entry
+
+    def _write(self, entry: DiskCacheEntry) -> None:
+        """
+        Atomically Write an Entry to Disk
+
+        Parameters
+        ----------
+        entry: DiskCacheEntry
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(
+            dir=self.directory, prefix=f".{entry.key}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as temp_file:
+                temp_file.write(entry.json())
+            os.replace(temp_path, self.get_path(key=entry.key))
+        except BaseException:
+            pathlib.Path(temp_path).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,116 @@
+"""
+Pluggable JSON Decoding of API Payloads
+
+The standard library decoder is always available, `orjson` and `msgspec`
+are used when they're installed (`pip install camply[fast-json]`).
+"""
+
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Union
+
+from camply.config.api_config import APIConfig
+from camply.exceptions import CamplyError
+
+logger = logging.getLogger(__name__)
+
+JsonContent = Union[str, bytes, bytearray]
+
+json_decoders: Dict[str, Callable[[JsonContent], Any]] = {}
+
+try:
+    import orjson
+
+    json_decoders["orjson"] = orjson.loads
+except ImportError:
+    pass
+
+try:
+    import msgspec
+
+    _msgspec_decoder = msgspec.json.Decoder()
+
+    def _msgspec_loads(content: JsonContent) -> Any:
+        """
+        Decode JSON With msgspec, Raising ValueError Like the Other Decoders
+
+        Parameters
+        ----------
+        content: JsonContent
+
+        Returns
+        -------
+        Any
+        """
+        try:
+            return _msgspec_decoder.decode(content)
+        except msgspec.DecodeError as de:
+            raise ValueError(str(de)) from de
+
+    json_decoders["msgspec"] = _msgspec_loads
+except ImportError:
+    pass
+
+json_decoders["json"] = json.loads
+
+
+@lru_cache(maxsize=None)
+def get_json_decoder(name: Optional[str] = None) -> Callable[[JsonContent], Any]:
+    """
+    Get a JSON Decoder by Name
+
+    Parameters
+    ----------
+    name: Optional[str]
+        One of `auto`, `orjson`, `msgspec` or `json`, defaults to
+        `APIConfig.JSON_DECODER`. `auto` picks the fastest one installed.
+
+    Returns
+    -------
+    Callable[[JsonContent], Any]
+    """
+    name = (name or APIConfig.JSON_DECODER).lower()
+    if name == "auto":
+        name = next(iter(json_decoders))
+    elif name not in ("orjson", "msgspec", "json"):
+        raise CamplyError(
+            f"Unknown JSON decoder: {name}. Use one of: auto, orjson, msgspec, json"
+        )
+    elif name not in json_decoders:
+        raise CamplyError(
+            f"Looks like `{name}` isn't installed. "
+            f"Install it with `pip install {name}`"
+        )
+    logger.debug("Decoding JSON with %s", name)
+    return json_decoders[name]
+
+
+def loads(content: JsonContent) -> Any:
+    """
+    Decode a JSON Payload With the Configured Decoder
+
+    Payloads a fast decoder rejects, like `NaN` or integers wider than 64 bits,
+    are decoded again by the standard library so every decoder accepts the
+    same documents.
+
+    Parameters
+    ----------
+    content: JsonContent
+
+    Returns
+    -------
+    Any
+
+    Raises
+    ------
+    ValueError
+        The content isn't valid JSON
+    """
+    decoder = get_json_decoder()
+    try:
+        return decoder(content)
+    except ValueError:
+        if decoder is json.loads:
+            raise
+        return json.loads(content)
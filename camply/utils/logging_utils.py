@@ -3,7 +3,7 @@ Logging Utilities for Pushover Variables
 """
 
 import logging
-from typing import Any, List, Union
+from typing import Any, List, Sized, Union
 
 from camply.containers import CampgroundFacility, RecreationArea
 from camply.containers.base_container import GoingToCampEquipment
@@ -69,19 +69,20 @@ def log_sorted_response(response_array: List[Any]) -> None:
         logger.info(log_response)
 
 
-def get_emoji(obj: list) -> str:
+def get_emoji(obj: Sized) -> str:
     """
     Return the Right Emoji
 
     Parameters
     ----------
-    obj: list
+    obj: Sized
+        A list, or anything else with a length, of results
 
     Returns
     -------
     str
     """
-    assert isinstance(obj, list)
+    assert isinstance(obj, Sized)
     if len(obj) >= 1:
         return TENTMOJI
     else:
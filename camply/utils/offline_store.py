@@ -0,0 +1,652 @@
+"""
+Offline Storage of the Campsites a Search Has Found
+"""
+
+import json
+import logging
+import os
+import pathlib
+import pickle
+import sqlite3
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime
+from hashlib import blake2b
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+from pydantic.json import pydantic_encoder
+
+from camply.config import SearchConfig
+from camply.containers import AvailableCampsite
+from camply.exceptions import CamplyError
+
+logger = logging.getLogger(__name__)
+
+
+def get_campsite_key(campsite: AvailableCampsite) -> str:
+    """
+    Get the Dedupe Key of a Campsite
+
+    The key is a digest of the same fields campsites are hashed and compared
+    by, so two campsites share a key when they are equal.
+
+    Parameters
+    ----------
+    campsite: AvailableCampsite
+
+    Returns
+    -------
+    str
+    """
+    fields = campsite.dict(exclude=campsite.__unhashable__)
+    serialized = json.dumps(fields, sort_keys=True, default=pydantic_encoder)
+    return blake2b(serialized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class OfflineCampsiteStore(ABC):
+    """
+    File of Campsites Found by Previous Searches
+    """
+
+    suffixes: Set[str] = set()
+    mode: str
+    append_only: bool = False
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """
+        Offline Store Initialization
+
+        Parameters
+        ----------
+        path: pathlib.Path
+        """
+        self.path = path
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+
+        Returns
+        -------
+        str
+        """
+        return f"<{self.__class__.__name__}: {self.path}>"
+
+    @abstractmethod
+    def load(self) -> Set[AvailableCampsite]:
+        """
+        Load Every Campsite in the File
+
+        Returns
+        -------
+        Set[AvailableCampsite]
+        """
+
+    def load_keys(self) -> Set[str]:
+        """
+        Load the Dedupe Keys of Every Campsite in the File
+
+        Returns
+        -------
+        Set[str]
+        """
+        return {get_campsite_key(campsite) for campsite in self.load()}
+
+    @abstractmethod
+    def save(self, campsites: Set[AvailableCampsite]) -> None:
+        """
+        Save the Campsites Found, Append-Only Stores Only Write the New Ones
+
+        Parameters
+        ----------
+        campsites: Set[AvailableCampsite]
+            Every campsite found by the search
+        """
+
+    def initialize(self) -> int:
+        """
+        Prepare the Store for a Search
+
+        Returns
+        -------
+        int
+            Number of campsites already stored
+        """
+        return len(self.load_keys())
+
+    def find_keys(self, keys: Iterable[str]) -> Set[str]:
+        """
+        Find Which Dedupe Keys are Already Stored
+
+        Parameters
+        ----------
+        keys: Iterable[str]
+
+        Returns
+        -------
+        Set[str]
+        """
+        return set(keys).intersection(self.load_keys())
+
+    def record_notifications(self, campsites: Iterable[AvailableCampsite]) -> None:
+        """
+        Record that Notifications Were Sent for Campsites
+
+        Only stores with a notification history keep these.
+
+        Parameters
+        ----------
+        campsites: Iterable[AvailableCampsite]
+        """
+        return None
+
+
+class PickleCampsiteStore(OfflineCampsiteStore):
+    """
+    Campsites Rewritten as a Serialized Pickle File
+    """
+
+    suffixes = {".pkl", ".pickle"}
+    mode = "pickle"
+
+    def load(self) -> Set[AvailableCampsite]:
+        """
+        Load Every Campsite in the File
+
+        Returns
+        -------
+        Set[AvailableCampsite]
+        """
+        if not self.path.exists():
+            return set()
+        with open(self.path, mode="rb") as file_stream:
+            return pickle.load(file=file_stream, fix_imports=True)
+
+    def save(self, campsites: Set[AvailableCampsite]) -> None:
+        """
+        Rewrite the File With Every Campsite Found
+
+        Parameters
+        ----------
+        campsites: Set[AvailableCampsite]
+        """
+        with open(self.path, mode="wb") as file_stream:
+            pickle.dump(obj=campsites, file=file_stream, protocol=4, fix_imports=True)
+
+
+class JsonCampsiteStore(OfflineCampsiteStore):
+    """
+    Campsites Rewritten as a JSON Array
+    """
+
+    suffixes = {".json"}
+    mode = "json"
+
+    def load(self) -> Set[AvailableCampsite]:
+        """
+        Load Every Campsite in the File
+
+        Returns
+        -------
+        Set[AvailableCampsite]
+        """
+        if not self.path.exists():
+            return set()
+        with open(self.path, mode="r") as file_stream:
+            campsites_dicts: List[Dict[str, Any]] = json.load(file_stream)
+        return {AvailableCampsite(**json_dict) for json_dict in campsites_dicts}
+
+    def save(self, campsites: Set[AvailableCampsite]) -> None:
+        """
+        Rewrite the File With Every Campsite Found
+
+        Parameters
+        ----------
+        campsites: Set[AvailableCampsite]
+        """
+        with open(self.path, mode="w") as file_stream:
+            json.dump(
+                obj=campsites,
+                fp=file_stream,
+                sort_keys=True,
+                default=pydantic_encoder,
+                indent=4,
+            )
+
+
+class JsonLinesCampsiteStore(OfflineCampsiteStore):
+    """
+    Campsites Appended to a JSON Lines File
+
+    Every line holds a single campsite along with its dedupe key:
+    `{"key": "...", "campsite": {...}}`. Saving only appends the campsites
+    that aren't in the file yet, and because the key always leads the line,
+    a search starting up reads the keys without parsing or validating any
+    campsite. Lines that can't be read (i.e. a write that was cut off) or
+    that repeat a key (i.e. two searches sharing a file) are dropped by
+    compacting the file, which happens on load once they make up
+    `SearchConfig.OFFLINE_COMPACTION_RATIO` of it.
+    """
+
+    suffixes = {".jsonl"}
+    mode = "jsonl"
+    append_only = True
+    _key_prefix = '{"key": "'
+    _key_length = 32
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """
+        JSON Lines Store Initialization
+
+        Parameters
+        ----------
+        path: pathlib.Path
+        """
+        super().__init__(path=path)
+        self.keys: Set[str] = set()
+        self._saved_campsites: Set[AvailableCampsite] = set()
+
+    def _read_key(self, line: str) -> str:
+        """
+        Read the Key Leading a Line, Without Parsing the Campsite
+
+        Parameters
+        ----------
+        line: str
+
+        Returns
+        -------
+        str
+
+        Raises
+        ------
+        ValueError
+            When the line wasn't written completely
+        """
+        if not line.startswith(self._key_prefix) or not line.endswith("}\n"):
+            raise ValueError("Incomplete offline campsite record")
+        start = len(self._key_prefix)
+        return line[start : start + self._key_length]
+
+    def _iter_records(self) -> Iterator[Tuple[Optional[str], str]]:
+        """
+        Iterate Over the First Record of Every Key in the File
+
+        Yields
+        ------
+        Tuple[Optional[str], str]
+            The key of the line, None when it can't be read or repeats a key,
+            and the line itself
+        """
+        seen: Set[str] = set()
+        with open(self.path, mode="r") as file_stream:
+            for line in file_stream:
+                try:
+                    key = self._read_key(line=line)
+                except ValueError:
+                    yield None, line
+                    continue
+                if key in seen:
+                    yield None, line
+                    continue
+                seen.add(key)
+                yield key, line
+
+    def load(self) -> Set[AvailableCampsite]:
+        """
+        Load and Validate Every Campsite in the File
+
+        Returns
+        -------
+        Set[AvailableCampsite]
+        """
+        if not self.path.exists():
+            return set()
+        campsites: Set[AvailableCampsite] = set()
+        for key, line in self._iter_records():
+            if key is not None:
+                campsites.add(AvailableCampsite(**json.loads(line)["campsite"]))
+                self.keys.add(key)
+        return campsites
+
+    def load_keys(self) -> Set[str]:
+        """
+        Load the Dedupe Keys of Every Campsite in the File
+
+        Returns
+        -------
+        Set[str]
+        """
+        if not self.path.exists():
+            return set()
+        keys: Set[str] = set()
+        stale_lines = 0
+        for key, _ in self._iter_records():
+            if key is None:
+                stale_lines += 1
+            else:
+                keys.add(key)
+        self.keys.update(keys)
+        total_lines = len(keys) + stale_lines
+        if stale_lines > 0 and (
+            stale_lines >= total_lines * SearchConfig.OFFLINE_COMPACTION_RATIO
+            or not self._ends_with_newline()
+        ):
+            self.compact()
+        return keys
+
+    def find_keys(self, keys: Iterable[str]) -> Set[str]:
+        """
+        Find Which Dedupe Keys are Already Stored, Loaded or Appended
+
+        Parameters
+        ----------
+        keys: Iterable[str]
+
+        Returns
+        -------
+        Set[str]
+        """
+        return self.keys.intersection(keys)
+
+    def save(self, campsites: Set[AvailableCampsite]) -> None:
+        """
+        Append the Campsites That Aren't in the File Yet
+
+        Parameters
+        ----------
+        campsites: Set[AvailableCampsite]
+        """
+        lines: List[str] = []
+        for campsite in set(campsites).difference(self._saved_campsites):
+            self._saved_campsites.add(campsite)
+            key = get_campsite_key(campsite)
+            if key in self.keys:
+                continue
+            self.keys.add(key)
+            lines.append(
+                json.dumps(
+                    {"key": key, "campsite": campsite},
+                    default=pydantic_encoder,
+                )
+                + "\n"
+            )
+        if len(lines) == 0:
+            return
+        if self.path.exists() and not self._ends_with_newline():
+            self.compact()
+        with open(self.path, mode="a") as file_stream:
+            file_stream.writelines(lines)
+
+    def compact(self) -> None:
+        """
+        Rewrite the File Without Unreadable or Repeated Lines
+        """
+        if not self.path.exists():
+            return
+        with tempfile.NamedTemporaryFile(
+            mode="w", dir=self.path.parent, suffix=".tmp", delete=False
+        ) as file_stream:
+            kept_lines = 0
+            for key, line in self._iter_records():
+                if key is not None:
+                    file_stream.write(line)
+                    kept_lines += 1
+        os.replace(file_stream.name, self.path)
+        logger.debug("%s campsites kept compacting: %s", kept_lines, self.path)
+
+    def _ends_with_newline(self) -> bool:
+        """
+        Whether the Last Line of the File Was Written Completely
+
+        Returns
+        -------
+        bool
+        """
+        with open(self.path, mode="rb") as file_stream:
+            file_stream.seek(0, os.SEEK_END)
+            if file_stream.tell() == 0:
+                return True
+            file_stream.seek(-1, os.SEEK_END)
+            return file_stream.read(1) == b"\n"
+
+
+class SqliteCampsiteStore(OfflineCampsiteStore):
+    """
+    Campsites and Notification History Kept in a SQLite Database
+
+    Campsites are keyed by their dedupe key, so checking whether a campsite
+    was found before is an indexed lookup and nothing needs to be loaded
+    into memory when a search starts. The database runs in WAL mode and
+    every operation uses its own short lived connection, which lets several
+    searches, in the same process or not, share a single file.
+    """
+
+    suffixes = {".sqlite", ".db"}
+    mode = "sqlite"
+    append_only = True
+    _schema = """
+        CREATE TABLE IF NOT EXISTS campsites (
+            campsite_key TEXT PRIMARY KEY,
+            campsite_id TEXT NOT NULL,
+            facility_id TEXT NOT NULL,
+            booking_date TEXT NOT NULL,
+            booking_nights INTEGER NOT NULL,
+            found_at TEXT NOT NULL,
+            campsite TEXT NOT NULL
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS campsites_facility_booking_date
+            ON campsites (facility_id, booking_date);
+        CREATE TABLE IF NOT EXISTS notifications (
+            notification_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            campsite_key TEXT NOT NULL,
+            notified_at TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS notifications_campsite_key
+            ON notifications (campsite_key);
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """
+        SQLite Store Initialization
+
+        Parameters
+        ----------
+        path: pathlib.Path
+        """
+        super().__init__(path=path)
+        self._initialized: bool = False
+        self._saved_campsites: Set[AvailableCampsite] = set()
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        """
+        Open a Connection, Committing When the Block Succeeds
+
+        Yields
+        ------
+        sqlite3.Connection
+        """
+        connection = sqlite3.connect(
+            self.path, timeout=SearchConfig.OFFLINE_SQLITE_TIMEOUT
+        )
+        try:
+            if self._initialized is False:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.executescript(self._schema)
+                self._initialized = True
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def initialize(self) -> int:
+        """
+        Create the Tables, When Missing, and Count the Campsites Stored
+
+        Returns
+        -------
+        int
+        """
+        with self._connect() as connection:
+            (count,) = connection.execute("SELECT COUNT(*) FROM campsites").fetchone()
+        return count
+
+    def load(self) -> Set[AvailableCampsite]:
+        """
+        Load and Validate Every Campsite in the Database
+
+        Returns
+        -------
+        Set[AvailableCampsite]
+        """
+        with self._connect() as connection:
+            rows = connection.execute("SELECT campsite FROM campsites").fetchall()
+        return {AvailableCampsite.parse_raw(campsite) for (campsite,) in rows}
+
+    def load_keys(self) -> Set[str]:
+        """
+        Load the Dedupe Keys of Every Campsite in the Database
+
+        Returns
+        -------
+        Set[str]
+        """
+        with self._connect() as connection:
+            rows = connection.execute("SELECT campsite_key FROM campsites").fetchall()
+        return {key for (key,) in rows}
+
+    def find_keys(self, keys: Iterable[str]) -> Set[str]:
+        """
+        Look Up Which Dedupe Keys are Already Stored
+
+        Parameters
+        ----------
+        keys: Iterable[str]
+
+        Returns
+        -------
+        Set[str]
+        """
+        keys = list(set(keys))
+        found: Set[str] = set()
+        with self._connect() as connection:
+            for start in range(0, len(keys), SearchConfig.OFFLINE_SQLITE_BATCH_SIZE):
+                batch = keys[start : start + SearchConfig.OFFLINE_SQLITE_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(batch))
+                rows = connection.execute(
+                    "SELECT campsite_key FROM campsites "
+                    f"WHERE campsite_key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                found.update(key for (key,) in rows)
+        return found
+
+    def save(self, campsites: Set[AvailableCampsite]) -> None:
+        """
+        Insert the Campsites That Aren't in the Database Yet
+
+        Parameters
+        ----------
+        campsites: Set[AvailableCampsite]
+        """
+        new_campsites = set(campsites).difference(self._saved_campsites)
+        if len(new_campsites) == 0:
+            return
+        found_at = datetime.now().isoformat()
+        rows = [
+            (
+                get_campsite_key(campsite),
+                str(campsite.campsite_id),
+                str(campsite.facility_id),
+                campsite.booking_date.isoformat(),
+                campsite.booking_nights,
+                found_at,
+                campsite.json(),
+            )
+            for campsite in new_campsites
+        ]
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO campsites VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+        self._saved_campsites.update(new_campsites)
+
+    def record_notifications(self, campsites: Iterable[AvailableCampsite]) -> None:
+        """
+        Record that Notifications Were Sent for Campsites
+
+        Parameters
+        ----------
+        campsites: Iterable[AvailableCampsite]
+        """
+        notified_at = datetime.now().isoformat()
+        rows = [(get_campsite_key(campsite), notified_at) for campsite in campsites]
+        if len(rows) == 0:
+            return
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT INTO notifications (campsite_key, notified_at) VALUES (?, ?)",
+                rows,
+            )
+
+    def get_notification_history(self, campsite: AvailableCampsite) -> List[datetime]:
+        """
+        Get When Notifications Were Sent for a Campsite
+
+        Parameters
+        ----------
+        campsite: AvailableCampsite
+
+        Returns
+        -------
+        List[datetime]
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT notified_at FROM notifications "
+                "WHERE campsite_key = ? ORDER BY notification_id",
+                (get_campsite_key(campsite),),
+            ).fetchall()
+        return [datetime.fromisoformat(notified_at) for (notified_at,) in rows]
+
+
+offline_stores: List[Type[OfflineCampsiteStore]] = [
+    JsonCampsiteStore,
+    PickleCampsiteStore,
+    JsonLinesCampsiteStore,
+    SqliteCampsiteStore,
+]
+
+
+def get_offline_store(path: pathlib.Path) -> OfflineCampsiteStore:
+    """
+    Get the Offline Store of a File, by its Extension
+
+    Parameters
+    ----------
+    path: pathlib.Path
+
+    Returns
+    -------
+    OfflineCampsiteStore
+    """
+    for store_class in offline_stores:
+        if path.suffix in store_class.suffixes:
+            return store_class(path=path)
+    raise CamplyError(
+        "You must provide a `.json`, `.jsonl`, a `.pickle` / `.pkl` or a "
+        "`.sqlite` / `.db` file name for offline searches"
+    )
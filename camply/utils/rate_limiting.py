@@ -0,0 +1,358 @@
+"""
+Per-Host Token Bucket Rate Limiting
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+TOO_MANY_REQUESTS: int = 429
+SERVICE_UNAVAILABLE: int = 503
+
+
+class TokenBucket:
+    """
+    Thread-Safe Token Bucket
+
+    Tokens refill continuously at `rate` tokens per second, up to `burst`
+    tokens. Callers reserve their tokens while holding a lock and then wait
+    outside of it, so a bucket can be shared between threads and asyncio tasks
+    without ever exceeding its budget.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """
+        Token Bucket Initialization
+
+        Parameters
+        ----------
+        rate: float
+            Number of tokens added to the bucket per second
+        burst: int
+            Maximum number of tokens the bucket can hold
+        """
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be greater than zero")
+        if burst < 1:
+            raise ValueError("Token bucket burst must be at least one")
+        self.rate: float = float(rate)
+        self.burst: int = int(burst)
+        self._tokens: float = float(burst)
+        self._updated: float = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+
+        Returns
+        -------
+        str
+        """
+        return f"<{self.__class__.__name__} rate={self.rate} burst={self.burst}>"
+
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Reserve Tokens and Return How Long to Wait Before Using Them
+
+        Parameters
+        ----------
+        tokens: int
+            Number of tokens to take from the bucket
+
+        Returns
+        -------
+        float
+            Seconds the caller must wait before making its request
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                elapsed = now - self._updated
+                self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+                self._updated = now
+            self._tokens -= tokens
+            delay = self._updated - now
+            if self._tokens < 0:
+                delay += -self._tokens / self.rate
+            return delay
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        Block Until Tokens are Available
+
+        Parameters
+        ----------
+        tokens: int
+            Number of tokens to take from the bucket
+
+        Returns
+        -------
+        float
+            Seconds spent waiting
+        """
+        delay = self.reserve(tokens=tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, tokens: int = 1) -> float:
+        """
+        Wait, Without Blocking the Event Loop, Until Tokens are Available
+
+        Parameters
+        ----------
+        tokens: int
+            Number of tokens to take from the bucket
+
+        Returns
+        -------
+        float
+            Seconds spent waiting
+        """
+        delay = self.reserve(tokens=tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stop Handing Out Tokens for a Number of Seconds
+
+        The bucket is drained and only starts refilling once the pause is over,
+        so requests resume at the refill rate rather than in a burst.
+
+        Parameters
+        ----------
+        seconds: float
+            Number of seconds to pause for
+        """
+        with self._lock:
+            resume = time.monotonic() + seconds
+            if resume > self._updated:
+                self._tokens = min(self._tokens, 0.0)
+                self._updated = resume
+
+
+class RateLimiter:
+    """
+    Registry of Token Buckets, Keyed by Host
+
+    A bucket is created the first time a host is requested, using the rate and
+    burst of the provider making that request. Every later request to that host,
+    from any provider, thread, or asyncio task, shares the same bucket.
+    """
+
+    def __init__(self) -> None:
+        """
+        Rate Limiter Initialization
+        """
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_host(url: str) -> str:
+        """
+        Get the Host a URL Points To
+
+        Parameters
+        ----------
+        url: str
+
+        Returns
+        -------
+        str
+        """
+        return urlparse(url).netloc.lower()
+
+    def get_bucket(self, url: str, rate: float, burst: int) -> TokenBucket:
+        """
+        Get (or Create) the Token Bucket for a URL's Host
+
+        Parameters
+        ----------
+        url: str
+            URL about to be requested
+        rate: float
+            Requests per second allowed, used when the bucket is created
+        burst: int
+            Requests allowed at once, used when the bucket is created
+
+        Returns
+        -------
+        TokenBucket
+        """
+        host = self.get_host(url=url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(rate=rate, burst=burst)
+                self._buckets[host] = bucket
+                logger.debug("Rate limiting %s to %s", host, bucket)
+        return bucket
+
+    def acquire(self, url: str, rate: float, burst: int) -> float:
+        """
+        Block Until a Request to a URL's Host is Allowed
+
+        Parameters
+        ----------
+        url: str
+        rate: float
+        burst: int
+
+        Returns
+        -------
+        float
+            Seconds spent waiting
+        """
+        bucket = self.get_bucket(url=url, rate=rate, burst=burst)
+        return bucket.acquire()
+
+    async def acquire_async(self, url: str, rate: float, burst: int) -> float:
+        """
+        Wait Until a Request to a URL's Host is Allowed - Asynchronously
+
+        Parameters
+        ----------
+        url: str
+        rate: float
+        burst: int
+
+        Returns
+        -------
+        float
+            Seconds spent waiting
+        """
+        bucket = self.get_bucket(url=url, rate=rate, burst=burst)
+        return await bucket.acquire_async()
+
+    def feedback(
+        self,
+        url: str,
+        status_code: int,
+        retry_after: Optional[str],
+        backoff: float,
+        maximum_backoff: float,
+    ) -> Optional[float]:
+        """
+        Pause a Host that Reported Being Rate Limited
+
+        A `429 Too Many Requests` response, or a `503 Service Unavailable`
+        response with a `Retry-After` header, pauses the host's bucket for
+        `Retry-After` seconds (or `backoff` seconds when the header is missing).
+
+        Parameters
+        ----------
+        url: str
+            URL that was requested
+        status_code: int
+            Status code of the response
+        retry_after: Optional[str]
+            Value of the response's `Retry-After` header
+        backoff: float
+            Seconds to pause when no `Retry-After` header is provided
+        maximum_backoff: float
+            Upper bound on the number of seconds to pause
+
+        Returns
+        -------
+        Optional[float]
+            Seconds the host was paused for, None if it wasn't rate limited
+        """
+        delay = parse_retry_after(retry_after=retry_after)
+        if status_code == SERVICE_UNAVAILABLE and delay is None:
+            return None
+        elif status_code not in (TOO_MANY_REQUESTS, SERVICE_UNAVAILABLE):
+            return None
+        delay = min(backoff if delay is None else delay, maximum_backoff)
+        host = self.get_host(url=url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+        if bucket is not None:
+            bucket.pause(seconds=delay)
+        logger.warning(
+            "Rate limited by %s (HTTP %s), pausing requests for %.1f seconds",
+            host,
+            status_code,
+            delay,
+        )
+        return delay
+
+    def feedback_response(
+        self,
+        url: str,
+        response: requests.Response,
+        backoff: float,
+        maximum_backoff: float,
+    ) -> Optional[float]:
+        """
+        Pause a Host if its Response Says it is Rate Limiting Us
+
+        Parameters
+        ----------
+        url: str
+            URL that was requested
+        response: requests.Response
+        backoff: float
+        maximum_backoff: float
+
+        Returns
+        -------
+        Optional[float]
+        """
+        return self.feedback(
+            url=url,
+            status_code=response.status_code,
+            retry_after=response.headers.get("Retry-After"),
+            backoff=backoff,
+            maximum_backoff=maximum_backoff,
+        )
+
+    def clear(self) -> None:
+        """
+        Forget All Token Buckets
+        """
+        with self._lock:
+            self._buckets.clear()
+
+
+def parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After Header into Seconds
+
+    The header can either be a number of seconds or an HTTP date.
+
+    Parameters
+    ----------
+    retry_after: Optional[str]
+
+    Returns
+    -------
+    Optional[float]
+    """
+    if not retry_after:
+        return None
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_date = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=timezone.utc)
+    return max((retry_date - datetime.now(tz=timezone.utc)).total_seconds(), 0.0)
+
+
+rate_limiter = RateLimiter()
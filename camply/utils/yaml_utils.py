@@ -125,6 +125,7 @@ def yaml_file_to_arguments(
         "equipment": equipment,
         "offline_search": yaml_model.offline_search,
         "offline_search_path": yaml_model.offline_search_path,
+        "workers": yaml_model.workers,
     }
     search_kwargs = {
         "log": True,
@@ -135,5 +136,6 @@ def yaml_file_to_arguments(
         "notification_provider": yaml_model.notifications,
         "search_forever": yaml_model.search_forever,
         "search_once": yaml_model.search_once,
+        "requests_per_hour": yaml_model.requests_per_hour,
     }
     return provider, provider_kwargs, search_kwargs
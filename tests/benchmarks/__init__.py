@@ -0,0 +1,3 @@
+"""
+Camply Benchmarks
+"""
@@ -0,0 +1,123 @@
+"""
+Benchmark: Slotted Campsite Records Against Validated Campsites
+
+Run with `pytest tests/benchmarks/bench_campsite_record.py -n 0 --no-cov -s`.
+Providers used to validate an `AvailableCampsite` for every night of every
+campsite they parsed. This times creating `NIGHTS` nights as validated
+models, as `CampsiteRecord` objects and as records converted to campsites
+without validation, and measures the memory each representation holds.
+"""
+
+import logging
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from camply.containers import AvailableCampsite, CampsiteRecord
+
+logger = logging.getLogger(__name__)
+
+NIGHTS: int = 100_000
+
+
+def make_fields(nights: int) -> List[Dict[str, Any]]:
+    """
+    Build the Field Values of Nightly Availabilities, as a Provider Parses Them
+
+    Parameters
+    ----------
+    nights: int
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+    """
+    start_date = datetime(2023, 9, 1)
+    location = {"latitude": 44.5, "longitude": -110.5}
+    all_fields = []
+    for index in range(nights):
+        campsite_id, night = divmod(index, 30)
+        booking_date = start_date + timedelta(days=night)
+        all_fields.append(
+            {
+                "campsite_id": campsite_id,
+                "booking_date": booking_date,
+                "booking_end_date": booking_date + timedelta(days=1),
+                "booking_nights": 1,
+                "campsite_site_name": f"Site {campsite_id}",
+                "campsite_loop_name": "Loop A",
+                "campsite_type": "STANDARD NONELECTRIC",
+                "campsite_occupancy": (1, 6),
+                "campsite_use_type": "Overnight",
+                "availability_status": "Available",
+                "recreation_area": "Benchmark Recreation Area",
+                "recreation_area_id": 1,
+                "facility_name": "Benchmark Campground",
+                "facility_id": campsite_id % 7,
+                "booking_url": f"https://example.com/{campsite_id}",
+                "location": location,
+                "permitted_equipment": [
+                    {"equipment_name": "Tent", "max_length": 0.0},
+                ],
+                "campsite_attributes": None,
+            }
+        )
+    return all_fields
+
+
+def _measure(func: Callable[[], List[Any]]) -> Dict[str, float]:
+    """
+    Time a Function, then Measure the Memory its Result Holds
+
+    Memory is measured on a second run, tracing allocations slows it down.
+
+    Parameters
+    ----------
+    func: Callable[[], List[Any]]
+
+    Returns
+    -------
+    Dict[str, float]
+        Seconds taken and megabytes held
+    """
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    assert len(result) == NIGHTS
+    del result
+    tracemalloc.start()
+    result = func()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(result) == NIGHTS
+    return {"seconds": elapsed, "megabytes": held / 2**20}
+
+
+def test_benchmark_campsite_record() -> None:
+    """
+    Time and Size NIGHTS Availabilities in Each Representation
+    """
+    all_fields = make_fields(nights=NIGHTS)
+    records = [CampsiteRecord(**fields) for fields in all_fields]
+    assert records[0].to_campsite() == AvailableCampsite(**all_fields[0])
+    results = {
+        "AvailableCampsite": _measure(
+            lambda: [AvailableCampsite(**fields) for fields in all_fields]
+        ),
+        "CampsiteRecord": _measure(
+            lambda: [CampsiteRecord(**fields) for fields in all_fields]
+        ),
+        "CampsiteRecord.to_campsite": _measure(
+            lambda: [record.to_campsite() for record in records]
+        ),
+    }
+    baseline = results["AvailableCampsite"]
+    print(f"\n{NIGHTS:,} nights:")
+    for name, result in results.items():
+        print(
+            f"{name:>28}: {result['seconds']:.3f}s "
+            f"({baseline['seconds'] / result['seconds']:.1f}x), "
+            f"{result['megabytes']:.1f} MB "
+            f"({baseline['megabytes'] / result['megabytes']:.1f}x)"
+        )
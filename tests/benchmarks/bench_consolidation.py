@@ -0,0 +1,170 @@
+"""
+Benchmark: Consolidating Nightly Availabilities into Multi-Night Stays
+
+Run with `pytest tests/benchmarks/bench_consolidation.py -n 0 --no-cov -s`.
+The previous campsite-by-campsite implementation is kept here as a reference:
+its output must match, and its timing is reported next to the current one. It
+is too slow to run on the full input, so it is timed on `LEGACY_ROWS` rows.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta
+from itertools import groupby, islice, tee
+from operator import itemgetter
+from typing import Generator, Iterable
+
+import pandas as pd
+import pytest
+from pandas import DataFrame, Timedelta, concat
+
+from camply.config import CampsiteContainerFields
+from camply.containers import AvailableCampsite
+from camply.search.base_search import BaseCampingSearch
+
+logger = logging.getLogger(__name__)
+
+ROWS: int = 100_000
+LEGACY_ROWS: int = 10_000
+NIGHTS_PER_CAMPSITE: int = 40
+
+
+def _consecutive_subseq(iterable: Iterable, length: int) -> Generator:
+    """
+    Find All Sub Sequences by length Given a List
+    """
+    for _, consec_run in groupby(enumerate(iterable), lambda x: x[0] - x[1]):
+        k_wise = tee(map(itemgetter(1), consec_run), length)
+        for n, it in enumerate(k_wise):
+            next(islice(it, n, n), None)
+        yield from zip(*k_wise)
+
+
+def _legacy_find_consecutive_nights(dataframe: DataFrame, nights: int) -> DataFrame:
+    """
+    Reference: Explode a Run of Consecutive Nights, One Window at a Time
+    """
+    duplicate_subset = set(dataframe.columns) - AvailableCampsite.__unhashable__
+    dataframe_slice = dataframe.copy().reset_index(drop=True)
+    nights_indexes = dataframe_slice.booking_date.index
+    concatted_data = []
+    for sequence in _consecutive_subseq(iterable=nights_indexes, length=nights):
+        index_list = list(sequence)
+        data_copy = dataframe_slice.iloc[index_list].copy()
+        data_copy.booking_date = data_copy.booking_date.min()
+        data_copy.booking_end_date = data_copy.booking_end_date.max()
+        data_copy.booking_url = data_copy.booking_url.loc[index_list[0]]
+        data_copy.booking_nights = (
+            data_copy.booking_end_date - data_copy.booking_date
+        ).dt.days
+        data_copy.drop_duplicates(inplace=True, subset=duplicate_subset)
+        concatted_data.append(data_copy)
+    if len(concatted_data) == 0:
+        concatted_data = [DataFrame()]
+    return concat(concatted_data, ignore_index=True)
+
+
+def _legacy_consolidate_campsites(campsite_df: DataFrame, nights: int) -> DataFrame:
+    """
+    Reference: Consolidate Campsites with a groupby per Campsite and per Run
+    """
+    composed_groupings = []
+    for _, campsite_slice in campsite_df.groupby(
+        [CampsiteContainerFields.CAMPSITE_ID, CampsiteContainerFields.CAMPGROUND_ID]
+    ):
+        campsite_grouping = campsite_slice.sort_values(
+            by=CampsiteContainerFields.BOOKING_DATE, ascending=True
+        ).copy()
+        booking_date = campsite_grouping[CampsiteContainerFields.BOOKING_DATE]
+        consecutive_nights = booking_date.diff() != Timedelta("1d")
+        campsite_grouping[
+            CampsiteContainerFields.CAMPSITE_GROUP
+        ] = consecutive_nights.cumsum()
+        for _, campsite_group_slice in campsite_grouping.groupby(
+            CampsiteContainerFields.CAMPSITE_GROUP
+        ):
+            composed_grouping = campsite_group_slice.sort_values(
+                by=CampsiteContainerFields.BOOKING_DATE, ascending=True
+            ).copy()
+            composed_grouping.drop(
+                columns=[CampsiteContainerFields.CAMPSITE_GROUP], inplace=True
+            )
+            composed_groupings.append(
+                _legacy_find_consecutive_nights(
+                    dataframe=composed_grouping, nights=nights
+                )
+            )
+    if len(composed_groupings) == 0:
+        composed_groupings = [DataFrame()]
+    return concat(composed_groupings, ignore_index=True)
+
+
+def make_availability(rows: int) -> DataFrame:
+    """
+    Build Nightly Availabilities, with a Gap Every Ten Nights
+
+    Parameters
+    ----------
+    rows: int
+
+    Returns
+    -------
+    DataFrame
+    """
+    start_date = datetime(2023, 9, 1)
+    availabilities = []
+    for row in range(rows):
+        campsite_id, night = divmod(row, NIGHTS_PER_CAMPSITE)
+        booking_date = start_date + timedelta(days=night + night // 10)
+        availabilities.append(
+            AvailableCampsite(
+                campsite_id=campsite_id,
+                booking_date=booking_date,
+                booking_end_date=booking_date + timedelta(days=1),
+                booking_nights=1,
+                campsite_site_name=f"Site {campsite_id}",
+                campsite_loop_name="Loop A",
+                campsite_type="STANDARD NONELECTRIC",
+                campsite_occupancy=(1, 6),
+                campsite_use_type="Overnight",
+                availability_status="Available",
+                recreation_area="Benchmark Recreation Area",
+                recreation_area_id=1,
+                facility_name="Benchmark Campground",
+                facility_id=campsite_id % 7,
+                booking_url=f"https://example.com/{campsite_id}/{night}",
+                permitted_equipment=None,
+                campsite_attributes=None,
+            )
+        )
+    return BaseCampingSearch.campsites_to_df(campsites=availabilities)
+
+
+@pytest.mark.parametrize("nights", [1, 3])
+def test_benchmark_consolidate_campsites(nights: int) -> None:
+    """
+    Time Consolidation on ROWS Availabilities, Against the Reference
+    """
+    campsite_df = make_availability(rows=ROWS)
+    start = time.perf_counter()
+    consolidated = BaseCampingSearch._consolidate_campsites(
+        campsite_df=campsite_df, nights=nights
+    )
+    elapsed = time.perf_counter() - start
+
+    legacy_df = campsite_df.iloc[:LEGACY_ROWS]
+    legacy_start = time.perf_counter()
+    legacy = _legacy_consolidate_campsites(campsite_df=legacy_df, nights=nights)
+    legacy_elapsed = time.perf_counter() - legacy_start
+    pd.testing.assert_frame_equal(
+        BaseCampingSearch._consolidate_campsites(campsite_df=legacy_df, nights=nights),
+        legacy,
+    )
+
+    per_row = elapsed / ROWS
+    legacy_per_row = legacy_elapsed / LEGACY_ROWS
+    print(
+        f"\nnights={nights}: {ROWS:,} rows in {elapsed:.3f}s -> {len(consolidated):,} "
+        f"stays | reference: {LEGACY_ROWS:,} rows in {legacy_elapsed:.3f}s | "
+        f"speedup per row: {legacy_per_row / per_row:,.0f}x"
+    )
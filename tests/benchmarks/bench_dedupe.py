@@ -0,0 +1,139 @@
+"""
+Benchmark: Deduplicating Sets of Campsites Across Polls
+
+Run with `pytest tests/benchmarks/bench_dedupe.py -n 0 --no-cov -s`.
+The previous hashing and equality of `CamplyModel`, which rebuilt a tuple of
+every field on each hash and serialized both models on each comparison, is
+kept here as a reference and timed on the same operations a continuous
+search runs on every poll.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, List, Set
+
+from camply.containers import AvailableCampsite
+
+logger = logging.getLogger(__name__)
+
+CAMPSITES: int = 50_000
+POLLS: int = 5
+
+
+class _LegacyCampsite(AvailableCampsite):
+    """
+    Reference: Hash and Compare Every Field on Every Call
+    """
+
+    def __hash__(self):
+        """
+        Hash a Tuple of the Hashable Fields
+        """
+        return hash(self.__class__) + hash(
+            tuple(
+                value
+                for key, value in self.__dict__.items()
+                if key not in self.__unhashable__
+            )
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Serialize Both Models to Compare Them
+        """
+        return self.dict(exclude=self.__unhashable__) == other.dict(
+            exclude=other.__unhashable__
+        )
+
+
+def make_campsites(campsite_class: type, count: int, offset: int = 0) -> List[Any]:
+    """
+    Build Nightly Availabilities
+
+    Parameters
+    ----------
+    campsite_class: type
+    count: int
+    offset: int
+        First campsite to build, polls overlap by sharing most campsites
+
+    Returns
+    -------
+    List[Any]
+    """
+    start_date = datetime(2023, 9, 1)
+    campsites = []
+    for index in range(offset, offset + count):
+        campsite_id, night = divmod(index, 30)
+        booking_date = start_date + timedelta(days=night)
+        campsites.append(
+            campsite_class(
+                campsite_id=campsite_id,
+                booking_date=booking_date,
+                booking_end_date=booking_date + timedelta(days=1),
+                booking_nights=1,
+                campsite_site_name=f"Site {campsite_id}",
+                campsite_loop_name="Loop A",
+                campsite_type="STANDARD NONELECTRIC",
+                campsite_occupancy=(1, 6),
+                campsite_use_type="Overnight",
+                availability_status="Available",
+                recreation_area="Benchmark Recreation Area",
+                recreation_area_id=1,
+                facility_name="Benchmark Campground",
+                facility_id=campsite_id % 7,
+                booking_url=f"https://example.com/{campsite_id}",
+                permitted_equipment=[{"equipment_name": "Tent", "max_length": 0}],
+                campsite_attributes=None,
+            )
+        )
+    return campsites
+
+
+def _time_polls(campsite_class: type) -> float:
+    """
+    Time the Set Operations of POLLS Overlapping Polls
+
+    Parameters
+    ----------
+    campsite_class: type
+
+    Returns
+    -------
+    float
+    """
+    polls = [
+        make_campsites(
+            campsite_class=campsite_class,
+            count=CAMPSITES,
+            offset=poll * CAMPSITES // 10,
+        )
+        for poll in range(POLLS)
+    ]
+    campsites_found: Set[Any] = set()
+    start = time.perf_counter()
+    for matching_campsites in polls:
+        new_campsites = set(matching_campsites).difference(campsites_found)
+        campsites_found.update(new_campsites)
+        assert campsites_found.issuperset(matching_campsites)
+    return time.perf_counter() - start
+
+
+def test_benchmark_dedupe() -> None:
+    """
+    Time Set Based Dedupe on CAMPSITES Campsites per Poll, Against the Reference
+    """
+    timings = {}
+    for name, campsite_class in [
+        ("current", AvailableCampsite),
+        ("reference", _LegacyCampsite),
+    ]:
+        timings[name] = _time_polls(campsite_class=campsite_class)
+    first, second = make_campsites(campsite_class=AvailableCampsite, count=2)
+    assert first == first.copy() and first != second
+    print(
+        f"\n{POLLS} polls of {CAMPSITES:,} campsites: {timings['current']:.3f}s | "
+        f"reference: {timings['reference']:.3f}s | "
+        f"speedup: {timings['reference'] / timings['current']:,.1f}x"
+    )
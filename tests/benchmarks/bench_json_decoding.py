@@ -0,0 +1,109 @@
+"""
+Benchmark: Decoding Recorded Availability Payloads
+
+Run with `pytest tests/benchmarks/bench_json_decoding.py -n 0 --no-cov -s`.
+Times decoding the recorded Recreation.gov month payloads and UseDirect grids
+with each installed JSON decoder, and building their response models with
+full validation against building them with `from_payload`.
+"""
+
+import json
+import logging
+import pathlib
+import time
+from typing import Any, Callable, List
+
+from camply.containers.api_responses import CampsiteAvailabilityResponse
+from camply.containers.usedirect import UseDirectAvailabilityResponse
+from camply.utils.json_decoding import json_decoders
+from tests.test_json_decoding import get_cassette_payloads
+
+logger = logging.getLogger(__name__)
+
+ROUNDS: int = 20
+
+cassettes_dir = pathlib.Path(__file__).parent.parent.joinpath("cli", "cassettes")
+usedirect_cassettes_dir = pathlib.Path(__file__).parent.parent.joinpath(
+    "cli", "usedirect", "cassettes"
+)
+
+
+def _load_payloads(directory: pathlib.Path, uri_part: str) -> List[bytes]:
+    """
+    Gather Every Recorded Payload of a Kind
+
+    Parameters
+    ----------
+    directory: pathlib.Path
+    uri_part: str
+
+    Returns
+    -------
+    List[bytes]
+    """
+    payloads = []
+    for cassette in sorted(directory.glob("*.yaml")):
+        for content in get_cassette_payloads(cassette=cassette, uri_part=uri_part):
+            try:
+                json.loads(content)
+            except ValueError:
+                continue
+            payloads.append(content.encode())
+    return payloads
+
+
+def _time(func: Callable[[Any], Any], items: List[Any]) -> float:
+    """
+    Time ROUNDS Passes of a Function Over Every Item
+
+    Parameters
+    ----------
+    func: Callable[[Any], Any]
+    items: List[Any]
+
+    Returns
+    -------
+    float
+    """
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for item in items:
+            func(item)
+    return time.perf_counter() - start
+
+
+def test_benchmark_json_decoding() -> None:
+    """
+    Time Decoding and Building Availability Responses From Cassettes
+    """
+    for name, response_class, directory, uri_part in [
+        (
+            "Recreation.gov months",
+            CampsiteAvailabilityResponse,
+            cassettes_dir,
+            "availability/campground",
+        ),
+        (
+            "UseDirect grids",
+            UseDirectAvailabilityResponse,
+            usedirect_cassettes_dir,
+            "rdr/search/grid",
+        ),
+    ]:
+        contents = _load_payloads(directory=directory, uri_part=uri_part)
+        megabytes = sum(len(content) for content in contents) / 2**20
+        print(f"\n{name}: {len(contents)} payloads, {megabytes:.1f} MB x {ROUNDS}")
+        baseline = _time(json.loads, contents)
+        for decoder_name, decoder in json_decoders.items():
+            elapsed = _time(decoder, contents)
+            print(
+                f"{'decode ' + decoder_name:>24}: {elapsed:.3f}s "
+                f"({baseline / elapsed:.1f}x)"
+            )
+        payloads = [json.loads(content) for content in contents]
+        for payload in payloads:
+            assert response_class.from_payload(payload) == response_class(**payload)
+        baseline = _time(response_class.parse_obj, payloads)
+        elapsed = _time(response_class.from_payload, payloads)
+        print(f"{'validate':>24}: {baseline:.3f}s")
+        print(f"{'from_payload':>24}: {elapsed:.3f}s ({baseline / elapsed:.1f}x)")
@@ -13,6 +13,9 @@ from freezegun import freeze_time
 
 from camply import AvailableCampsite
 from camply.cli import camply_command_line
+from camply.providers.going_to_camp.going_to_camp_provider import GoingToCamp
+from camply.providers.recreation_dot_gov.recdotgov_provider import RecreationDotGovBase
+from camply.providers.xanterra.yellowstone_lodging import Yellowstone
 
 logger = logging.getLogger(__name__)
 [
@@ -41,6 +44,35 @@ def freeze_current_time():
         yield
 
 
+@pytest.fixture(autouse=True)
+def recdotgov_offline_cache(tmp_path, monkeypatch) -> None:
+    """
+    Keep the Recreation.gov Metadata Cache Out of the Package Directory
+
+    Each test starts with an empty cache so cassettes are always replayed.
+    """
+    monkeypatch.setattr(
+        RecreationDotGovBase, "__offline_cache_dir__", tmp_path / "recdotgov"
+    )
+
+
+@pytest.fixture(autouse=True)
+def goingtocamp_offline_cache(tmp_path, monkeypatch) -> None:
+    """
+    Keep the GoingToCamp Site Details Cache Out of the Package Directory
+    """
+    monkeypatch.setattr(GoingToCamp, "__offline_cache_dir__", tmp_path / "gtc")
+
+
+@pytest.fixture(autouse=True)
+def yellowstone_property_info_cache(tmp_path, monkeypatch) -> None:
+    """
+    Start Each Test With Empty Yellowstone Property Information Caches
+    """
+    monkeypatch.setattr(Yellowstone, "__offline_cache_dir__", tmp_path / "xanterra")
+    monkeypatch.setattr(Yellowstone, "_property_info", {})
+
+
 class CamplyRunner(CliRunner):
     """
     Custom CLI Runner for Camply
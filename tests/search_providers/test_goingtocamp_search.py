@@ -7,7 +7,8 @@ from datetime import datetime
 
 import pytest
 
-from camply.containers import AvailableCampsite, SearchWindow
+from camply.containers import AvailableCampsite, CampgroundFacility, SearchWindow
+from camply.providers import GoingToCamp
 from camply.search import SearchGoingToCamp
 from tests.conftest import vcr_cassette
 
@@ -61,3 +62,96 @@ def test_going_to_camp_get_all_campsites(
     assert all_campsites
     for camp in all_campsites:
         assert isinstance(camp, AvailableCampsite)
+
+
+def test_going_to_camp_site_details_cache(mocker) -> None:
+    """
+    Site Details are Requested Once and Then Served From the Cache
+    """
+
+    def _fake_request(rec_area_id, endpoint_name, params=None):
+        if endpoint_name == "ATTRIBUTE_DETAILS":
+            return {}
+        return {
+            "resourceId": params["resourceId"],
+            "minCapacity": 1,
+            "maxCapacity": 6,
+            "definedAttributes": [],
+        }
+
+    provider = GoingToCamp()
+    request = mocker.patch.object(provider, "_api_request", side_effect=_fake_request)
+    details = provider.get_site_details(rec_area_id=1, resource_id=10)
+    assert details["resourceId"] == 10
+    assert details["site_attributes"] == {}
+    assert provider.get_site_details(rec_area_id=1, resource_id=10) == details
+    assert request.call_count == 2
+    assert provider.site_details_cache.get(key="1") is None
+    provider.get_site_details(rec_area_id=1, resource_id=11)
+    write = mocker.spy(provider.site_details_cache.__class__, "set")
+    provider.save_site_details(rec_area_id=1)
+    provider.save_site_details(rec_area_id=1)
+    assert write.call_count == 1
+    assert set(provider.site_details_cache.get(key="1").data) == {"10", "11"}
+    provider.warm_site_details(rec_area_id=1, resource_ids=[10, 11, 12, 12])
+    site_requests = [
+        call.args[2]["resourceId"]
+        for call in request.call_args_list
+        if call.args[1] == "SITE_DETAILS"
+    ]
+    assert site_requests == [10, 11, 12]
+    assert write.call_count == 2
+    reloaded = GoingToCamp()
+    reloaded_request = mocker.patch.object(
+        reloaded, "_api_request", side_effect=_fake_request
+    )
+    reloaded.warm_site_details(rec_area_id=1, resource_ids=[10, 11, 12], workers=4)
+    assert reloaded.get_site_details(rec_area_id=1, resource_id=12)["maxCapacity"] == 6
+    assert reloaded_request.call_count == 0
+
+
+def test_going_to_camp_map_tree(mocker) -> None:
+    """
+    Nested Maps are Crawled Once, Then Fetched Directly
+    """
+    map_tree = {
+        "1": {"links": ["2", "3"], "resources": {}},
+        "2": {"links": ["4"], "resources": {}},
+        "3": {"links": [], "resources": {"30": [{"availability": 0}]}},
+        "4": {"links": ["2"], "resources": {"40": [{"availability": 1}]}},
+    }
+
+    def _fake_request(rec_area_id, endpoint_name, params=None):
+        map_data = map_tree[str(params["mapId"])]
+        return {
+            "resourceAvailabilities": map_data["resources"],
+            "mapLinkAvailabilities": {link: [] for link in map_data["links"]},
+        }
+
+    provider = GoingToCamp()
+    request = mocker.patch.object(provider, "_api_request", side_effect=_fake_request)
+    campground = CampgroundFacility(
+        facility_name="Test",
+        recreation_area="Test",
+        facility_id=-1,
+        recreation_area_id=1,
+        map_id=1,
+    )
+    search_kwargs = {
+        "campground": campground,
+        "start_date": datetime(2023, 9, 1).date(),
+        "end_date": datetime(2023, 9, 2).date(),
+        "equipment_type_id": None,
+        "workers": 4,
+    }
+    available = provider.list_site_availability(**search_kwargs)
+    assert [(site.map_id, site.resource_id) for site in available] == [(3, 30)]
+    requested_maps = [call.args[2]["mapId"] for call in request.call_args_list]
+    assert requested_maps[0] == 1
+    assert sorted(requested_maps[1:]) == ["2", "3", "4"]
+    request.reset_mock()
+    assert provider.list_site_availability(**search_kwargs) == available
+    assert sorted(call.args[2]["mapId"] for call in request.call_args_list) == [
+        "3",
+        "4",
+    ]
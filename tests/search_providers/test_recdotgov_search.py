@@ -2,12 +2,23 @@
 Yellowstone Testing Provider
 """
 
+import asyncio
+import json
 import logging
 from datetime import datetime
+from types import SimpleNamespace
+from typing import List
 
+import pandas as pd
 import pytest
 
-from camply.containers import AvailableCampsite, CampgroundFacility, SearchWindow
+from camply.containers import (
+    AvailableCampsite,
+    CampgroundFacility,
+    CamplyModel,
+    SearchWindow,
+)
+from camply.providers import AsyncProvider, RecreationDotGov, RecreationDotGovTicket
 from camply.search import SearchRecreationDotGov
 from tests.conftest import vcr_cassette
 
@@ -170,3 +181,291 @@ def test_get_campsite_specific_results(
     assert all_campsites
     for camp in all_campsites:
         assert isinstance(camp, AvailableCampsite)
+
+
+def test_get_all_campsites_concurrent(vcr, search_window) -> None:
+    """
+    Concurrent Searching Returns the Same Campsites as Serial Searching
+    """
+    with vcr.use_cassette(
+        "test_get_all_campsites_recarea.yaml", allow_playback_repeats=True
+    ):
+        serial_finder = SearchRecreationDotGov(
+            search_window=search_window, recreation_area=2584
+        )
+        concurrent_finder = SearchRecreationDotGov(
+            search_window=search_window, recreation_area=2584, workers=4
+        )
+        assert serial_finder.workers == 1
+        assert concurrent_finder.workers == 4
+        serial_campsites = serial_finder.get_all_campsites()
+        concurrent_campsites = concurrent_finder.get_all_campsites()
+    assert serial_campsites
+    assert serial_campsites == concurrent_campsites
+
+
+def test_recdotgov_session_shared() -> None:
+    """
+    Recreation.gov Requests Share One Session
+    """
+    session = RecreationDotGov.get_recdotgov_session()
+    assert RecreationDotGovTicket.get_recdotgov_session() is session
+    assert session.headers["User-Agent"]
+    RecreationDotGov.rotate_recdotgov_user_agent()
+    assert RecreationDotGov.get_recdotgov_session() is session
+    assert session.headers["User-Agent"]
+
+
+class _PagedResponse(CamplyModel):
+    """
+    Minimal Paginated Search Response
+    """
+
+    results: List[int]
+    size: int
+    start: int
+    total: int
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_paginate_recdotgov_search_concurrent(mocker, workers: int) -> None:
+    """
+    Every Page After the First is Fetched, in Order, by Offset
+    """
+    total = 2500
+
+    def _fake_request(method: str, url: str, params: dict, **kwargs):
+        start = params["start"]
+        results = list(range(start, min(start + params["size"], total)))
+        page = {"results": results, "size": len(results), "start": start}
+        return SimpleNamespace(
+            status_code=200,
+            headers={"ETag": "abc"},
+            content=json.dumps({**page, "total": total}),
+        )
+
+    provider = RecreationDotGov()
+    request = mocker.patch.object(
+        provider, "make_recdotgov_request_retry", side_effect=_fake_request
+    )
+    results, validators = provider._paginate_recdotgov_search(
+        path="api/search/campsites",
+        params={"fq": ["asset_id:1"]},
+        response_class=_PagedResponse,
+        results_field="results",
+        workers=workers,
+    )
+    assert results == list(range(total))
+    assert validators["etag"] == "abc"
+    assert sorted(
+        call.kwargs["params"]["start"] for call in request.call_args_list
+    ) == [
+        0,
+        1000,
+        2000,
+    ]
+
+
+def test_get_all_campsites_async(vcr, search_window) -> None:
+    """
+    Searching from an Event Loop Returns the Same Campsites as Serial Searching
+    """
+    with vcr.use_cassette(
+        "test_get_all_campsites_recarea.yaml", allow_playback_repeats=True
+    ):
+        serial_finder = SearchRecreationDotGov(
+            search_window=search_window, recreation_area=2584
+        )
+        async_finder = SearchRecreationDotGov(
+            search_window=search_window, recreation_area=2584
+        )
+        serial_campsites = serial_finder.get_all_campsites()
+        async_campsites = asyncio.run(async_finder.get_all_campsites_async())
+    assert serial_campsites
+    assert serial_campsites == async_campsites
+    assert isinstance(async_finder.campsite_finder, AsyncProvider)
+
+
+def test_get_all_campsites_unchanged(mocker, vcr, search_window) -> None:
+    """
+    Polling Unchanged Availability Skips Parsing and Processing
+    """
+    with vcr.use_cassette(
+        "test_get_all_campsites_recarea.yaml", allow_playback_repeats=True
+    ):
+        finder = SearchRecreationDotGov(
+            search_window=search_window, recreation_area=2584
+        )
+        first_campsites = finder.get_all_campsites()
+        process_campsites = mocker.spy(RecreationDotGov, "_iter_campsite_nights")
+        consolidate = mocker.spy(SearchRecreationDotGov, "_consolidate_campsites")
+        second_campsites = finder.get_all_campsites()
+    assert first_campsites
+    assert second_campsites == first_campsites
+    assert process_campsites.call_count == 0
+    assert consolidate.call_count == 0
+
+
+@pytest.mark.parametrize("nights", [1, 3])
+def test_get_all_campsites_filtered_parsing(mocker, vcr, nights: int) -> None:
+    """
+    Skipping Nights While Parsing Finds the Same Campsites
+    """
+    search_window = [
+        SearchWindow(start_date=datetime(2023, 9, 1), end_date=datetime(2023, 9, 8)),
+        SearchWindow(start_date=datetime(2023, 9, 20), end_date=datetime(2023, 10, 1)),
+    ]
+    with vcr.use_cassette(
+        "test_get_all_campsites_recarea.yaml", allow_playback_repeats=True
+    ):
+        filtered_finder = SearchRecreationDotGov(
+            search_window=search_window, recreation_area=2584, nights=nights
+        )
+        filtered_campsites = filtered_finder.get_all_campsites()
+        unfiltered_finder = SearchRecreationDotGov(
+            search_window=search_window, recreation_area=2584, nights=nights
+        )
+        mocker.patch.object(
+            SearchRecreationDotGov,
+            "availability_filter",
+            new_callable=mocker.PropertyMock,
+            return_value=None,
+        )
+        unfiltered_campsites = unfiltered_finder.get_all_campsites()
+    assert filtered_campsites
+    assert set(filtered_campsites) == set(unfiltered_campsites)
+    filtered_nights = sum(
+        len(batch) for _, batch in filtered_finder._availability_snapshots.values()
+    )
+    unfiltered_nights = sum(
+        len(batch) for _, batch in unfiltered_finder._availability_snapshots.values()
+    )
+    assert filtered_nights < unfiltered_nights
+
+
+def test_process_campsite_availability_changes() -> None:
+    """
+    Only Campsites Whose Availability Changed are Processed Again
+    """
+    provider = RecreationDotGov()
+    kwargs = {
+        "recreation_area": "Test Recreation Area",
+        "recreation_area_id": 20,
+        "facility_name": "Test Campground",
+        "facility_id": 50,
+        "month": datetime(2023, 9, 1),
+        "campsite_metadata": pd.DataFrame(),
+    }
+    first_payload = {
+        "campsites": {
+            str(campsite_id): {
+                "availabilities": {
+                    "2023-09-01T00:00:00Z": "Available",
+                    "2023-09-02T00:00:00Z": "Reserved",
+                },
+                "loop": "A",
+                "campsite_type": "STANDARD",
+                "type_of_use": "Overnight",
+                "site": str(campsite_id),
+            }
+            for campsite_id in (1, 2)
+        }
+    }
+    second_payload = json.loads(json.dumps(first_payload))
+    second_payload["campsites"]["2"]["availabilities"][
+        "2023-09-02T00:00:00Z"
+    ] = "Available"
+    first = provider.process_campsite_availability_changes(
+        availability=first_payload, previous=None, **kwargs
+    )
+    assert (
+        provider.process_campsite_availability_changes(
+            availability=first_payload, previous=first, **kwargs
+        )
+        is first
+    )
+    second = provider.process_campsite_availability_changes(
+        availability=second_payload, previous=first, **kwargs
+    )
+    assert second.parts["1"] is first.parts["1"]
+    assert second.parts["2"] is not first.parts["2"]
+    full = RecreationDotGov.process_campsite_availability_batch(
+        availability=second_payload, **kwargs
+    )
+    assert second.batch.to_campsites() == full.to_campsites()
+    assert len(full) == 3
+
+
+def test_campsite_metadata_interning(mocker) -> None:
+    """
+    Campsite Metadata is Looked Up Once and Shared by Every Night
+    """
+    campsite_metadata = pd.DataFrame(
+        {
+            "campsite_id": [1],
+            "permitted_equipment": [[{"equipment_name": "Tent", "max_length": 0}]],
+            "attributes": [[]],
+            "latitude": [44.5],
+            "longitude": [-110.5],
+        }
+    ).set_index("campsite_id")
+    lookup = mocker.spy(RecreationDotGov, "_get_equipment_attributes_location")
+    payload = {
+        "campsites": {
+            "1": {
+                "availabilities": {
+                    f"2023-09-{day:02d}T00:00:00Z": "Available" for day in range(1, 11)
+                },
+                "site": "1",
+            }
+        }
+    }
+    kwargs = {
+        "recreation_area": "Test Recreation Area",
+        "recreation_area_id": 20,
+        "facility_name": "Test Campground",
+        "facility_id": 50,
+        "month": datetime(2023, 9, 1),
+        "campsite_metadata": campsite_metadata,
+    }
+    batches = [
+        RecreationDotGov.process_campsite_availability_batch(
+            availability=payload, **kwargs
+        )
+        for _ in range(2)
+    ]
+    assert lookup.call_count == 1
+    equipment = [
+        item for batch in batches for item in batch.get_column("permitted_equipment")
+    ]
+    assert len(equipment) == 20
+    assert all(item is equipment[0] for item in equipment)
+    campsites = [campsite for batch in batches for campsite in batch.to_campsites()]
+    first_night, *other_nights = campsites
+    assert first_night.permitted_equipment[0].equipment_name == "Tent"
+    assert first_night.location.latitude == 44.5
+    for campsite in other_nights:
+        assert campsite.permitted_equipment is first_night.permitted_equipment
+        assert campsite.campsite_attributes is first_night.campsite_attributes
+        assert campsite.location is first_night.location
+
+
+def test_availability_payload_hashing() -> None:
+    """
+    An Unchanged Raw Payload Returns the Previously Parsed Object
+    """
+    provider = RecreationDotGov()
+    month = datetime(2023, 9, 1)
+    first = provider._load_availability_payload(
+        campground_id=1, month=month, content=b'{"campsites": {}}'
+    )
+    assert (
+        provider._load_availability_payload(
+            campground_id=1, month=month, content=b'{"campsites": {}}'
+        )
+        is first
+    )
+    changed = provider._load_availability_payload(
+        campground_id=1, month=month, content=b'{"campsites": {"1": {}}}'
+    )
+    assert changed == {"campsites": {"1": {}}}
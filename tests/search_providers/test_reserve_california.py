@@ -2,6 +2,7 @@
 ReserveCalifornia Testing
 """
 
+import asyncio
 import datetime
 import os
 import pathlib
@@ -10,7 +11,8 @@ from unittest import mock
 from dateutil.relativedelta import relativedelta
 from pytest import MonkeyPatch
 
-from camply.providers import ReserveCalifornia
+from camply.providers import FloridaStateParks, ReserveCalifornia
+from camply.search import SearchReserveCalifornia
 from tests.conftest import CamplyRunner, cli_status_checker, vcr_cassette
 
 
@@ -48,6 +50,29 @@ def test_rc_get_campsites(tmp_path: pathlib.Path) -> None:
     assert any(item.campsite_site_name == "Campsite #M93" for item in campsites)
 
 
+def test_rc_get_campsites_async(vcr, tmp_path: pathlib.Path) -> None:
+    """
+    Get Campsites from an Event Loop
+    """
+    prov = ReserveCalifornia()
+    prov.__offline_cache_dir__ = tmp_path
+    start_date = datetime.date(2023, 6, 5)
+    with vcr.use_cassette("test_rc_get_campsites.yaml", allow_playback_repeats=True):
+        campsites = prov.get_campsites(
+            campground_id=543,
+            start_date=start_date,
+            end_date=start_date + relativedelta(days=2),
+        )
+        async_campsites = asyncio.run(
+            prov.get_campsites_async(
+                campground_id=543,
+                start_date=start_date,
+                end_date=start_date + relativedelta(days=2),
+            )
+        )
+    assert async_campsites == campsites
+
+
 @vcr_cassette
 def test_rc_get_metadata(tmp_path: pathlib.Path) -> None:
     """
@@ -172,3 +197,48 @@ def test_rc_cli_campgrounds_env_var(
     cli_status_checker(result=result, exit_code_zero=True)
     assert "Bodega Dunes" in result.output
     assert 'Using Camply Provider: "ReserveCalifornia"' in result.output
+
+
+def test_usedirect_tenant_pools() -> None:
+    """
+    Providers of the Same Tenant Share a Pool, Other Tenants Get Their Own
+    """
+    provider = ReserveCalifornia()
+    assert provider.tenant == "calirdr.usedirect.com"
+    assert ReserveCalifornia().session is provider.session
+    assert ReserveCalifornia().get_tenant_semaphore() is (
+        provider.get_tenant_semaphore()
+    )
+    other = FloridaStateParks()
+    assert other.session is not provider.session
+    assert other.get_tenant_semaphore() is not provider.get_tenant_semaphore()
+
+
+def test_usedirect_plan_grid_windows() -> None:
+    """
+    Search Days are Covered by the Fewest Grid Windows
+    """
+    crossing_month = [
+        datetime.date(2023, 6, 26) + datetime.timedelta(days=day) for day in range(10)
+    ]
+    windows = SearchReserveCalifornia.plan_grid_windows(search_days=crossing_month)
+    assert [(window.start_date, window.end_date) for window in windows] == [
+        (datetime.date(2023, 6, 26), datetime.date(2023, 7, 5))
+    ]
+    assert windows[0].days == len(crossing_month)
+    scattered = [
+        datetime.date(2023, 6, 1),
+        datetime.date(2023, 6, 30),
+        datetime.date(2023, 7, 1),
+        datetime.date(2023, 8, 15),
+    ]
+    windows = SearchReserveCalifornia.plan_grid_windows(search_days=scattered)
+    assert [(window.start_date, window.end_date) for window in windows] == [
+        (datetime.date(2023, 6, 1), datetime.date(2023, 7, 1)),
+        (datetime.date(2023, 8, 15), datetime.date(2023, 8, 15)),
+    ]
+    windows = SearchReserveCalifornia.plan_grid_windows(
+        search_days=scattered, max_days=7
+    )
+    assert len(windows) == len(scattered) - 1
+    assert SearchReserveCalifornia.plan_grid_windows(search_days=[]) == []
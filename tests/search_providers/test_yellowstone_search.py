@@ -2,12 +2,18 @@
 Yellowstone Testing Provider
 """
 
+import asyncio
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
 
 import pytest
+from freezegun import freeze_time
 
+from camply.config.api_config import YellowstoneConfig
 from camply.containers import AvailableCampsite, SearchWindow
+from camply.providers import Yellowstone
 from camply.search import SearchYellowstone
 from tests.conftest import vcr_cassette
 
@@ -54,3 +60,108 @@ def test_yellowstone_get_all_campsites(yellowstone_finder) -> None:
     all_campsites = yellowstone_finder.get_all_campsites()
     for camp in all_campsites:
         assert isinstance(camp, AvailableCampsite)
+
+
+def test_yellowstone_get_all_campsites_async(vcr, search_window) -> None:
+    """
+    Searching Yellowstone from an Event Loop Matches the Serial Search
+    """
+    with vcr.use_cassette(
+        "test_yellowstone_get_all_campsites.yaml", allow_playback_repeats=True
+    ):
+        serial_campsites = SearchYellowstone(
+            search_window=search_window
+        ).get_all_campsites()
+        async_campsites = asyncio.run(
+            SearchYellowstone(search_window=search_window).get_all_campsites_async()
+        )
+    assert serial_campsites == async_campsites
+
+
+def test_yellowstone_get_all_campsites_async_non_blocking(
+    mocker, vcr, search_window
+) -> None:
+    """
+    Searching Yellowstone from an Event Loop Never Blocks the Loop on a Request
+    """
+    request_seconds = 0.5
+    get_response = Yellowstone._get_yellowstone_response
+
+    def slow_response(*args, **kwargs):
+        time.sleep(request_seconds)
+        return get_response(*args, **kwargs)
+
+    mocker.patch.object(
+        Yellowstone, "_get_yellowstone_response", side_effect=slow_response
+    )
+
+    async def search_with_heartbeat() -> float:
+        stop = asyncio.Event()
+        longest_gap = 0.0
+
+        async def heartbeat() -> None:
+            nonlocal longest_gap
+            last_beat = time.perf_counter()
+            while not stop.is_set():
+                await asyncio.sleep(0.01)
+                now = time.perf_counter()
+                longest_gap = max(longest_gap, now - last_beat)
+                last_beat = now
+
+        beat = asyncio.create_task(heartbeat())
+        campsites = await SearchYellowstone(
+            search_window=search_window
+        ).get_all_campsites_async()
+        stop.set()
+        await beat
+        assert campsites
+        return longest_gap
+
+    with vcr.use_cassette(
+        "test_yellowstone_get_all_campsites.yaml", allow_playback_repeats=True
+    ):
+        longest_gap = asyncio.run(search_with_heartbeat())
+    assert longest_gap < request_seconds / 2
+
+
+def test_yellowstone_property_info_cache(monkeypatch) -> None:
+    """
+    Property Information is Cached in Process and on Disk Until it Expires
+    """
+    requested: List[str] = []
+
+    def make_yellowstone_request(endpoint: str, **kwargs) -> Dict[str, Any]:
+        requested.append(endpoint.rsplit("/", 1)[-1])
+        return {
+            "SITE": {
+                "title": "Campsite",
+                "type": "rv",
+                "occupancyBase": 1,
+                "occupancyMax": 6,
+            }
+        }
+
+    monkeypatch.setattr(
+        Yellowstone, "make_yellowstone_request", staticmethod(make_yellowstone_request)
+    )
+    available_rooms = [
+        {"facility_id": "YLYC:RV", "campsite_code": "SITE"},
+        {"facility_id": "YLYB:RV", "campsite_code": "SITE"},
+        {"facility_id": "YLYC:RV", "campsite_code": "SITE"},
+    ]
+    property_info = Yellowstone()._get_property_information(
+        available_rooms=available_rooms
+    )
+    assert sorted(requested) == ["YLYB:RV", "YLYC:RV"]
+    assert [item["facility_id"] for item in property_info] == ["YLYC:RV", "YLYB:RV"]
+    assert property_info[0]["campsite_type"] == "RV"
+    assert Yellowstone()._get_property_information(available_rooms) == property_info
+    monkeypatch.setattr(Yellowstone, "_property_info", {})
+    assert Yellowstone()._get_property_information(available_rooms) == property_info
+    assert len(requested) == 2
+    expired = datetime.now() + timedelta(
+        seconds=YellowstoneConfig.PROPERTY_INFO_CACHE_TTL + 60
+    )
+    with freeze_time(expired):
+        Yellowstone()._get_property_information(available_rooms)
+    assert len(requested) == 4
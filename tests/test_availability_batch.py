@@ -0,0 +1,68 @@
+"""
+AvailabilityBatch Tests
+"""
+
+import logging
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+
+from camply.containers import AvailabilityBatch, AvailableCampsite
+from camply.search.base_search import BaseCampingSearch
+
+logger = logging.getLogger(__name__)
+
+
+def test_batch_matches_campsites(available_campsite: AvailableCampsite) -> None:
+    """
+    A Batch Holds the Same Data as the AvailableCampsite Objects
+    """
+    campsites = [
+        available_campsite.copy(
+            update={
+                "campsite_id": campsite_id,
+                "booking_date": available_campsite.booking_date + timedelta(days=1),
+            }
+        )
+        for campsite_id in range(5)
+    ]
+    batch = AvailabilityBatch.from_campsites(campsites=campsites)
+    assert len(batch) == len(campsites)
+    pd.testing.assert_frame_equal(
+        batch.to_df(), BaseCampingSearch.campsites_to_df(campsites=campsites)
+    )
+    assert batch.to_campsites() == campsites
+    assert AvailabilityBatch().to_df().columns.tolist() == list(
+        AvailableCampsite.__fields__
+    )
+
+
+def test_batch_append(available_campsite: AvailableCampsite) -> None:
+    """
+    Appended Values are Stored Like Pydantic Would Validate Them
+    """
+    batch = AvailabilityBatch()
+    batch.append(**{**available_campsite.dict(), "campsite_id": "123"})
+    batch.append(**{**available_campsite.dict(), "facility_id": "ABC"})
+    assert batch.get_column("campsite_id") == [123, available_campsite.campsite_id]
+    assert batch.get_column("facility_id") == [available_campsite.facility_id, "ABC"]
+    with pytest.raises(TypeError):
+        batch.append(campsite_name="Unknown")
+
+
+def test_batch_select_concat(available_campsite: AvailableCampsite) -> None:
+    """
+    Batches can be Filtered and Combined in Order
+    """
+    first = AvailabilityBatch.from_campsites(
+        campsites=[
+            available_campsite.copy(update={"campsite_id": campsite_id})
+            for campsite_id in range(4)
+        ]
+    )
+    second = first.select(mask=[True, False, True, False])
+    assert second.get_column("campsite_id") == [0, 2]
+    combined = AvailabilityBatch.concat(batches=[first, second])
+    assert combined.get_column("campsite_id") == [0, 1, 2, 3, 0, 2]
+    assert len(first) == 4
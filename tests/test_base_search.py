@@ -0,0 +1,206 @@
+"""
+BaseCampingSearch Tests
+"""
+
+import logging
+import random
+import warnings
+from datetime import date, datetime, timedelta
+from typing import List
+
+from pytz import timezone
+
+from camply.containers import AvailableCampsite, SearchWindow
+from camply.providers import RecreationDotGov
+from camply.search.base_search import BaseCampingSearch
+
+logger = logging.getLogger(__name__)
+
+
+def _nightly_campsites(
+    available_campsite: AvailableCampsite, campsite_id: int, nights: List[int]
+) -> List[AvailableCampsite]:
+    """
+    Copy a Campsite Across Nights of September 2023
+    """
+    start_date = datetime(2023, 9, 1)
+    return [
+        available_campsite.copy(
+            update={
+                "campsite_id": campsite_id,
+                "booking_date": start_date + timedelta(days=night),
+                "booking_end_date": start_date + timedelta(days=night + 1),
+                "booking_nights": 1,
+                "booking_url": f"https://example.com/{campsite_id}/{night}",
+            }
+        )
+        for night in nights
+    ]
+
+
+def test_consolidate_campsites(available_campsite: AvailableCampsite) -> None:
+    """
+    Consecutive Nights Become Every Possible Stay of the Requested Length
+    """
+    campsites = _nightly_campsites(available_campsite, 2, [5, 6]) + (
+        _nightly_campsites(available_campsite, 1, [3, 0, 1, 2, 7, 8])
+    )
+    campsite_df = BaseCampingSearch.campsites_to_df(campsites=campsites)
+    consolidated = BaseCampingSearch._consolidate_campsites(
+        campsite_df=campsite_df, nights=2
+    )
+    stays = list(
+        zip(
+            consolidated.campsite_id,
+            consolidated.booking_date.dt.day,
+            consolidated.booking_nights,
+            consolidated.booking_url,
+        )
+    )
+    assert stays == [
+        (1, 1, 2, "https://example.com/1/0"),
+        (1, 2, 2, "https://example.com/1/1"),
+        (1, 3, 2, "https://example.com/1/2"),
+        (1, 8, 2, "https://example.com/1/7"),
+        (2, 6, 2, "https://example.com/2/5"),
+    ]
+    too_long = BaseCampingSearch._consolidate_campsites(
+        campsite_df=campsite_df, nights=5
+    )
+    assert too_long.empty
+
+
+def test_consolidate_campsites_differing_nights(
+    available_campsite: AvailableCampsite,
+) -> None:
+    """
+    Nights of a Stay that Differ Beyond their Dates are Kept Separately
+    """
+    campsites = _nightly_campsites(available_campsite, 1, [0, 1, 2])
+    campsites[1] = campsites[1].copy(update={"availability_status": "Open"})
+    campsite_df = BaseCampingSearch.campsites_to_df(campsites=campsites)
+    consolidated = BaseCampingSearch._consolidate_campsites(
+        campsite_df=campsite_df, nights=2
+    )
+    assert list(consolidated.availability_status) == [
+        "Available",
+        "Open",
+        "Open",
+        "Available",
+    ]
+    assert consolidated.booking_date.dt.day.tolist() == [1, 1, 2, 2]
+
+
+class _StaticSearch(BaseCampingSearch):
+    """
+    Search Returning a Fixed List of Campsites
+    """
+
+    provider_class = RecreationDotGov
+    available_campsites: List[AvailableCampsite] = []
+
+    def get_all_campsites(self) -> List[AvailableCampsite]:
+        """
+        Return the Fixed Campsites
+        """
+        return self.available_campsites
+
+    def list_campsite_units(self) -> None:
+        """
+        Listing Campsites Isn't Needed
+        """
+
+
+def _reference_overlap(
+    booking_date: datetime, booking_nights: int, search_days: List[date]
+) -> bool:
+    """
+    Set Intersection Overlap, One Stay at a Time
+    """
+    stay = {
+        (booking_date + timedelta(days=night)).date() for night in range(booking_nights)
+    }
+    return len(stay.intersection(search_days)) > 0
+
+
+def test_filter_date_overlap(available_campsite: AvailableCampsite) -> None:
+    """
+    Stays are Kept When Any of their Nights is a Search Day
+    """
+    search = _StaticSearch(
+        search_window=[
+            SearchWindow(start_date=date(2023, 9, 3), end_date=date(2023, 9, 5)),
+            SearchWindow(start_date=date(2023, 9, 9), end_date=date(2023, 9, 10)),
+        ],
+        days_of_the_week=[0, 1, 5, 6],
+    )
+    random_state = random.Random(42)
+    campsites = [
+        available_campsite.copy(
+            update={
+                "campsite_id": index,
+                "booking_date": datetime(2023, 8, 25, 13)
+                + timedelta(days=random_state.randint(0, 20)),
+                "booking_nights": random_state.randint(1, 4),
+            }
+        )
+        for index in range(200)
+    ]
+    expected = [
+        _reference_overlap(
+            booking_date=campsite.booking_date,
+            booking_nights=campsite.booking_nights,
+            search_days=search.search_days,
+        )
+        for campsite in campsites
+    ]
+    assert 0 < sum(expected) < len(campsites)
+    campsite_df = search.campsites_to_df(campsites=campsites)
+    filtered_df = search._filter_date_overlap(campsites=campsite_df)
+    assert filtered_df.campsite_id.tolist() == [
+        campsite.campsite_id
+        for campsite, match in zip(campsites, expected)
+        if match is True
+    ]
+    assert [
+        search._compare_date_overlap(campsite=campsite) for campsite in campsites
+    ] == expected
+    search.available_campsites = campsites
+    matching = search._search_matching_campsites_available()
+    assert matching == [
+        campsite for campsite, match in zip(campsites, expected) if match is True
+    ]
+    assert search._filter_date_overlap(campsites=campsite_df.head(0)).empty
+
+
+def test_date_overlap_timezone_aware(available_campsite: AvailableCampsite) -> None:
+    """
+    Timezone Aware Nights Keep Their Local Day in Every Overlap Check
+    """
+    search = _StaticSearch(
+        search_window=SearchWindow(
+            start_date=date(2023, 9, 3), end_date=date(2023, 9, 4)
+        ),
+    )
+    denver = timezone("America/Denver")
+    campsites = [
+        available_campsite.copy(
+            update={
+                "campsite_id": day,
+                "booking_date": denver.localize(datetime(2023, 9, day, 23)),
+                "booking_nights": 1,
+            }
+        )
+        for day in (2, 3)
+    ]
+    campsite_df = search.campsites_to_df(campsites=campsites)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        assert search._filter_date_overlap(
+            campsites=campsite_df
+        ).campsite_id.tolist() == [3]
+        assert [
+            search._compare_date_overlap(campsite=campsite) for campsite in campsites
+        ] == [False, True]
+        search.available_campsites = campsites
+        assert search._search_matching_campsites_available() == campsites[1:]
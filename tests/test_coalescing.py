@@ -0,0 +1,103 @@
+"""
+Request Coalescing Tests
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from camply.providers import RecreationDotGov
+from camply.utils.coalescing import RequestCoalescer, request_coalescer
+
+logger = logging.getLogger(__name__)
+
+
+def test_coalescer_tick() -> None:
+    """
+    Identical Requests Share a Result Only While a Tick is Open
+    """
+    coalescer = RequestCoalescer()
+    calls: List[int] = []
+
+    def _fetch(value: int) -> List[int]:
+        calls.append(value)
+        return [value]
+
+    assert coalescer.fetch(("a",), _fetch, value=1) == [1]
+    assert coalescer.fetch(("a",), _fetch, value=1) == [1]
+    assert calls == [1, 1]
+    with coalescer.tick():
+        first = coalescer.fetch(("a",), _fetch, value=1)
+        with coalescer.tick():
+            assert coalescer.fetch(("a",), _fetch, value=1) is first
+        assert coalescer.fetch(("a",), _fetch, value=1) is first
+        coalescer.fetch(("b",), _fetch, value=2)
+    assert calls == [1, 1, 1, 2]
+    with coalescer.tick():
+        coalescer.fetch(("a",), _fetch, value=1)
+    assert calls == [1, 1, 1, 2, 1]
+    assert coalescer.coalesced == 2
+
+
+def test_coalescer_in_flight() -> None:
+    """
+    Callers Arriving While a Request is in Flight Wait for its Result
+    """
+    coalescer = RequestCoalescer()
+    started = threading.Event()
+    release = threading.Event()
+    calls: List[int] = []
+
+    def _fetch() -> int:
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return len(calls)
+
+    with coalescer.tick(), ThreadPoolExecutor(max_workers=4) as executor:
+        owner = executor.submit(coalescer.fetch, ("a",), _fetch)
+        started.wait(timeout=5)
+        waiters = [executor.submit(coalescer.fetch, ("a",), _fetch) for _ in range(3)]
+        release.set()
+        results = [owner.result()] + [waiter.result() for waiter in waiters]
+    assert results == [1, 1, 1, 1]
+    assert calls == [1]
+
+
+def test_coalescer_failure() -> None:
+    """
+    A Failed Request is Raised but Not Kept
+    """
+    coalescer = RequestCoalescer()
+    calls: List[int] = []
+
+    def _fetch() -> int:
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return len(calls)
+
+    with coalescer.tick():
+        with pytest.raises(RuntimeError):
+            coalescer.fetch(("a",), _fetch)
+        assert coalescer.fetch(("a",), _fetch) == 2
+
+
+def test_provider_coalescing(mocker) -> None:
+    """
+    Searches of the Same Campground and Month Share a Single Request
+    """
+    fetch = mocker.patch.object(
+        RecreationDotGov, "_fetch_recdotgov_data", return_value={"campsites": {}}
+    )
+    first, second = RecreationDotGov(), RecreationDotGov()
+    month = datetime(2023, 9, 1)
+    with request_coalescer.tick():
+        first.get_recdotgov_data(campground_id=232447, month=month)
+        second.get_recdotgov_data(campground_id=232447, month=month)
+        second.get_recdotgov_data(campground_id=232447, month=datetime(2023, 10, 1))
+    assert fetch.call_count == 2
@@ -0,0 +1,99 @@
+"""
+Container Tests
+"""
+
+import logging
+import pickle
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from camply.containers import AvailabilityFilter, AvailableCampsite, CampsiteRecord
+from camply.containers.data_containers import CampsiteLocation
+
+logger = logging.getLogger(__name__)
+
+
+def test_campsite_identity(available_campsite: AvailableCampsite) -> None:
+    """
+    Campsites are Equal and Hash Alike Regardless of Their Unhashable Fields
+    """
+    located = available_campsite.copy(
+        update={"location": CampsiteLocation(latitude=1.0, longitude=2.0)}
+    )
+    other = available_campsite.copy(update={"booking_date": datetime(2023, 9, 2)})
+    assert located == available_campsite
+    assert hash(located) == hash(available_campsite)
+    assert other != available_campsite
+    assert available_campsite == available_campsite.dict(
+        exclude=AvailableCampsite.__unhashable__
+    )
+    assert {available_campsite, located, other} == {available_campsite, other}
+
+
+def test_campsite_identity_reset(available_campsite: AvailableCampsite) -> None:
+    """
+    The Cached Identity Follows Assignments, Copies and Pickles
+    """
+    campsite = available_campsite.copy()
+    original_hash = hash(campsite)
+    campsite.campsite_id = 101
+    assert hash(campsite) != original_hash
+    assert campsite != available_campsite
+    campsite.campsite_id = available_campsite.campsite_id
+    assert campsite == available_campsite
+    assert hash(campsite) == original_hash
+    unpickled = pickle.loads(pickle.dumps(campsite))
+    assert unpickled == campsite
+    assert hash(unpickled) == original_hash
+
+
+def test_campsite_record(available_campsite: AvailableCampsite) -> None:
+    """
+    Records Convert to the Same Campsite Validation Would Create
+    """
+    fields = available_campsite.dict()
+    fields.update(
+        campsite_site_name=" Test Campsite Name ",
+        location={"latitude": 1.0, "longitude": 2.0},
+        permitted_equipment=[{"equipment_name": "Tent", "max_length": 0.0}],
+    )
+    record = CampsiteRecord(**fields)
+    campsite = record.to_campsite()
+    validated = AvailableCampsite(**fields)
+    assert campsite == validated
+    assert campsite.dict() == validated.dict()
+    assert campsite.location == CampsiteLocation(latitude=1.0, longitude=2.0)
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(TypeError):
+        CampsiteRecord(unknown_field=1)
+
+
+def test_availability_filter() -> None:
+    """
+    Only Searched Nights in Runs Long Enough for a Stay are Kept
+    """
+    search_days = [date(2023, 9, day) for day in (1, 2, 3, 10, 11, 20, 29, 30)]
+    nights = [(datetime(2023, 9, day), day) for day in (30, 1, 2, 3, 5, 10, 11, 20)]
+    single_night = AvailabilityFilter(search_days=search_days)
+    assert [day for _, day in single_night.filter_nights(nights=nights)] == [
+        30,
+        1,
+        2,
+        3,
+        10,
+        11,
+        20,
+    ]
+    three_nights = AvailabilityFilter(search_days=search_days, nights=3)
+    assert [day for _, day in three_nights.filter_nights(nights=nights)] == [1, 2, 3]
+    kept = three_nights.filter_nights(
+        nights=nights,
+        first_night=date(2023, 9, 1),
+        last_night=date(2023, 9, 30),
+    )
+    assert [day for _, day in kept] == [1, 2, 3, 30]
+    assert three_nights.includes(datetime(2023, 9, 29)) is True
+    assert three_nights.includes(date(2023, 9, 28)) is False
+    assert AvailabilityFilter(search_days=search_days, nights=0).nights == 1
+    assert date(2023, 9, 1) + timedelta(days=1) in three_nights.search_days
@@ -0,0 +1,122 @@
+"""
+Disk Cache Tests
+"""
+
+import logging
+import pathlib
+from datetime import timedelta
+
+from freezegun import freeze_time
+
+from camply.containers.api_responses import RecDotGovCampsite
+from camply.providers import RecreationDotGov
+from camply.utils.disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+
+def test_disk_cache_roundtrip(tmp_path: pathlib.Path) -> None:
+    """
+    Entries are Read Back, Expire, and Respect the Cache Version
+    """
+    cache = DiskCache(directory=tmp_path, version=1, ttl=timedelta(hours=1))
+    assert cache.get(key="123") is None
+    cache.set(key="123", data=[{"a": 1}], etag='"abc"')
+    entry = cache.get(key="123")
+    assert entry.data == [{"a": 1}]
+    assert entry.etag == '"abc"'
+    assert cache.is_fresh(entry=entry) is True
+    with freeze_time(entry.fetched_at + timedelta(hours=2)):
+        assert cache.is_fresh(entry=entry) is False
+        touched = cache.touch(entry=entry)
+    assert touched.data == entry.data
+    assert cache.get(key="123").fetched_at == touched.fetched_at
+    new_version = DiskCache(directory=tmp_path, version=2, ttl=timedelta(hours=1))
+    assert new_version.get(key="123") is None
+    cache.get_path(key="456").write_text("not json")
+    assert cache.get(key="456") is None
+
+
+def test_recdotgov_metadata_cache(mocker) -> None:
+    """
+    Fresh Metadata Comes From Disk, Stale Metadata is Revalidated
+    """
+    provider = RecreationDotGov()
+    campsite = RecDotGovCampsite(
+        accessible=True,
+        asset_id=1,
+        attributes=[],
+        campsite_id=2,
+        campsite_reserve_type="Site-Specific",
+        fee_templates={},
+        loop="A",
+        name="001",
+        org_id=3,
+        org_name="NPS",
+        parent_asset_id=4,
+        parent_asset_name="Campground",
+        parent_asset_type="Campground",
+        permitted_equipment=[],
+        reservable=True,
+        type="STANDARD NONELECTRIC",
+        type_of_use="Overnight",
+    )
+    paginate = mocker.patch.object(
+        provider,
+        "_paginate_recdotgov_campsites",
+        return_value=([campsite], {"etag": '"v1"', "last_modified": None}),
+    )
+    assert provider.get_internal_campsites(facility_ids=[1]) == [campsite]
+    assert provider.get_internal_campsites(facility_ids=[1]) == [campsite]
+    assert paginate.call_count == 1
+    entry = provider.metadata_cache.get(key="1")
+    paginate.return_value = (None, {"etag": '"v1"', "last_modified": None})
+    with freeze_time(entry.fetched_at + timedelta(days=2)):
+        assert provider.get_internal_campsites(facility_ids=[1]) == [campsite]
+    paginate.assert_called_with(
+        facility_id=1,
+        validators={"etag": '"v1"', "last_modified": None},
+        workers=1,
+    )
+    assert provider.metadata_cache.get(key="1").fetched_at > entry.fetched_at
+
+
+def test_recdotgov_metadata_workers_split(mocker) -> None:
+    """
+    Facilities and Their Pages Share the Workers Instead of Multiplying Them
+    """
+    provider = RecreationDotGov()
+    paginate = mocker.patch.object(
+        provider,
+        "_paginate_recdotgov_campsites",
+        return_value=([], {"etag": None, "last_modified": None}),
+    )
+    provider.get_internal_campsites(facility_ids=[1], workers=16)
+    assert paginate.call_args.kwargs["workers"] == 16
+    paginate.reset_mock()
+    provider.get_internal_campsites(facility_ids=list(range(2, 6)), workers=16)
+    assert {call.kwargs["workers"] for call in paginate.call_args_list} == {4}
+    paginate.reset_mock()
+    provider.get_internal_campsites(facility_ids=list(range(6, 26)), workers=16)
+    assert {call.kwargs["workers"] for call in paginate.call_args_list} == {1}
+
+
+def test_recdotgov_metadata_cache_unwritable(mocker) -> None:
+    """
+    Revalidated Metadata is Still Returned When the Cache Can't be Written
+    """
+    provider = RecreationDotGov()
+    provider.metadata_cache.set(key="1", data=[], etag='"v1"')
+    entry = provider.metadata_cache.get(key="1")
+    mocker.patch.object(
+        provider,
+        "_paginate_recdotgov_campsites",
+        return_value=(None, {"etag": '"v1"', "last_modified": None}),
+    )
+    mocker.patch(
+        "camply.utils.disk_cache.tempfile.mkstemp",
+        side_effect=PermissionError("Read-only file system"),
+    )
+    with freeze_time(entry.fetched_at + timedelta(days=2)):
+        assert provider.get_internal_campsites(facility_ids=[1]) == []
+    assert provider.metadata_cache.get(key="1").fetched_at == entry.fetched_at
@@ -0,0 +1,123 @@
+"""
+JSON Decoding Tests
+"""
+
+import json
+import logging
+import pathlib
+from typing import Any, List
+
+import pytest
+import yaml
+from pydantic import ValidationError
+
+from camply.containers.api_responses import CampsiteAvailabilityResponse
+from camply.containers.usedirect import UseDirectAvailabilityResponse
+from camply.exceptions import CamplyError
+from camply.utils.json_decoding import get_json_decoder, json_decoders, loads
+
+logger = logging.getLogger(__name__)
+
+tests_dir = pathlib.Path(__file__).parent
+recdotgov_cassette = tests_dir.joinpath(
+    "cli", "cassettes", "test_search_by_another_yaml.yaml"
+)
+usedirect_cassette = tests_dir.joinpath(
+    "cli", "usedirect", "cassettes", "test_alabama_state_parks_campsites.yaml"
+)
+
+
+def get_cassette_payloads(cassette: pathlib.Path, uri_part: str) -> List[str]:
+    """
+    Get the Recorded Response Bodies of Matching Requests
+
+    Parameters
+    ----------
+    cassette: pathlib.Path
+    uri_part: str
+        Part of the request URI to match
+
+    Returns
+    -------
+    List[str]
+    """
+    with open(cassette) as file_stream:
+        recording = yaml.load(file_stream, Loader=yaml.SafeLoader)
+    return [
+        interaction["response"]["body"]["string"]
+        for interaction in recording["interactions"]
+        if uri_part in interaction["request"]["uri"]
+    ]
+
+
+@pytest.mark.parametrize("decoder", list(json_decoders))
+def test_json_decoders(decoder: str) -> None:
+    """
+    Every Installed Decoder Decodes Payloads Alike
+    """
+    (content,) = get_cassette_payloads(
+        cassette=recdotgov_cassette, uri_part="availability/campground"
+    )[:1]
+    assert get_json_decoder(decoder)(content.encode()) == json.loads(content)
+    with pytest.raises(ValueError):
+        get_json_decoder(decoder)(b'{"campsites": ')
+
+
+def test_json_loads() -> None:
+    """
+    Payloads Fast Decoders Reject Fall Back to the Standard Library
+    """
+    assert loads(b'{"value": 1}') == {"value": 1}
+    assert loads(str(2**70)) == 2**70
+    with pytest.raises(ValueError):
+        loads(b"{")
+    with pytest.raises(CamplyError):
+        get_json_decoder("simplejson")
+
+
+@pytest.mark.parametrize(
+    "response_class, cassette, uri_part",
+    [
+        (
+            CampsiteAvailabilityResponse,
+            recdotgov_cassette,
+            "availability/campground",
+        ),
+        (UseDirectAvailabilityResponse, usedirect_cassette, "rdr/search/grid"),
+    ],
+)
+def test_from_payload(response_class: Any, cassette: pathlib.Path, uri_part: str):
+    """
+    Recorded Payloads Decode the Same Without Validation
+    """
+    payloads = get_cassette_payloads(cassette=cassette, uri_part=uri_part)
+    assert len(payloads) > 0
+    for content in payloads:
+        payload = loads(content)
+        validated = response_class(**payload)
+        constructed = response_class._construct_payload(payload=payload)
+        assert constructed.dict() == validated.dict()
+        assert constructed.__fields_set__ == validated.__fields_set__
+        assert response_class.from_payload(payload) == validated
+
+
+def test_from_payload_validates() -> None:
+    """
+    Values That Need Converting are Validated
+    """
+    payload = {
+        "campsites": {
+            "100": {
+                "availabilities": {"2023-09-01T00:00:00Z": " Available "},
+                "max_num_people": "6",
+                "site": " 001 ",
+            }
+        }
+    }
+    response = CampsiteAvailabilityResponse.from_payload(payload)
+    assert response == CampsiteAvailabilityResponse(**payload)
+    assert response.campsites[100].max_num_people == 6
+    assert response.campsites[100].site == "001"
+    payload["campsites"]["100"]["max_num_people"] = None
+    with pytest.raises(ValidationError):
+        CampsiteAvailabilityResponse.from_payload(payload)
@@ -0,0 +1,207 @@
+"""
+Offline Store Tests
+"""
+
+import logging
+import pathlib
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import List
+
+import pytest
+
+from camply.containers import AvailableCampsite, SearchWindow
+from camply.exceptions import CamplyError
+from camply.utils.offline_store import (
+    JsonCampsiteStore,
+    JsonLinesCampsiteStore,
+    SqliteCampsiteStore,
+    get_campsite_key,
+    get_offline_store,
+)
+from tests.test_base_search import _StaticSearch
+
+logger = logging.getLogger(__name__)
+
+
+def _campsites(
+    available_campsite: AvailableCampsite, campsite_ids: List[int]
+) -> List[AvailableCampsite]:
+    """
+    Copy a Campsite Across Campsite IDs
+    """
+    return [
+        available_campsite.copy(update={"campsite_id": campsite_id})
+        for campsite_id in campsite_ids
+    ]
+
+
+def test_campsite_key(available_campsite: AvailableCampsite) -> None:
+    """
+    Campsites Share a Key Exactly When They are Equal
+    """
+    same = available_campsite.copy(update={"permitted_equipment": None})
+    other = available_campsite.copy(update={"booking_date": datetime(2023, 9, 2)})
+    assert get_campsite_key(same) == get_campsite_key(available_campsite)
+    assert get_campsite_key(other) != get_campsite_key(available_campsite)
+
+
+def test_jsonlines_store_append(
+    tmp_path: pathlib.Path, available_campsite: AvailableCampsite
+) -> None:
+    """
+    Only New Campsites are Appended and Keys are Read Without Parsing
+    """
+    path = tmp_path.joinpath("campsites.jsonl")
+    store = get_offline_store(path=path)
+    assert isinstance(store, JsonLinesCampsiteStore)
+    store.save(campsites=set(_campsites(available_campsite, [1, 2])))
+    store.save(campsites=set(_campsites(available_campsite, [1, 2, 3])))
+    assert len(path.read_text().splitlines()) == 3
+    loaded_store = JsonLinesCampsiteStore(path=path)
+    assert loaded_store.load_keys() == {
+        get_campsite_key(campsite)
+        for campsite in _campsites(available_campsite, [1, 2, 3])
+    }
+    assert JsonLinesCampsiteStore(path=path).load() == set(
+        _campsites(available_campsite, [1, 2, 3])
+    )
+    loaded_store.save(campsites=set(_campsites(available_campsite, [3])))
+    assert len(path.read_text().splitlines()) == 3
+
+
+def test_jsonlines_store_compaction(
+    tmp_path: pathlib.Path, available_campsite: AvailableCampsite
+) -> None:
+    """
+    Repeated and Cut Off Lines are Compacted Away
+    """
+    path = tmp_path.joinpath("campsites.jsonl")
+    for _ in range(2):
+        JsonLinesCampsiteStore(path=path).save(
+            campsites=set(_campsites(available_campsite, [1, 2]))
+        )
+    with open(path, mode="a") as file_stream:
+        file_stream.write('{"key": "abc", "campsite": {"campsite_id"')
+    assert len(path.read_text().splitlines()) == 5
+    store = JsonLinesCampsiteStore(path=path)
+    assert len(store.load_keys()) == 2
+    assert len(path.read_text().splitlines()) == 2
+    store.save(campsites=set(_campsites(available_campsite, [3])))
+    assert JsonLinesCampsiteStore(path=path).load() == set(
+        _campsites(available_campsite, [1, 2, 3])
+    )
+
+
+def test_offline_search_jsonlines(
+    tmp_path: pathlib.Path, available_campsite: AvailableCampsite
+) -> None:
+    """
+    Searches Skip the Campsites a Previous Search Saved
+    """
+    path = tmp_path.joinpath("campsites.jsonl")
+    search_window = SearchWindow(
+        start_date=date(2023, 9, 1), end_date=date(2023, 9, 30)
+    )
+    campsites = _campsites(available_campsite, [1, 2])
+    first = _StaticSearch(search_window=search_window, offline_search_path=str(path))
+    first.available_campsites = campsites
+    assert set(first.get_matching_campsites()) == set(campsites)
+    second = _StaticSearch(search_window=search_window, offline_search_path=str(path))
+    second.available_campsites = campsites
+    assert second.offline_mode == "jsonl"
+    assert len(second.campsites_found) == 0
+    assert len(second.offline_store.keys) == 2
+    assert second._all_campsites_loaded(campsites=campsites) is True
+    new_campsite = available_campsite.copy(
+        update={"booking_date": available_campsite.booking_date + timedelta(days=1)}
+    )
+    assert second._get_new_campsites(campsites=[*campsites, new_campsite]) == {
+        new_campsite
+    }
+
+
+def test_sqlite_store(
+    tmp_path: pathlib.Path, available_campsite: AvailableCampsite
+) -> None:
+    """
+    Campsites are Looked Up by Key and Notifications are Kept
+    """
+    path = tmp_path.joinpath("campsites.sqlite")
+    store = get_offline_store(path=path)
+    assert isinstance(store, SqliteCampsiteStore)
+    assert store.initialize() == 0
+    store.save(campsites=set(_campsites(available_campsite, [1, 2])))
+    store.save(campsites=set(_campsites(available_campsite, [1, 2, 3])))
+    keys = [
+        get_campsite_key(campsite)
+        for campsite in _campsites(available_campsite, [1, 2, 3, 4])
+    ]
+    shared_store = SqliteCampsiteStore(path=path)
+    assert shared_store.initialize() == 3
+    assert shared_store.find_keys(keys=keys) == set(keys[:3])
+    assert shared_store.load() == set(_campsites(available_campsite, [1, 2, 3]))
+    store.record_notifications(campsites=_campsites(available_campsite, [1]))
+    store.record_notifications(campsites=_campsites(available_campsite, [1]))
+    history = shared_store.get_notification_history(
+        campsite=_campsites(available_campsite, [1])[0]
+    )
+    assert len(history) == 2
+    with sqlite3.connect(path) as connection:
+        (journal_mode,) = connection.execute("PRAGMA journal_mode").fetchone()
+    assert journal_mode == "wal"
+
+
+def test_sqlite_store_shared(
+    tmp_path: pathlib.Path, available_campsite: AvailableCampsite
+) -> None:
+    """
+    Searches Sharing a Database Save Each Campsite Once
+    """
+    path = tmp_path.joinpath("campsites.db")
+    campsites = _campsites(available_campsite, list(range(50)))
+
+    def _save(offset: int) -> None:
+        store = SqliteCampsiteStore(path=path)
+        for index in range(offset, len(campsites), 5):
+            store.save(campsites={campsites[index], campsites[index - offset]})
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        list(executor.map(_save, range(5)))
+    assert SqliteCampsiteStore(path=path).initialize() == 50
+
+
+def test_offline_search_sqlite(
+    tmp_path: pathlib.Path, available_campsite: AvailableCampsite
+) -> None:
+    """
+    Searches Sharing a Database Don't Report Each Other's Campsites
+    """
+    path = tmp_path.joinpath("campsites.sqlite")
+    search_window = SearchWindow(
+        start_date=date(2023, 9, 1), end_date=date(2023, 9, 30)
+    )
+    campsites = _campsites(available_campsite, [1, 2])
+    first, second = (
+        _StaticSearch(search_window=search_window, offline_search_path=str(path))
+        for _ in range(2)
+    )
+    first.available_campsites = campsites
+    assert second._get_new_campsites(campsites=campsites) == set(campsites)
+    first.get_matching_campsites()
+    assert second.offline_mode == "sqlite"
+    assert second._get_new_campsites(campsites=campsites) == set()
+    assert second._all_campsites_loaded(campsites=campsites) is True
+
+
+def test_get_offline_store(tmp_path: pathlib.Path) -> None:
+    """
+    Stores are Picked by File Extension
+    """
+    assert isinstance(
+        get_offline_store(path=tmp_path.joinpath("campsites.json")),
+        JsonCampsiteStore,
+    )
+    with pytest.raises(CamplyError):
+        get_offline_store(path=tmp_path.joinpath("campsites.csv"))
@@ -0,0 +1,175 @@
+"""
+PollingScheduler Tests
+"""
+
+import logging
+from datetime import date, datetime
+from typing import List
+
+import pytest
+from freezegun import freeze_time
+from pytz import timezone
+
+from camply.config import SearchConfig
+from camply.containers import AvailableCampsite, SearchWindow
+from camply.search.polling_scheduler import PollingScheduler
+from tests.test_search_daemon import _ScriptedSearch
+
+logger = logging.getLogger(__name__)
+
+NOW = timezone("UTC").localize(datetime(2023, 8, 1, 12))
+
+
+def _campsites(
+    available_campsite: AvailableCampsite, facility_id: int, campsite_ids: List[int]
+) -> List[AvailableCampsite]:
+    """
+    Copy a Campsite Across Campsite IDs of a Campground
+    """
+    return [
+        available_campsite.copy(
+            update={"facility_id": facility_id, "campsite_id": campsite_id}
+        )
+        for campsite_id in campsite_ids
+    ]
+
+
+def test_polling_scheduler_change_rate(available_campsite: AvailableCampsite) -> None:
+    """
+    Searches with a Changing Campground are Polled More Often than Dead Ones
+    """
+    scheduler = PollingScheduler()
+    for key in ["hot", "dead"]:
+        scheduler.register(
+            key=key,
+            base_interval=600,
+            requests_per_poll=1,
+            stay_start=date(2023, 9, 1),
+        )
+    assert scheduler.get_interval(key="hot", now=NOW) == 600
+    for poll in range(10):
+        scheduler.record_poll(
+            key="hot",
+            campsites=_campsites(available_campsite, 1, [poll])
+            + _campsites(available_campsite, 2, [100]),
+        )
+        scheduler.record_poll(
+            key="dead", campsites=_campsites(available_campsite, 1, [100])
+        )
+    assert scheduler.states["hot"].change_rates[2] == 0
+    assert scheduler.states["hot"].hotness > 0.9
+    assert scheduler.get_interval(key="hot", now=NOW) == pytest.approx(
+        600 * (1 - SearchConfig.POLLING_HOT_SPEEDUP * scheduler.states["hot"].hotness)
+    )
+    assert scheduler.get_interval(key="dead", now=NOW) == (
+        600 * SearchConfig.POLLING_BACKOFF_MAXIMUM
+    )
+
+
+def test_polling_scheduler_stay_proximity() -> None:
+    """
+    Stays Close to Today are Polled More Often, Within the Minimum Interval
+    """
+    scheduler = PollingScheduler()
+    for key, stay_start in [("soon", date(2023, 8, 10)), ("later", date(2024, 6, 1))]:
+        scheduler.register(
+            key=key, base_interval=1200, requests_per_poll=1, stay_start=stay_start
+        )
+    scheduler.register(
+        key="tomorrow", base_interval=300, requests_per_poll=1, stay_start=NOW.date()
+    )
+    assert scheduler.get_interval(key="soon", now=NOW) == 900
+    assert scheduler.get_interval(key="later", now=NOW) == 1800
+    assert scheduler.get_interval(key="tomorrow", now=NOW) == (
+        SearchConfig.POLLING_INTERVAL_MINIMUM * 60
+    )
+
+
+def test_polling_scheduler_release_times() -> None:
+    """
+    Polls are Moved to Just After a Known Inventory Release
+    """
+    scheduler = PollingScheduler()
+    scheduler.register(
+        key="release",
+        base_interval=1200,
+        requests_per_poll=1,
+        stay_start=date(2023, 9, 1),
+        release_times=("10:00",),
+        release_timezone="America/New_York",
+    )
+    before_release = timezone("America/New_York").localize(datetime(2023, 8, 1, 9, 50))
+    assert scheduler.get_interval(key="release", now=before_release) == (
+        600 + SearchConfig.POLLING_RELEASE_DELAY
+    )
+    after_release = timezone("America/New_York").localize(datetime(2023, 8, 1, 10, 5))
+    assert scheduler.get_interval(key="release", now=after_release) == 1200
+
+
+def test_polling_scheduler_budget() -> None:
+    """
+    Searches are Stretched Evenly to Stay Within the Hourly Budget
+    """
+    scheduler = PollingScheduler(requests_per_hour=80)
+    scheduler.register(
+        key="big", base_interval=600, requests_per_poll=30, stay_start=None
+    )
+    scheduler.register(
+        key="small", base_interval=600, requests_per_poll=10, stay_start=None
+    )
+    big, small = (scheduler.get_interval(key=key, now=NOW) for key in ["big", "small"])
+    assert big == small == 1800
+    assert 30 * 3600 / big + 10 * 3600 / small == pytest.approx(80)
+    scheduler.unregister(key="big")
+    assert scheduler.get_interval(key="small", now=NOW) == 600
+    with pytest.raises(ValueError):
+        PollingScheduler(requests_per_hour=0)
+
+
+def test_continuous_search_polling(
+    mocker, available_campsite: AvailableCampsite
+) -> None:
+    """
+    Continuous Searches Wait Between Polls as Long as the Scheduler Says
+    """
+    get_interval = mocker.patch.object(PollingScheduler, "get_interval", return_value=0)
+    search = _ScriptedSearch(
+        polls=[[], [], [available_campsite]],
+        search_window=SearchWindow(
+            start_date=date(2023, 9, 1), end_date=date(2023, 9, 30)
+        ),
+    )
+    campsites = search.get_matching_campsites(
+        continuous=True, polling_interval=5, requests_per_hour=100
+    )
+    assert campsites == [available_campsite]
+    assert get_interval.call_count == 2
+    assert search.poll_scheduler.requests_per_hour == 100
+    assert search.poll_scheduler.states[search].polls == 3
+
+
+def test_continuous_search_polling_passed_nights(
+    available_campsite: AvailableCampsite,
+) -> None:
+    """
+    Nights and Months That Have Passed Stop Counting Towards the Schedule
+    """
+    with freeze_time(datetime(2023, 8, 1, 12)):
+        search = _ScriptedSearch(
+            polls=[[available_campsite]],
+            search_window=[
+                SearchWindow(start_date=date(2023, 8, 2), end_date=date(2023, 8, 4)),
+                SearchWindow(start_date=date(2023, 10, 1), end_date=date(2023, 10, 3)),
+            ],
+        )
+        search.schedule_polling(polling_interval=10)
+        state = search.poll_scheduler.states[search]
+        assert state.stay_start == date(2023, 8, 2)
+        assert state.requests_per_poll == 2
+    with freeze_time(datetime(2023, 9, 10, 12)):
+        search._search_matching_campsites_available()
+        assert state.stay_start == date(2023, 10, 1)
+        assert state.requests_per_poll == 1
+        assert search.poll_scheduler.get_interval(key=search) == (
+            600 * SearchConfig.POLLING_BACKOFF_RATE
+        )
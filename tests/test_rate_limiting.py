@@ -0,0 +1,102 @@
+"""
+Rate Limiting Tests
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from camply.utils.rate_limiting import RateLimiter, TokenBucket, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+
+def test_token_bucket_burst() -> None:
+    """
+    A Full Bucket Hands Out its Burst Without Waiting, then Paces Requests
+    """
+    bucket = TokenBucket(rate=10, burst=3)
+    delays = [bucket.reserve() for _ in range(5)]
+    assert delays[:3] == [0, 0, 0]
+    assert delays[3] == pytest.approx(0.1, abs=0.02)
+    assert delays[4] == pytest.approx(0.2, abs=0.02)
+
+
+def test_token_bucket_threads() -> None:
+    """
+    Threads Sharing a Bucket Never Exceed its Budget
+    """
+    bucket = TokenBucket(rate=50, burst=5)
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: bucket.acquire(), range(30)))
+    elapsed = time.monotonic() - start
+    assert elapsed >= (30 - 5) / 50 * 0.9
+
+
+def test_token_bucket_async() -> None:
+    """
+    Asyncio Tasks Share a Bucket Without Blocking the Event Loop
+    """
+    bucket = TokenBucket(rate=50, burst=2)
+
+    async def _acquire_all() -> float:
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(12)))
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(_acquire_all())
+    assert elapsed >= (12 - 2) / 50 * 0.9
+
+
+def test_token_bucket_pause() -> None:
+    """
+    Pausing a Bucket Delays Every Request Until the Pause Ends
+    """
+    bucket = TokenBucket(rate=100, burst=10)
+    bucket.pause(seconds=0.5)
+    assert bucket.reserve() == pytest.approx(0.51, abs=0.02)
+
+
+def test_rate_limiter_per_host() -> None:
+    """
+    Requests to the Same Host Share a Bucket, Other Hosts Get Their Own
+    """
+    limiter = RateLimiter()
+    bucket = limiter.get_bucket(url="https://www.recreation.gov/api", rate=3, burst=3)
+    same = limiter.get_bucket(url="https://WWW.recreation.gov/other", rate=1, burst=1)
+    other = limiter.get_bucket(url="https://ridb.recreation.gov/api", rate=1, burst=1)
+    assert bucket is same
+    assert bucket is not other
+    assert same.rate == 3
+
+
+def test_rate_limiter_feedback() -> None:
+    """
+    429 Responses Pause the Host, Ordinary Errors Don't
+    """
+    limiter = RateLimiter()
+    url = "https://www.recreation.gov/api"
+    bucket = limiter.get_bucket(url=url, rate=100, burst=10)
+    kwargs = {"url": url, "backoff": 5, "maximum_backoff": 2}
+    assert limiter.feedback(status_code=500, retry_after="1", **kwargs) is None
+    assert limiter.feedback(status_code=503, retry_after=None, **kwargs) is None
+    assert limiter.feedback(status_code=429, retry_after="1", **kwargs) == 1
+    assert limiter.feedback(status_code=429, retry_after=None, **kwargs) == 2
+    assert bucket.reserve() > 1.5
+
+
+def test_parse_retry_after() -> None:
+    """
+    Retry-After Headers can be Seconds or HTTP Dates
+    """
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after("Fri, 28 Apr 2023 11:00:00 GMT") == 0
+    assert parse_retry_after("Fri, 28 Apr 2023 12:01:00 GMT") == pytest.approx(
+        60, abs=5
+    )
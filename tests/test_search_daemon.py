@@ -0,0 +1,188 @@
+"""
+SearchDaemon Tests
+"""
+
+import logging
+import pathlib
+from datetime import date
+from typing import List, Optional
+
+from camply.containers import AvailableCampsite, SearchWindow
+from camply.search import search_daemon
+from camply.search.polling_scheduler import PollingScheduler
+from camply.search.search_daemon import DaemonSearch, SearchDaemon
+from tests.test_base_search import _StaticSearch
+
+logger = logging.getLogger(__name__)
+
+
+class _FakeClock:
+    """
+    Monotonic Clock that Only Moves When Slept
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class _ScriptedSearch(_StaticSearch):
+    """
+    Search Returning a Different List of Campsites Every Poll
+    """
+
+    def __init__(self, polls: List[List[AvailableCampsite]], **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.polls = polls
+
+    def get_all_campsites(self) -> List[AvailableCampsite]:
+        return self.polls.pop(0) if self.polls else []
+
+
+def _base_interval(
+    scheduler: PollingScheduler, key: object, now: object = None
+) -> float:
+    """
+    Poll Every Search on its Configured Interval
+    """
+    return scheduler.states[key].base_interval
+
+
+class _LimitedDaemonSearch(DaemonSearch):
+    """
+    Search Recording When it's Polled, Stopping After a Number of Polls
+    """
+
+    def __init__(self, clock: _FakeClock, max_polls: int, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.clock = clock
+        self.max_polls = max_polls
+        self.polled_at: List[float] = []
+
+    def poll(self) -> List[AvailableCampsite]:
+        self.polled_at.append(self.clock.now)
+        new_campsites = super().poll()
+        if len(self.polled_at) >= self.max_polls:
+            self.finished = True
+        return new_campsites
+
+
+def _daemon_search(
+    name: str,
+    polls: List[List[AvailableCampsite]],
+    clock: Optional[_FakeClock] = None,
+    max_polls: int = 10,
+    **search_kwargs,
+) -> DaemonSearch:
+    """
+    Build a Search Over September 2023
+    """
+    return _LimitedDaemonSearch(
+        clock=clock or _FakeClock(),
+        max_polls=max_polls,
+        name=name,
+        camping_finder=_ScriptedSearch(
+            polls=polls,
+            search_window=SearchWindow(
+                start_date=date(2023, 9, 1), end_date=date(2023, 9, 30)
+            ),
+        ),
+        search_kwargs={"polling_interval": 5, **search_kwargs},
+    )
+
+
+def test_search_daemon_schedule(mocker, available_campsite: AvailableCampsite) -> None:
+    """
+    Searches are Polled on their Own Intervals Until They Finish
+    """
+    clock = _FakeClock()
+    mocker.patch.object(search_daemon, "monotonic", clock.monotonic)
+    mocker.patch.object(search_daemon, "sleep", clock.sleep)
+    mocker.patch.object(PollingScheduler, "get_interval", _base_interval)
+    other_campsite = available_campsite.copy(update={"campsite_id": 101})
+    continuous = _daemon_search(
+        name="continuous.yaml", polls=[[], [], [available_campsite]], clock=clock
+    )
+    forever = _daemon_search(
+        name="forever.yaml",
+        polls=[[available_campsite], [available_campsite], [other_campsite]],
+        clock=clock,
+        max_polls=3,
+        polling_interval=10,
+        search_forever=True,
+    )
+    once = _daemon_search(name="once.yaml", polls=[[]], clock=clock, search_once=True)
+    SearchDaemon(searches=[continuous, forever, once]).run()
+    assert continuous.polled_at == [0, 300, 600]
+    assert forever.polled_at == [0, 600, 1200]
+    assert once.polled_at == [0]
+    assert continuous.camping_finder.campsites_found == {available_campsite}
+    assert forever.camping_finder.campsites_found == {
+        available_campsite,
+        other_campsite,
+    }
+    assert forever.continuous_search_attempts == 4
+
+
+def test_search_daemon_failure(mocker, available_campsite: AvailableCampsite) -> None:
+    """
+    A Failing Search is Stopped Without Stopping the Others
+    """
+    clock = _FakeClock()
+    mocker.patch.object(search_daemon, "monotonic", clock.monotonic)
+    mocker.patch.object(search_daemon, "sleep", clock.sleep)
+    mocker.patch.object(PollingScheduler, "get_interval", _base_interval)
+    failing = _daemon_search(name="failing.yaml", polls=[], clock=clock)
+    mocker.patch.object(
+        failing.camping_finder, "get_all_campsites", side_effect=RuntimeError("boom")
+    )
+    working = _daemon_search(
+        name="working.yaml", polls=[[], [available_campsite]], clock=clock
+    )
+    SearchDaemon(searches=[failing, working], workers=2).run()
+    assert failing.finished is True
+    assert working.camping_finder.campsites_found == {available_campsite}
+    assert clock.sleeps == [300]
+
+
+def test_search_daemon_from_directory(mocker, tmp_path: pathlib.Path, caplog) -> None:
+    """
+    YAML Searches of the Same Provider Share a Single Provider Instance
+    """
+    mocker.patch.dict(
+        search_daemon.CAMPSITE_SEARCH_PROVIDER, {"RecreationDotGov": _StaticSearch}
+    )
+    for name in ["first.yaml", "second.yml"]:
+        (tmp_path / name).write_text(
+            "provider: RecreationDotGov\n"
+            "recreation_area: 2907\n"
+            "start_date: 2023-09-10\n"
+            "end_date: 2023-09-11\n"
+            "search_forever: true\n"
+            "polling_interval: 7\n"
+            + ("requests_per_hour: 60\n" if name == "second.yml" else "")
+        )
+    (tmp_path / "notes.txt").write_text("not a search")
+    daemon = SearchDaemon.from_directory(directory=tmp_path)
+    first, second = daemon.searches
+    assert [first.name, second.name] == ["first.yaml", "second.yml"]
+    assert first.camping_finder is not second.camping_finder
+    assert first.camping_finder.campsite_finder is second.camping_finder.campsite_finder
+    assert first.camping_finder.notifier is not second.camping_finder.notifier
+    assert daemon.poll_scheduler.states[first.camping_finder].base_interval == 7 * 60
+    assert first.search_forever is True
+    assert [
+        record.message
+        for record in caplog.records
+        if "requests_per_hour is ignored" in record.message
+    ] == [
+        "second.yml: requests_per_hour is ignored when searches run together, "
+        "set --requests-per-hour or POLLING_REQUESTS_PER_HOUR instead"
+    ]